@@ -0,0 +1,230 @@
+import argparse
+import json
+import sys
+from array import array
+
+from magister import default_verbs_path, get_verbs
+from matcher import fold_latin
+from verb_store import VerbStore
+
+# Facets of an analysis (see Analyser.analyse())
+ANALYSIS_FACETS = ["lemma", "mood", "voice", "tense", "person", "translation", "gender"]
+
+
+class DAWG:
+    """Minimal acyclic automaton (DAWG) over a sorted list of words, with the number of words below each state,
+    so that a word is mapped to its rank in the list (a perfect hash) and a prefix to a range of ranks
+
+    The common endings of the words (-bamus, -uerunt...) are shared, and the automaton is frozen into flat
+    arrays: the edges of a state are edge_chars[first[state]:first[state + 1]] (sorted) and the matching targets.
+    The ~10k Latin forms fit in a few hundred states.
+    """
+
+    def __init__(self, words: list[str]):
+        words = sorted(words)
+        # Incremental construction of the minimal automaton from sorted words (Daciuk et al., 2000):
+        # a state is [final, {char: state}], and the states of the previous word are minimised once its suffix is over
+        root = [False, {}]
+        register = {}
+        unchecked = []  # (parent, char, child) along the last word
+        previous = ""
+
+        def minimise(down_to):
+            while len(unchecked) > down_to:
+                parent, char, child = unchecked.pop()
+                signature = (child[0], tuple((c, id(state)) for c, state in sorted(child[1].items())))
+                if signature in register:
+                    parent[1][char] = register[signature]
+                else:
+                    register[signature] = child
+
+        for word in words:
+            if word == previous:
+                continue
+            common = 0
+            while common < min(len(word), len(previous)) and word[common] == previous[common]:
+                common += 1
+            minimise(common)
+            state = unchecked[-1][2] if unchecked else root
+            for char in word[common:]:
+                child = [False, {}]
+                state[1][char] = child
+                unchecked.append((state, char, child))
+                state = child
+            state[0] = True
+            previous = word
+        minimise(0)
+
+        # Freeze: states numbered in breadth-first order from the root (0)
+        numbers = {id(root): 0}
+        states = [root]
+        for state in states:
+            for _, child in sorted(state[1].items()):
+                if id(child) not in numbers:
+                    numbers[id(child)] = len(states)
+                    states.append(child)
+        self.final = bytes(state[0] for state in states)
+        self.first = array("I", [0])
+        self.targets = array("I")
+        chars = []
+        for state in states:
+            for char, child in sorted(state[1].items()):
+                chars.append(char)
+                self.targets.append(numbers[id(child)])
+            self.first.append(len(chars))
+        self.edge_chars = "".join(chars)
+        # Number of words below each state (children first: reverse breadth-first order isn't enough in a DAG)
+        self.counts = array("I", [0]) * len(states)
+        for number in self.topological_order()[::-1]:
+            self.counts[number] = self.final[number] + sum(
+                self.counts[target] for target in self.targets[self.first[number] : self.first[number + 1]]
+            )
+        # (state, char) -> (target, number of words skipped by taking this edge): a walk is a dict lookup per char
+        self.transitions = {}
+        for number in range(len(states)):
+            skipped = self.final[number]
+            for edge in range(self.first[number], self.first[number + 1]):
+                target = self.targets[edge]
+                self.transitions[number, self.edge_chars[edge]] = (target, skipped)
+                skipped += self.counts[target]
+
+    def topological_order(self) -> list[int]:
+        order, seen = [], set()
+        pending = [(0, False)]
+        while pending:
+            number, expanded = pending.pop()
+            if expanded:
+                order.append(number)
+                continue
+            if number in seen:
+                continue
+            seen.add(number)
+            pending.append((number, True))
+            for target in self.targets[self.first[number] : self.first[number + 1]]:
+                if target not in seen:
+                    pending.append((target, False))
+        return order[::-1]
+
+    def __len__(self):
+        return self.counts[0]
+
+    def walk(self, word: str) -> tuple[int, int] | None:
+        """(state reached by word, number of words before those starting with word), None if no word starts with it"""
+        state, rank = 0, 0
+        transitions = self.transitions
+        for char in word:
+            transition = transitions.get((state, char))
+            if transition is None:
+                return None
+            state, skipped = transition
+            rank += skipped
+        return state, rank
+
+    def index(self, word: str) -> int | None:
+        """Rank of a word in the sorted list (None if it is not in the list)"""
+        walked = self.walk(word)
+        if walked is None or not self.final[walked[0]]:
+            return None
+        return walked[1]
+
+    def prefix_range(self, prefix: str) -> range:
+        """Ranks of the words starting with prefix"""
+        walked = self.walk(prefix)
+        if walked is None:
+            return range(0)
+        state, rank = walked
+        return range(rank, rank + self.counts[state])
+
+    def words(self, prefix: str = "", limit: int | None = None) -> list[str]:
+        """Words starting with prefix, in alphabetical order"""
+        walked = self.walk(prefix)
+        if walked is None:
+            return []
+        results = []
+        pending = [(walked[0], prefix)]
+        while pending and (limit is None or len(results) < limit):
+            state, word = pending.pop()
+            if self.final[state]:
+                results.append(word)
+            edges = range(self.first[state], self.first[state + 1])
+            pending.extend((self.targets[edge], word + self.edge_chars[edge]) for edge in reversed(edges))
+        return results
+
+
+class Analyser:
+    """Morphological analyser: all the analyses of a Latin token, looked up in a DAWG over the Latin forms of the store
+    (normalised as the answers of the quiz, see fold_latin(): u/v, i/j, case and spaces don't matter)
+
+    example:
+        analyser = Analyser(list_verbs)
+        analyser.analyse("amavit")        # [{"latin": "amauit", "lemma": "amare", "mood": "indicatif", ...}]
+        analyser.complete("amatus e")     # ["amatus eram", "amatus eras", ...]
+    """
+
+    def __init__(self, list_verbs: VerbStore):
+        self.list_verbs = list_verbs
+        forms = list_verbs.latin_matcher.index  # normalised spelling -> Latin forms
+        self.dawg = DAWG(list(forms))
+        # Rows of each word of the DAWG, by rank: rows[offsets[rank]:offsets[rank + 1]]
+        self.offsets = array("I", [0])
+        self.rows = array("I")
+        for word in sorted(forms):
+            for latin in forms[word]:
+                self.rows.extend(list_verbs.latin_index[latin])
+            self.offsets.append(len(self.rows))
+
+    def __contains__(self, token: str) -> bool:
+        return self.dawg.index(fold_latin(token)) is not None
+
+    def analyse(self, token: str) -> list[dict]:
+        """All the analyses (lemma, mood, voice, tense, person, translation, gender) of a Latin token"""
+        return self.analyse_normalised(fold_latin(token))
+
+    def analyse_normalised(self, word: str) -> list[dict]:
+        """Same as analyse(), for a token already normalised with fold_latin()"""
+        rank = self.dawg.index(word)
+        if rank is None:
+            return []
+        analyses = []
+        for row in self.rows[self.offsets[rank] : self.offsets[rank + 1]]:
+            record = self.list_verbs.record(row)
+            analysis = {"latin": record["latin"], **{facet: record[facet] for facet in ANALYSIS_FACETS}}
+            if analysis["gender"] is None:
+                del analysis["gender"]
+            analyses.append(analysis)
+        return analyses
+
+    def count(self, prefix: str) -> int:
+        """Number of (normalised) Latin forms starting with prefix"""
+        return len(self.dawg.prefix_range(fold_latin(prefix)))
+
+    def complete(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Latin forms starting with prefix, in alphabetical order"""
+        forms = self.list_verbs.latin_matcher.index
+        return [latin for word in self.dawg.words(fold_latin(prefix), limit) for latin in forms[word]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="magister.py analyse",
+        description="Analyse morphologique des formes verbales latines (une analyse JSON par ligne)",
+    )
+    parser.add_argument("formes", nargs="*", help="formes à analyser (par défaut : une forme par ligne sur l'entrée standard)")
+    parser.add_argument("--prefixe", action="store_true", help="lister les formes commençant par chaque forme donnée")
+    parser.add_argument("--limite", type=int, default=50, help="nombre maximal de formes listées avec --prefixe (défaut : 50)")
+    args = parser.parse_args(argv)
+
+    verbs_latin_path = default_verbs_path()
+    analyser = Analyser(get_verbs(verbs_latin_path))
+
+    tokens = args.formes or (line.strip() for line in sys.stdin if line.strip())
+    for token in tokens:
+        if args.prefixe:
+            result = {"prefix": token, "count": analyser.count(token), "forms": analyser.complete(token, args.limite)}
+        else:
+            result = {"token": token, "analyses": analyser.analyse(token)}
+        print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,16 @@
-from scripts.magister import *
-import sys
 import argparse
+import hashlib
+import json
+import os
+import sys
+
 import genanki
+from magister import default_verbs_path, filter_verbs, get_verbs, personne
+
+# Ids of the model and of the main deck: Anki recognises them from one export to the next
+MODEL_ID = 1581981852
+DECK_ID = 2114781006
+DECK_NAME = "Latin verbs"
 
 
 def create_model():
@@ -10,7 +19,7 @@ def create_model():
     model = format of the Anki cards
     """
     model = genanki.Model(
-        1581981852,
+        MODEL_ID,
         "Simple Model",
         fields=[
             {"name": "Question"},
@@ -27,59 +36,173 @@ def create_model():
     return model
 
 
-def create_note(model, question, answer):
+def note_guid(latin) -> str:
+    """
+    *Input*
+    latin (str) = Latin form of a card
+
+    *Output*
+    guid (str) = GUID of its note, the same at each export, so that re-importing a deck updates the notes
+    (and keeps their review history) instead of duplicating them
+    """
+    return genanki.guid_for(latin)
+
+
+def answer(analyses) -> str:
+    """
+    *Input*
+    analyses = list of dict, all the inflected forms written as the Latin form of the card (syncretism)
+
+    *Output*
+    answer (str) = one line per analysis: person, tense, voice, mood, translations and lemma
+    """
+    lines = dict.fromkeys(
+        f"{personne(verb["person"])}, {verb["tense"]}, {verb["voice"]}, {verb["mood"]} : {", ".join(verb["translation"])} ({verb["lemma"]})"
+        for verb in analyses
+    )
+    return "<br>".join(lines)
+
+
+def deck_name(verb, subdecks: str | None) -> str:
+    """
+    *Input* (two)
+    verb = dict of an inflected form
+    subdecks = None (a single deck), "groupe" or "temps"
+
+    *Output*
+    name (str) = name of the deck of the verb (sub-decks are separated by "::" in Anki)
     """
-    *Input* (three)
+    if subdecks == "groupe":
+        return f"{DECK_NAME}::Groupe {verb["group"]}"
+    if subdecks == "temps":
+        return f"{DECK_NAME}::{verb["tense"]}"
+    return DECK_NAME
+
+
+def deck_id(name: str) -> int:
+    """Stable id of a deck, derived from its name"""
+    if name == DECK_NAME:
+        return DECK_ID
+    return int(hashlib.sha256(name.encode("utf-8")).hexdigest()[:8], 16)
+
+
+def create_note(model, question, answer, guid=None):
+    """
+    *Input* (four)
     model = format of the Anki cards
-    question (str) = Latin verb to be asked
-    answer (str) = French verb expected as answer
+    question (str) = Latin form to be asked
+    answer (str) = all its analyses (see answer())
+    guid (str) = GUID of the note (see note_guid())
 
     *Output*
     note = an Anki card/note
     """
-    note = genanki.Note(model=model, fields=[question, answer])
+    note = genanki.Note(model=model, fields=[question, answer], guid=guid)
     return note
 
 
-def create_notes(model, verbs):
+def create_notes(model, list_verbs, verbs=None, subdecks=None):
     """
-    *Input* (two)
+    *Input* (four)
     model = format of the Anki cards
-    verbs = list of dict
+    list_verbs = VerbStore with all the verbs
+    verbs = VerbStore (filtered view of list_verbs, see filter_verbs()) of the forms to be asked, all the verbs if None
+    subdecks = None, "groupe" or "temps" (see deck_name())
 
     *Output* (one)
-    notes (list) = list of Anki cards/notes, one per verb
+    notes (dict) = GUID -> (deck name, Anki card/note), one per Latin form
+
+    A syncretic form gets a single card listing all its analyses (looked up in the Latin index of the
+    whole store, so that a filter never hides an analysis), instead of one conflicting card per analysis.
     """
-    notes = []
-    for verb in verbs:
-        note = create_note(model, verb["french"], verb["latin"])
-        notes.append(note)
+    verbs = list_verbs if verbs is None else verbs
+    # First row of each Latin form of the view, in a single pass
+    first_rows = {}
+    for row in verbs.rows.tolist():
+        first_rows.setdefault(verbs.latin[row], row)
+
+    notes = {}
+    for latin, row in first_rows.items():
+        guid = note_guid(latin)
+        notes[guid] = (
+            deck_name(verbs.record(row), subdecks),
+            create_note(model, latin, answer(list_verbs.analyses(latin)), guid),
+        )
     return notes
 
 
-def create_deck(notes):
+def note_hash(name, note) -> str:
+    """Hash of the content of a note and of its deck: a note is exported again only when it changes"""
+    return hashlib.sha256("\x1f".join([name, *note.fields]).encode("utf-8")).hexdigest()[:16]
+
+
+def get_export_manifest(manifest_path, settings=None):
+    """
+    *Input* (two)
+    manifest_path = export manifest written by the previous export (see save_export_manifest())
+    settings (dict) = filters and sub-decks of the export
+
+    *Output*
+    notes (dict) = GUID -> hash of the notes already exported (empty if there is no manifest, or if it was
+    written for other settings)
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if manifest.get("model") != MODEL_ID or manifest.get("settings") != settings:
+        return {}
+    return manifest["notes"]
+
+
+def save_export_manifest(manifest_path, hashes, settings=None):
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"model": MODEL_ID, "settings": settings, "notes": hashes}, f, ensure_ascii=False, indent=0, sort_keys=True)
+
+
+def changed_notes(notes, exported):
+    """
+    *Input* (two)
+    notes = GUID -> (deck name, note), see create_notes()
+    exported = GUID -> hash of the notes already exported, see get_export_manifest()
+
+    *Output* (three)
+    changed (dict) = GUID -> (deck name, note) of the new or modified notes
+    hashes (dict) = GUID -> hash of all the notes, for the next export manifest
+    removed (list) = GUIDs of the notes exported before which don't exist anymore
+    """
+    hashes = {guid: note_hash(name, note) for guid, (name, note) in notes.items()}
+    changed = {guid: notes[guid] for guid, value in hashes.items() if exported.get(guid) != value}
+    removed = sorted(guid for guid in exported if guid not in notes)
+    return changed, hashes, removed
+
+
+def create_decks(notes):
     """
     *Input*
-    notes = list of Anki cards/notes, one per verb
+    notes = GUID -> (deck name, Anki card/note)
 
     *Output* (one)
-    deck = an Anki deck
+    decks = list of Anki decks (a deck per sub-deck)
     """
-    deck = genanki.Deck(2114781006, "Latin verbs")
-    for note in notes:
-        deck.add_note(note)
+    decks = {}
+    for name, note in notes.values():
+        if name not in decks:
+            decks[name] = genanki.Deck(deck_id(name), name)
+        decks[name].add_note(note)
     print("Cards added to the deck:", len(notes))
-    return deck
+    return [decks[name] for name in sorted(decks)]
 
 
-def save_deck(deck, filename):
+def save_deck(decks, filename):
     """
     *Input* (two)
-    deck = an Anki deck
+    decks = list of Anki decks
     filename = filename of the package (.apkg)
     """
     print("Saving deck to", filename)
-    genanki.Package(deck).write_to_file(filename)
+    genanki.Package(decks).write_to_file(filename)
 
 
 def main():
@@ -97,8 +220,8 @@ def main():
         "-i",
         "--input",
         type=str,
-        default="verbs_latin.csv",
-        help="Input filename of the csv list of verbs",
+        default=None,
+        help="Input filename of the list of verbs (verbs_latin.bin or verbs_latin.json by default)",
     )
     parser.add_argument(
         "-o",
@@ -107,26 +230,75 @@ def main():
         default="latin_verbs.apkg",
         help="Output filename of the Anki deck",
     )
+    parser.add_argument(
+        "-s",
+        "--subdecks",
+        type=str,
+        choices=["groupe", "temps"],
+        default=None,
+        help="One sub-deck per verb group or per tense",
+    )
+    # Same filters as magister.py
+    parser.add_argument("-t", "--temps", type=str, nargs="*", default=None, help='Le temps (ex: "présent") à exporter')
+    parser.add_argument("-g", "--groupe", type=int, nargs="*", default=None, help="Le groupe verbal (ex: 1) à exporter")
+    parser.add_argument("-p", "--personne", type=int, choices=range(0, 7), nargs="*", default=None, help="La personne (entre 1 et 6) à exporter")
+    parser.add_argument("-v", "--voix", type=str, choices=["actif", "passif", "déponent"], default=None, help="La voix à exporter")
+    parser.add_argument("-m", "--mode", type=str, choices=["indicatif", "subjonctif", "impératif"], default=None, help="Le mode à exporter")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only export the notes which changed since the last export (see the export manifest)",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default=None,
+        help="Export manifest (by default, the output filename with .export.json instead of .apkg)",
+    )
     args = parser.parse_args()
 
     input_filename = args.input
+    if input_filename is None:
+        input_filename = default_verbs_path()
     output_filename = args.output
+    manifest_path = args.manifest or os.path.splitext(output_filename)[0] + ".export.json"
 
     ###
-    # Load CSV file
+    # Load the verbs
     ###
 
-    verbs_latin_csv = input_filename
     try:
-        verbs = get_verbs(verbs_latin_csv)
+        list_verbs = get_verbs(input_filename)
     except FileNotFoundError:
         print("File not found")
         sys.exit(1)
 
+    verbs = filter_verbs(list_verbs, args.temps, args.groupe, args.personne, args.voix, args.mode)
+    if len(verbs) == 0:
+        print("Aucun verbe disponible pour ces options")
+        sys.exit(1)
+
     model = create_model()
-    notes = create_notes(model, verbs)
-    deck = create_deck(notes)
-    save_deck(deck, output_filename)
+    notes = create_notes(model, list_verbs, verbs, args.subdecks)
+
+    # The notes are always hashed, so that the next export can be incremental
+    settings = {
+        "temps": args.temps,
+        "groupe": args.groupe,
+        "personne": args.personne,
+        "voix": args.voix,
+        "mode": args.mode,
+        "subdecks": args.subdecks,
+    }
+    exported = get_export_manifest(manifest_path, settings) if args.incremental else {}
+    changed, hashes, removed = changed_notes(notes, exported)
+    if removed:
+        print(f"Notes which don't exist anymore (to be deleted in Anki): {len(removed)}")
+    if not changed:
+        print("No change since the last export")
+    else:
+        save_deck(create_decks(changed), output_filename)
+    save_export_manifest(manifest_path, hashes, settings)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+import argparse
+import json
+import re
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from analyser import Analyser
+from magister import default_verbs_path, get_verbs
+from matcher import fold_latin
+
+# Number of lines of text sent at once to a worker process (a chunk ends at the end of a sentence, see read_chunks())
+CHUNK_LINES = 2000
+# A chunk is cut anyway past this many lines (text without punctuation), so that the memory stays bounded
+MAX_CHUNK_LINES = 4 * CHUNK_LINES
+# Distinct tokens whose analyses are kept by each worker (the frequent forms are looked up only once)
+CACHE_SIZE = 1 << 16
+
+WORD = re.compile(r"[^\W\d_]+")
+SENTENCE_END = (".", ";", ":", "?", "!")
+# Enclitics tried when a token isn't a form by itself: "amatque" = "amat" + "que"
+ENCLITICS = ("que", "ne", "ue")
+
+# Analyser of a worker process, and the second words of the two-word forms ("est", "erant"...), see set_analyser()
+worker_analyser = None
+worker_auxiliaries = set()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalise(token: str) -> str:
+    """fold_latin(), with a shortcut for the plain ASCII tokens of the texts"""
+    if token.isascii():
+        return token.lower().replace("v", "u").replace("j", "i")
+    return fold_latin(token)
+
+
+def tokenize(lines: list[str], first_line: int) -> list[tuple[int, int, int, str]]:
+    """(line number, column, end column, token) of the words of the lines"""
+    return [
+        (number, match.start(), match.end(), match.group())
+        for number, line in enumerate(lines, first_line)
+        for match in WORD.finditer(line)
+    ]
+
+
+def spaced(lines: list[str], first_line: int, first: tuple, second: tuple) -> bool:
+    """Whether only spaces (or line breaks) separate two tokens of tokenize(): "amatus. Est" isn't a two-word form"""
+    (number, _, end, _), (next_number, start, _, _) = first, second
+    if number == next_number:
+        gap = lines[number - first_line][end:start]
+    else:
+        gap = lines[number - first_line][end:] + "".join(lines[number - first_line + 1 : next_number - first_line])
+        gap += lines[next_number - first_line][:start]
+    return not gap.strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def lookup(word: str) -> tuple[str, tuple, tuple] | None:
+    """Analyses of a normalised word of the worker (JSON), with its lemmas and tenses; None if it isn't a verb form"""
+    analyses = worker_analyser.analyse_normalised(word)
+    if not analyses:
+        return None
+    return (
+        json.dumps(analyses, ensure_ascii=False),
+        tuple(dict.fromkeys(analysis["lemma"] for analysis in analyses)),
+        tuple(dict.fromkeys(analysis["tense"] for analysis in analyses)),
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def lookup_token(word: str):
+    """lookup(), or lookup() of the word without its enclitic"""
+    found = lookup(word)
+    if found is None:
+        for enclitic in ENCLITICS:
+            if word.endswith(enclitic) and len(word) > len(enclitic) + 1:
+                found = lookup(word[: -len(enclitic)])
+                if found is not None:
+                    break
+    return found
+
+
+def annotate_chunk(chunk: tuple[int, list[str]], analyser: Analyser | None = None) -> tuple[list[str], int, Counter, Counter]:
+    """Annotate the verb forms of a chunk of lines
+
+    The perfect passive forms are written in two words ("amatus est", or "est amatus"): a token next to a form
+    of esse, with only spaces between them, is first looked up with it, then alone.
+
+    returns:
+        annotations (JSONL lines), number of tokens, frequency of the lemmas, frequency of the tenses
+        {"line": 12, "column": 4, "token": "amatus est", "analyses": [{"latin": "amatus est", "lemma": "amare", ...}]}
+    """
+    if analyser is not None and analyser is not worker_analyser:
+        set_analyser(analyser)
+
+    first_line, lines = chunk
+    tokens = tokenize(lines, first_line)
+    words = [normalise(token) for _, _, _, token in tokens]
+    annotations = []
+    lemmas, tenses = Counter(), Counter()
+    index = 0
+    while index < len(tokens):
+        number, column, _, token = tokens[index]
+        found, length = None, 1
+        if index + 1 < len(tokens) and spaced(lines, first_line, tokens[index], tokens[index + 1]):
+            if words[index + 1] in worker_auxiliaries:
+                found, length = lookup(f"{words[index]} {words[index + 1]}"), 2
+            if found is None and words[index] in worker_auxiliaries:
+                found, length = lookup(f"{words[index + 1]} {words[index]}"), 2
+        if found is None:
+            found, length = lookup_token(words[index]), 1
+        if found is not None:
+            if length == 2:
+                token = f"{token} {tokens[index + 1][3]}"
+            analyses, found_lemmas, found_tenses = found
+            annotations.append(
+                f'{{"line": {number}, "column": {column}, "token": {json.dumps(token, ensure_ascii=False)}, "analyses": {analyses}}}'
+            )
+            lemmas.update(found_lemmas)
+            tenses.update(found_tenses)
+        index += length
+    return annotations, len(tokens), lemmas, tenses
+
+
+def set_analyser(analyser: Analyser):
+    global worker_analyser, worker_auxiliaries
+    worker_analyser = analyser
+    worker_auxiliaries = {word.split(" ", 1)[1] for word in analyser.list_verbs.latin_matcher.index if " " in word}
+    lookup.cache_clear()
+    lookup_token.cache_clear()
+
+
+def init_worker(verbs_latin_path: str):
+    """Each worker process opens the dataset and builds its analyser once"""
+    set_analyser(Analyser(get_verbs(verbs_latin_path)))
+
+
+def read_chunks(f, chunk_lines=CHUNK_LINES):
+    """(number of the first line, lines) of the text, by chunks ending at the end of a sentence, so that the two
+    words of a perfect passive are never in different chunks
+    """
+    chunk, first_line = [], 1
+    for number, line in enumerate(f, 1):
+        chunk.append(line)
+        end = line.rstrip()
+        if len(chunk) >= MAX_CHUNK_LINES or (len(chunk) >= chunk_lines and (not end or end.endswith(SENTENCE_END))):
+            yield first_line, chunk
+            chunk, first_line = [], number + 1
+    if chunk:
+        yield first_line, chunk
+
+
+def annotate_chunks(chunks, verbs_latin_path: str, jobs: int = 1):
+    """Yield the results of all the chunks, in the order of the text (see grade_batches() in grade.py)"""
+    if jobs == 1:
+        init_worker(verbs_latin_path)
+        for chunk in chunks:
+            yield annotate_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(verbs_latin_path,)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(annotate_chunk, chunk))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="magister.py annotate",
+        description="Repère les formes verbales d'un texte latin (annotations JSONL et fréquences par lemme et par temps)",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="texte latin (défaut : entrée standard)")
+    parser.add_argument("-o", "--output", default="-", help="fichier d'annotations JSONL (défaut : sortie standard)")
+    parser.add_argument("-f", "--frequences", default=None, help="fichier JSON des fréquences par lemme et par temps")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="nombre de processus d'annotation (défaut : 1)")
+    args = parser.parse_args(argv)
+
+    verbs_latin_path = default_verbs_path()
+
+    count = verbs = 0
+    lemmas, tenses = Counter(), Counter()
+    text = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8", errors="replace")
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for annotations, tokens, chunk_lemmas, chunk_tenses in annotate_chunks(read_chunks(text), verbs_latin_path, max(args.jobs, 1)):
+            for annotation in annotations:
+                output.write(annotation + "\n")
+            count += tokens
+            verbs += len(annotations)
+            lemmas.update(chunk_lemmas)
+            tenses.update(chunk_tenses)
+    finally:
+        if text is not sys.stdin:
+            text.close()
+        if output is not sys.stdout:
+            output.close()
+
+    if args.frequences:
+        with open(args.frequences, "w", encoding="utf-8") as f:
+            json.dump(
+                {"tokens": count, "verbs": verbs, "lemmas": dict(lemmas.most_common()), "tenses": dict(tenses.most_common())},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    # The summary goes to stderr, so that stdout only contains the annotations
+    print(f"Mots : {count}, formes verbales : {verbs}", file=sys.stderr)
+    if verbs:
+        print("Lemmes les plus fréquents :", ", ".join(f"{lemma} ({n})" for lemma, n in lemmas.most_common(10)), file=sys.stderr)
+        print("Temps :", ", ".join(f"{tense} ({n})" for tense, n in tenses.most_common()), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+import argparse
+import builtins
+import contextlib
+import gc
+import gzip
+import hashlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+
+import numpy as np
+import pynooj
+
+from magister import (
+    ask_verb,
+    ask_verb_reverse,
+    filter_group,
+    filter_mood,
+    filter_person,
+    filter_tense,
+    filter_verbs,
+    filter_voice,
+    get_verbs,
+)
+from nooj import check_inflected_forms, convert_inflected_form, deduplicate
+from quiz import Quiz
+from scheduler import MAX_BOX, Scheduler, box_weight
+
+# Paths are relative to the root of the repository (same as the other scripts)
+VERBS_LATIN_PATH = "verbs_latin.json"
+COMPACT_PATH = "verbs_latin.compact.json"
+BIN_PATH = "verbs_latin.bin"
+DIC_PATH = "NooJ/lat_verbes-flx.dic"
+# Artifacts whose size is reported (raw and gzipped), see payload_sizes()
+PAYLOADS = {
+    "json": [VERBS_LATIN_PATH],
+    "compact json": [COMPACT_PATH],
+    "binary": [BIN_PATH],
+    "web/shards": ["web/shards/index.js", "web/shards/*"],
+    "web/french_index.js": ["web/french_index.js"],
+}
+# Format of the result files: a comparison is only made between files of the same version
+RESULTS_VERSION = 1
+
+SEED = 0
+QUESTIONS = 200
+# Same session filters for all the runs (filter_* chain)
+FILTERS = {"tense": ["présent", "futur", "parfait"], "group": [1, 3], "person": [1, 3, 6], "voice": "actif", "mood": "indicatif"}
+
+
+def scan_accepted_latins(verb, list_verbs) -> list[str]:
+    """Former computation of the accepted Latin forms in ask_verb_reverse(): a full scan of the inflected forms.
+    Kept here as a reference point for the benchmark.
+    """
+    verb_translations = set(verb["translation"])
+    return [
+        v["latin"] for v in list_verbs
+        if v["person"] == verb["person"]
+        and v["tense"] == verb["tense"]
+        and v["voice"] == verb["voice"]
+        and v["mood"] == verb["mood"]
+        and bool(set(v["translation"]) & verb_translations)
+    ]
+
+
+def index_accepted_latins(verb, list_verbs) -> list[str]:
+    """Current computation of the accepted Latin forms in ask_verb_reverse(): a lookup in the answer index"""
+    return list_verbs.accepted_latins(
+        verb["person"], verb["tense"], verb["voice"], verb["mood"], verb["translation"]
+    )
+
+
+def grade_questions(questions, list_verbs, direction) -> int:
+    """Answers all the steps of the questions with the quiz engine (first accepted answer), as a server or a script would"""
+    quiz = Quiz(list_verbs)
+    score = 0
+    for verb in questions:
+        quiz.start_question(verb, direction)
+        while not quiz.done:
+            score += quiz.submit(quiz.step, str(quiz.accepted(quiz.step)[0]))["correct"]
+    return score
+
+
+@contextlib.contextmanager
+def stubbed_input(quiz: Quiz):
+    """input() answers the current step of the quiz with its first accepted answer, and the CLI prints nothing"""
+    original = builtins.input
+    builtins.input = lambda message="": str(quiz.accepted(quiz.step)[0])
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = original
+
+
+def ask_questions(ask, questions, list_verbs) -> int:
+    """ask_verb() or ask_verb_reverse() on each question, the user's answers coming from stubbed_input()"""
+    quiz = Quiz(list_verbs)
+    with stubbed_input(quiz):
+        return sum(ask(verb, list_verbs, quiz) for verb in questions)
+
+
+def filter_chain(list_verbs):
+    """The five filters of a session, one after the other"""
+    verbs = filter_tense(FILTERS["tense"], list_verbs)
+    verbs = filter_group(FILTERS["group"], verbs)
+    verbs = filter_person(FILTERS["person"], verbs)
+    verbs = filter_voice(FILTERS["voice"], verbs)
+    return filter_mood(FILTERS["mood"], verbs)
+
+
+def naive_draw_update(size, n=1000):
+    """Weighted draw over the list of all the weights (O(n) per draw), as random.choices() would do
+
+    Same workload as scheduler_draw_update(): a new session, whose drawn items are all answered correctly.
+    """
+    boxes, weights = [0] * size, [box_weight(0)] * size
+    for _ in range(n):
+        item = random.choices(range(size), weights)[0]
+        boxes[item] = min(boxes[item] + 1, MAX_BOX)
+        weights[item] = box_weight(boxes[item])
+
+
+def scheduler_draw_update(list_verbs, n=1000):
+    scheduler = Scheduler(list_verbs)
+    for _ in range(n):
+        item, _ = scheduler.draw()
+        scheduler.update(item, 1)
+
+
+def sort_forms(verbs_lst) -> list[dict]:
+    """Same order as process_lines() in nooj.py: lemma > mood > voice > tense > person"""
+    return sorted(verbs_lst, key=lambda x: (x["lemma"], x["mood"], x["voice"], x["tense"], x["person"]))
+
+
+class Context:
+    """Inputs of the benchmarks, built once (and outside of the timings) the first time a benchmark needs them"""
+
+    @cached_property
+    def list_verbs(self):
+        return get_verbs(VERBS_LATIN_PATH)
+
+    @cached_property
+    def records(self) -> list[dict]:
+        return list(self.list_verbs)
+
+    @cached_property
+    def questions(self) -> list[dict]:
+        # The same questions at each run
+        return random.Random(SEED).sample(self.records, QUESTIONS)
+
+    @cached_property
+    def dics_nooj(self) -> list[dict]:
+        return pynooj.read_dic(DIC_PATH)
+
+    @cached_property
+    def inflected_forms(self) -> list[dict]:
+        return sort_forms(map(convert_inflected_form, self.dics_nooj))
+
+
+# name -> function(context) returning (function to time, number of operations per call), see benchmark()
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+
+    return register
+
+
+@benchmark("load.json")
+def bench_load_json(context):
+    return lambda: get_verbs(VERBS_LATIN_PATH), 1
+
+
+@benchmark("load.compact")
+def bench_load_compact(context):
+    return lambda: get_verbs(COMPACT_PATH), 1
+
+
+@benchmark("load.bin")
+def bench_load_bin(context):
+    return lambda: get_verbs(BIN_PATH), 1
+
+
+@benchmark("filter.chain")
+def bench_filter_chain(context):
+    list_verbs = context.list_verbs
+    return lambda: filter_chain(list_verbs), 1
+
+
+@benchmark("filter.verbs")
+def bench_filter_verbs(context):
+    list_verbs = context.list_verbs
+    filters = list(FILTERS.values())
+    return lambda: filter_verbs(list_verbs, *filters), 1
+
+
+@benchmark("accepted_latins.scan")
+def bench_accepted_latins_scan(context):
+    # The records (dicts) are rebuilt once, so that the scan measures the same work as before the VerbStore
+    questions, records = context.questions, context.records
+    return lambda: [scan_accepted_latins(verb, records) for verb in questions], len(questions)
+
+
+@benchmark("accepted_latins.index")
+def bench_accepted_latins_index(context):
+    questions, list_verbs = context.questions, context.list_verbs
+    return lambda: [index_accepted_latins(verb, list_verbs) for verb in questions], len(questions)
+
+
+@benchmark("ask_verb")
+def bench_ask_verb(context):
+    questions, list_verbs = context.questions, context.list_verbs
+    return lambda: ask_questions(ask_verb, questions, list_verbs), len(questions)
+
+
+@benchmark("ask_verb_reverse")
+def bench_ask_verb_reverse(context):
+    questions, list_verbs = context.questions, context.list_verbs
+    return lambda: ask_questions(ask_verb_reverse, questions, list_verbs), len(questions)
+
+
+@benchmark("quiz.latin")
+def bench_quiz_latin(context):
+    questions, list_verbs = context.questions, context.list_verbs
+    return lambda: grade_questions(questions, list_verbs, "latin"), len(questions)
+
+
+@benchmark("quiz.français")
+def bench_quiz_francais(context):
+    questions, list_verbs = context.questions, context.list_verbs
+    return lambda: grade_questions(questions, list_verbs, "français"), len(questions)
+
+
+@benchmark("scheduler.weighted_list")
+def bench_scheduler_weighted_list(context):
+    return lambda: naive_draw_update(len(context.list_verbs)), 1000
+
+
+@benchmark("scheduler.draw_update")
+def bench_scheduler_draw_update(context):
+    return lambda: scheduler_draw_update(context.list_verbs), 1000
+
+
+# A scheduler is built for each session of server.py
+@benchmark("scheduler.new")
+def bench_scheduler_new(context):
+    return lambda: Scheduler(context.list_verbs), 1
+
+
+@benchmark("french_index.complete")
+def bench_french_index_complete(context):
+    french_index = context.list_verbs.french_index
+    # Each prefix of each infinitive, as typed one keystroke after the other
+    prefixes = [label[:end] for label in french_index.labels for end in range(1, len(label) + 1)]
+    return lambda: [french_index.complete(prefix) for prefix in prefixes], len(prefixes)
+
+
+@benchmark("nooj.read")
+def bench_nooj_read(context):
+    return lambda: pynooj.read_dic(DIC_PATH), 1
+
+
+@benchmark("nooj.convert")
+def bench_nooj_convert(context):
+    dics_nooj = context.dics_nooj
+    return lambda: sort_forms(map(convert_inflected_form, dics_nooj)), len(dics_nooj)
+
+
+@benchmark("nooj.check")
+def bench_nooj_check(context):
+    inflected_forms = context.inflected_forms
+    return lambda: check_inflected_forms(inflected_forms), len(inflected_forms)
+
+
+@benchmark("nooj.deduplicate")
+def bench_nooj_deduplicate(context):
+    inflected_forms = context.inflected_forms
+    return lambda: deduplicate(inflected_forms), len(inflected_forms)
+
+
+def measure(function, operations=1, repeat=7, min_time=0.2) -> dict:
+    """Time a function the way timeit does, with the statistics needed to compare two runs
+
+    The function is run once to warm up (lazy indexes, caches), then the number of calls per sample is
+    raised until a sample lasts at least min_time seconds, so that the resolution of the clock doesn't matter.
+    Each of the `repeat` samples is timed with the garbage collector disabled, after a collection.
+    The times are per operation (ex: per question), in seconds: the minimum is the most reproducible
+    figure, the median and the standard deviation tell how noisy the run was.
+    """
+    function()
+    number = 1
+    while True:
+        elapsed = time_calls(function, number)
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed * 10 > min_time else 10
+
+    samples = [time_calls(function, number) / (number * operations) for _ in range(repeat)]
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+        "operations": operations,
+    }
+
+
+def time_calls(function, number) -> float:
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def payload_sizes() -> dict:
+    """Size in bytes (raw and gzipped, as served) of the datasets and of the web artifacts written by nooj.py"""
+    sizes = {}
+    for name, patterns in PAYLOADS.items():
+        paths = []
+        for pattern in patterns:
+            if pattern.endswith("/*"):
+                directory = pattern[:-2]
+                # The content-hashed copies (and their .gz) are the same bytes as the logical files
+                paths += [
+                    os.path.join(directory, file_name)
+                    for file_name in sorted(os.listdir(directory))
+                    if file_name.endswith(".js") and file_name.count(".") == 1 and file_name != "index.js"
+                ]
+            else:
+                paths.append(pattern)
+        raw = compressed = 0
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                content = f.read()
+            raw += len(content)
+            compressed += len(gzip.compress(content, compresslevel=9, mtime=0))
+        sizes[name] = {"files": len(paths), "bytes": raw, "gzip": compressed}
+    return sizes
+
+
+def environment() -> dict:
+    """What a result depends on besides the code: commit, interpreter, machine and dataset"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    with open(VERBS_LATIN_PATH, "rb") as f:
+        dataset = hashlib.sha256(f.read()).hexdigest()
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "dataset": dataset,
+    }
+
+
+def run(names=None, repeat=7, min_time=0.2, log=print) -> dict:
+    """Run the benchmarks (all of them, or those whose name starts with one of the names) and return the results"""
+    context = Context()
+    selected = [name for name in BENCHMARKS if not names or name.startswith(tuple(names))]
+    results = {}
+    for name in selected:
+        function, operations = BENCHMARKS[name](context)
+        # Same random draws (scheduler, quiz) at each run
+        random.seed(SEED)
+        results[name] = measure(function, operations, repeat, min_time)
+        log(format_result(name, results[name]))
+    return {
+        "version": RESULTS_VERSION,
+        "environment": environment(),
+        "settings": {"repeat": repeat, "min_time": min_time, "seed": SEED, "questions": QUESTIONS},
+        "benchmarks": results,
+        "sizes": payload_sizes(),
+    }
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("µs", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.0f} ns"
+
+
+def format_result(name, result) -> str:
+    spread = result["stdev"] / result["median"] * 100 if result["median"] else 0.0
+    return f"{name:28} {format_time(result['min'])}  median {format_time(result['median'])} ±{spread:4.1f}%  (per operation)"
+
+
+def compare(results, previous) -> list[str]:
+    """Ratio of the minimum times of the benchmarks run in both result files (< 1: faster than before)"""
+    if previous.get("version") != RESULTS_VERSION:
+        return ["The previous results were written by another version of benchmark.py: no comparison"]
+    lines = [f"Compared with {previous['environment'].get('commit') or 'the previous run'}:"]
+    for name, result in results["benchmarks"].items():
+        before = previous["benchmarks"].get(name)
+        if before:
+            lines.append(f"  {name:28} x{result['min'] / before['min']:.2f}")
+    for name, size in results["sizes"].items():
+        before = previous["sizes"].get(name)
+        if before and before["bytes"] != size["bytes"]:
+            lines.append(f"  {name:28} {before['bytes']} -> {size['bytes']} bytes ({before['gzip']} -> {size['gzip']} gzipped)")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="benchmark.py",
+        description="Benchmarks of the load, filter, question and build paths (to be run from the root of the repository)",
+    )
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run, by name or prefix (default: all): {', '.join(BENCHMARKS)}")
+    parser.add_argument("-o", "--output", default=None, help="JSON file of the results (ex: bench.json)")
+    parser.add_argument("-r", "--repeat", type=int, default=7, help="number of timed samples per benchmark (default: 7)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum duration of a sample, in seconds (default: 0.2)")
+    parser.add_argument("--compare", default=None, help="JSON file of previous results, to compare with")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if not any(benchmark.startswith(name) for benchmark in BENCHMARKS)]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run(args.names, max(args.repeat, 1), args.min_time)
+    for name, size in results["sizes"].items():
+        print(f"{name:28} {size['bytes']:10} bytes {size['gzip']:10} gzipped ({size['files']} files)")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print("\n".join(compare(results, json.load(f))))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print("Results written to", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+import os
+
+import pytest
+from magister import get_verbs
+
+
+@pytest.fixture(scope="session")
+def verbs_path():
+    """Dataset of the tests: the json file written by nooj.py"""
+    return os.path.join(os.path.dirname(__file__), "..", "verbs_latin.json")
+
+
+@pytest.fixture(scope="module")
+def list_verbs(verbs_path):
+    return get_verbs(verbs_path)
@@ -0,0 +1,150 @@
+import argparse
+import json
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from magister import default_verbs_path, get_verbs
+from quiz import Quiz
+from verb_store import VerbStore
+
+# Number of answers sent at once to a worker process
+BATCH_SIZE = 2000
+
+# Dataset of a worker process (see init_worker())
+worker_verbs = None
+
+
+def grade_answer(answer: dict, list_verbs: VerbStore) -> dict:
+    """Grade a submitted answer with the same rules as ask_verb() and ask_verb_reverse()
+
+    example answers (one per line of the input file):
+        {"id": "s1-q1", "latin": "amauerit", "person": 3, "tense": "parfait", "voice": "actif", "mood": "subjonctif", "translation": "aimer"}
+        {"id": "s1-q2", "translation": ["aimer"], "person": 1, "tense": "présent", "voice": "actif", "mood": "indicatif", "answer": "amo"}
+
+    The first one is a Latin form to analyse (direction "latin"), the second one a French prompt with the Latin
+    form given by the student (direction "français"). Each step is answered once: a wrong step is revealed,
+    so that the next steps are graded as in the CLI.
+
+    returns:
+        {"id": "s1-q1", "direction": "latin", "steps": {"person": True, ...}, "score": 5, "max score": 5}
+    """
+    quiz = Quiz(list_verbs)
+    if "answer" in answer:
+        verb = dict(answer)
+        if isinstance(verb.get("translation"), str):
+            verb["translation"] = [verb["translation"]]
+        verb["person"] = int(verb["person"])
+        quiz.start_question(verb, "français")
+        answers = {"latin": answer["answer"]}
+    else:
+        # The form is looked up as the CLI and the server do (u/v, i/j, case and spaces are ignored)
+        latins = list_verbs.latin_matcher.match(answer["latin"])
+        quiz.start_question({"latin": latins[0] if latins else answer["latin"]}, "latin")
+        answers = answer
+
+    steps = {}
+    while not quiz.done:
+        step = quiz.step
+        steps[step] = quiz.submit(step, answers.get(step))["correct"]
+        if not steps[step]:
+            quiz.reveal(step)
+
+    result = {"direction": quiz.direction, "steps": steps, "score": quiz.score, "max score": len(quiz.steps)}
+    if "id" in answer:
+        result = {"id": answer["id"], **result}
+    return result
+
+
+def grade_lines(lines: list[tuple[int, str]], list_verbs: VerbStore | None = None) -> list[dict]:
+    """Grade numbered lines of the input file (JSONL); an invalid line gives an error instead of a result"""
+    list_verbs = list_verbs if list_verbs is not None else worker_verbs
+    results = []
+    for number, line in lines:
+        try:
+            results.append({"line": number, **grade_answer(json.loads(line), list_verbs)})
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            results.append({"line": number, "error": f"{type(e).__name__}: {e}"})
+    return results
+
+
+def init_worker(verbs_latin_path: str):
+    """Each worker process opens the dataset once (the binary dataset is memory-mapped)"""
+    global worker_verbs
+    worker_verbs = get_verbs(verbs_latin_path)
+
+
+def read_batches(f, batch_size=BATCH_SIZE):
+    """Numbered non-empty lines of the input file, by batches"""
+    batch = []
+    for number, line in enumerate(f, 1):
+        if line.strip():
+            batch.append((number, line))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def grade_batches(batches, verbs_latin_path: str, jobs: int = 1):
+    """Yield the results of all the batches, in the order of the input file
+
+    With several jobs, the batches are graded by a process pool; only a few batches per process are
+    submitted in advance, so that the input file is streamed rather than loaded at once.
+    """
+    if jobs == 1:
+        list_verbs = get_verbs(verbs_latin_path)
+        for batch in batches:
+            yield from grade_lines(batch, list_verbs)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(verbs_latin_path,)) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(grade_lines, batch))
+            if len(pending) >= 2 * jobs:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="magister.py grade",
+        description="Corrige un fichier de réponses (JSONL) avec les mêmes règles que l'interrogation",
+    )
+    parser.add_argument("-i", "--input", required=True, help="fichier de réponses, une réponse JSON par ligne")
+    parser.add_argument("-o", "--output", default="-", help="fichier de résultats JSONL (défaut : sortie standard)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="nombre de processus de correction (défaut : 1)")
+    args = parser.parse_args(argv)
+
+    verbs_latin_path = default_verbs_path()
+
+    count = errors = score = max_score = 0
+    perfect = 0
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        with open(args.input, "r", encoding="utf-8") as f:
+            for result in grade_batches(read_batches(f), verbs_latin_path, max(args.jobs, 1)):
+                output.write(json.dumps(result, ensure_ascii=False) + "\n")
+                count += 1
+                if "error" in result:
+                    errors += 1
+                    continue
+                score += result["score"]
+                max_score += result["max score"]
+                perfect += result["score"] == result["max score"]
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    # The summary goes to stderr, so that stdout only contains the results
+    print(f"Réponses corrigées : {count - errors} (lignes invalides : {errors})", file=sys.stderr)
+    if count > errors:
+        print(f"Entièrement correctes : {perfect}/{count - errors}", file=sys.stderr)
+        print(f"Étapes correctes : {score}/{max_score} ({score / max_score:.1%})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
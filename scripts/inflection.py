@@ -0,0 +1,189 @@
+import re
+
+
+# Tokens of the sequence of an alternative: quoted string, command, embedded paradigm, or literal suffix
+SEQUENCE_TOKEN = re.compile(r'"[^"]*"|<[^>]*>|:[^\s"<:/]+|[^\s"<:/]+')
+# Commands used by the paradigms: <B>, <B2>, <L>, <LW>, <E>...
+COMMAND = re.compile(r"<([BLRSDE])(\d*|W)>")
+
+
+def split_unescaped(text, separator) -> list[str]:
+    """Split a NooJ string on a separator which is not escaped by a backslash (e.g. "errer;se\\ tromper")"""
+    parts = [""]
+    escaped = False
+    for char in text:
+        if char == separator and not escaped:
+            parts.append("")
+            continue
+        parts[-1] += char
+        escaped = char == "\\" and not escaped
+    return parts
+
+
+def parse_alternative(text) -> tuple[list, list[str]]:
+    """Parse an alternative of a paradigm (e.g. ':GP1_A :FUT_GP1-2 <B>u :P3_ACT/VX=act')
+
+    Returns the sequence of operations (("text", suffix), ("command", name, count) or ("paradigm", name))
+    and the list of features.
+    """
+    sequence, _, features = text.partition("/")
+    operations = []
+    for token in SEQUENCE_TOKEN.findall(sequence):
+        if token.startswith('"'):
+            operations.append(("text", token[1:-1]))
+        elif token.startswith("<"):
+            match = COMMAND.fullmatch(token)
+            if match is None:
+                raise ValueError(f"Unsupported NooJ command: {token}")
+            name, count = match.groups()
+            operations.append(("command", name, count if count == "W" else int(count or 1)))
+        elif token.startswith(":"):
+            operations.append(("paradigm", token[1:]))
+        else:
+            operations.append(("text", token))
+    return operations, [feature for feature in features.strip().split("+") if feature]
+
+
+def parse_paradigms(nof_path) -> dict[str, list]:
+    """Parse the paradigms of a NooJ inflectional description file (.nof)
+
+    example:
+        P_ACT =
+            s/VX=act+P=2+NB=sg |
+            t/VX=act+P=3+NB=sg ;
+
+    returns:
+        {"P_ACT": [([("text", "s")], ["VX=act", "P=2", "NB=sg"]), ([("text", "t")], ["VX=act", "P=3", "NB=sg"])]}
+    """
+    with open(nof_path, "r", encoding="utf-8") as f:
+        text = "\n".join(line for line in f if not line.strip().startswith("#"))
+
+    paradigms = {}
+    for rule in text.split(";"):
+        if not rule.strip():
+            continue
+        name, _, body = rule.partition("=")
+        paradigms[name.strip()] = [parse_alternative(alternative.strip()) for alternative in body.split("|")]
+    return paradigms
+
+
+def apply_operations(stem, operations) -> str:
+    """Apply a compiled sequence of operations to a stem: suffixes are inserted at the cursor,
+    which is at the end of the word unless moved by a command (e.g. "amabaor" <L><B> -> "amabar")
+    """
+    word = list(stem)
+    cursor = len(word)
+    for operation in operations:
+        if operation[0] == "text":
+            word[cursor:cursor] = operation[1]
+            cursor += len(operation[1])
+            continue
+        _, name, count = operation
+        if name == "E":
+            continue
+        if count == "W":
+            count = cursor if name in "BL" else len(word) - cursor
+        if name == "B":
+            del word[cursor - count:cursor]
+            cursor -= count
+        elif name == "L":
+            cursor -= count
+        elif name == "R":
+            cursor += count
+        elif name == "S":
+            del word[cursor:cursor + count]
+        elif name == "D":
+            word[cursor:cursor] = word[cursor - 1] * count
+            cursor += count
+    return "".join(word)
+
+
+def merge_features(features, new_features) -> list[str]:
+    """Append inflectional features the way NooJ does: a feature already present (same name and value)
+    is moved to the end, a feature with another value is kept (e.g. "NB=sg+GEN=fem+P=1+NB=pl")
+    """
+    merged = list(features)
+    for feature in new_features:
+        if feature in merged:
+            merged.remove(feature)
+        merged.append(feature)
+    return merged
+
+
+def unifies(lexical, features) -> bool:
+    """Whether inflectional features agree with the lexical features of the entry:
+    e.g. GP_SUB generates a present subjunctive for each group, only the one with the group of the entry is kept
+    """
+    for feature in features:
+        name, _, value = feature.partition("=")
+        if lexical.get(name, value) != value:
+            return False
+    return True
+
+
+class Inflector:
+    """Python implementation of the NooJ inflection of lat_verbes.dic with the paradigms of latin_verbs.nof
+
+    The paradigms are compiled (embedded paradigms expanded) the first time they are used.
+    """
+
+    def __init__(self, nof_path="NooJ/latin_verbs.nof"):
+        self.paradigms = parse_paradigms(nof_path)
+        self._compiled = {}
+
+    def compile(self, name) -> list[tuple[tuple, tuple]]:
+        """Expand a paradigm into the list of its (operations, features), one per inflected form"""
+        if name not in self._compiled:
+            if name not in self.paradigms:
+                raise KeyError(f"Unknown paradigm: {name}")
+            compiled = []
+            for operations, features in self.paradigms[name]:
+                # Cartesian product of the embedded paradigms of the sequence
+                expansions = [((), ())]
+                for operation in operations:
+                    if operation[0] == "paradigm":
+                        expansions = [
+                            (ops + sub_ops, feats + sub_feats)
+                            for ops, feats in expansions
+                            for sub_ops, sub_feats in self.compile(operation[1])
+                        ]
+                    else:
+                        expansions = [(ops + (operation,), feats) for ops, feats in expansions]
+                compiled += [(ops, feats + tuple(features)) for ops, feats in expansions]
+            self._compiled[name] = compiled
+        return self._compiled[name]
+
+    def inflect(self, entry) -> list[str]:
+        """Inflect a dictionary entry (a line of lat_verbes.dic) into the lines of lat_verbes-flx.dic
+
+        example:
+            am,amare,V+GP=1+PRIM=o;as;are;aui;atum+Theme=INF+TRAD=aimer+FLX=GP1_INF
+        returns:
+            ["amo,amare,V+PRIM=o;as;are;aui;atum+Theme=INF+TRAD=aimer+FLX=GP1_INF+VX=act+P=1+NB=sg+GP=1+TP=pres+MOD=ind", ...]
+        """
+        stem, lemma, spec = entry.split(",")
+        features = split_unescaped(spec, "+")
+        flx = [feature for feature in features if feature.startswith("FLX=")][0][len("FLX="):]
+        lexical = dict(feature.split("=", 1) for feature in features if "=" in feature)
+        return [
+            f"{apply_operations(stem, operations)},{lemma},{'+'.join(merge_features(features, new_features))}"
+            for operations, new_features in self.compile(flx)
+            if unifies(lexical, new_features)
+        ]
+
+
+def read_entries(dic_path="NooJ/lat_verbes.dic") -> dict[str, list[str]]:
+    """Read the entries (stems) of a NooJ dictionary, grouped by lemma"""
+    entries = {}
+    with open(dic_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            entries.setdefault(line.split(",")[1], []).append(line)
+    return entries
+
+
+def inflect_lemma(inflector, entries, lemma) -> list[str]:
+    """Lines of lat_verbes-flx.dic of a single lemma, generated on demand"""
+    return [line for entry in entries[lemma] for line in inflector.inflect(entry)]
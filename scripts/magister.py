@@ -1,63 +1,190 @@
+import hashlib
 import json
+import os
+import re
 import sys
 import random
 import argparse
 
+import numpy as np
+
+try:
+    # Tab completion of the French infinitives (not available on Windows: the translation is then typed in full)
+    import readline
+except ImportError:
+    readline = None
+
+from quiz import Quiz
+from progress import PROGRESS_PATH, ProgressSession, ProgressStore
+from scheduler import Scheduler
+from verb_store import VerbStore
+
 debug = False
 
 
-def get_verbs(json_path: str) -> list[dict]:
-    """Loads all the verbs from a .json file
+def default_verbs_path() -> str:
+    """Path of the dataset opened by default by the scripts: the binary dataset is much faster to open than the json file,
+    which remains the reference
 
-    *Input* (one)
-    verbs_path = path to a json file (str)
+    *Output* (one)
+    verbs_latin_path = "verbs_latin.bin" if it was written by nooj.py, "verbs_latin.json" otherwise (str)
+    """
+    return "verbs_latin.bin" if os.path.exists("verbs_latin.bin") else "verbs_latin.json"
+
+
+def get_verbs(json_path: str, stream: bool = False) -> VerbStore:
+    """Loads all the verbs from a .json file (list of dicts or compact layout), or from the binary dataset (.bin) written by nooj.py
+
+    *Input* (two)
+    verbs_path = path to a json or bin file (str)
+    stream = if True, yields the inflected forms one by one instead of loading them all (see iter_verbs())
 
     *Output* (one)
-    verbs = list of dicts (one per inflected form)
+    verbs = VerbStore (columnar storage of the inflected forms, iterating over it yields one dict per inflected form)
+    OR an iterator of dicts (one per inflected form) in streaming mode
     """
+    if stream:
+        return iter_verbs(json_path)
+    if json_path.endswith(".bin"):
+        # Memory-mapped: the inflected forms are only decoded when they are accessed
+        list_verbs = VerbStore.open_binary(json_path)
+    elif is_compact(json_path):
+        # Compact layout: the columns of codes are used directly
+        with open(json_path, "r", encoding="utf-8") as f:
+            list_verbs = VerbStore.from_compact(json.load(f))
+    else:
+        # The list of dicts is never materialised: the columns are filled while the file is read
+        list_verbs = VerbStore.from_records(iter_verbs(json_path))
+    # French infinitive -> lemmas (a few dozen entries), built now so that the completion never waits for it
+    list_verbs.build_indexes("french_index")
+    return list_verbs
+
+
+def is_compact(json_path: str) -> bool:
+    """Tells whether a .json file holds the compact layout written by nooj.py (a dict) rather than a list of dicts"""
     with open(json_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        return f.read(64).lstrip().startswith("{")
+
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
-def get_tenses(list_verbs) -> list[str]:
+def iter_verbs(json_path: str, chunk_size: int = 1 << 16):
+    """Yields the verbs of a .json file (or of a .bin file) one by one, reading the file chunk by chunk
+
+    *Input* (two)
+    verbs_path = path to a json or bin file (str)
+    chunk_size = number of characters read at once (int)
+
+    *Output* (one)
+    generator of dicts (one per inflected form), only one chunk of the file being in memory at a time
+    """
+    if json_path.endswith(".bin"):
+        yield from VerbStore.open_binary(json_path)
+        return
+    if is_compact(json_path):
+        yield from get_verbs(json_path)
+        return
+
+    decoder = json.JSONDecoder()
+    with open(json_path, "r", encoding="utf-8") as f:
+        buffer = f.read(chunk_size)
+        pos = WHITESPACE.match(buffer).end()
+        if buffer[pos : pos + 1] != "[":
+            raise ValueError(f"{json_path} does not contain a list of verbs")
+        pos += 1
+
+        while True:
+            # Skip the whitespace and the comma between two verbs
+            pos = WHITESPACE.match(buffer, pos).end()
+            if buffer[pos : pos + 1] == ",":
+                pos = WHITESPACE.match(buffer, pos + 1).end()
+            if buffer[pos : pos + 1] == "]":
+                return
+            try:
+                verb, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The verb is cut by the end of the chunk: read the next one
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            yield verb
+
+
+def get_manifest(manifest_path: str) -> dict | None:
+    """Loads the manifest written by nooj.py next to the data (tenses, groups, moods, voices, counts, content hashes)
+
+    *Input* (one)
+    manifest_path = path to the manifest (str)
+
+    *Output* (one)
+    manifest (dict) = the manifest, or None if there is no manifest
+        => Ex: {"tenses": ["futur", ...], "groups": [0, 1, 2, 3, 4, 5], "moods": [...], "voices": [...], "counts": {...}, "sha256": {...}, "sizes": {...}}
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def check_manifest(manifest: dict, data_path: str, full: bool = False) -> bool:
+    """Checks that the data file is the one described by the manifest
+
+    The size of the file is compared at each start (a stat, much cheaper than loading the file);
+    its content hash only with full=True (--debug), or when the manifest has no sizes (older nooj.py).
+
+    *Input* (three)
+    manifest (dict) = the manifest written by nooj.py
+    data_path (str) = path to the json or bin file which has been loaded
+    full (bool) = also compare the content hash of the file
+
+    *Output* (one)
+    True if the file matches the manifest, False otherwise
+    """
+    name = os.path.basename(data_path)
+    size = manifest.get("sizes", {}).get(name)
+    if size is not None:
+        if os.path.getsize(data_path) != size:
+            return False
+        if not full:
+            return True
+    with open(data_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest() == manifest["sha256"].get(name)
+
+
+def get_tenses(list_verbs: VerbStore) -> list[str]:
     """Gets all the tenses available in the list of inflected forms and lists them (only once each) in a dedicated list.
 
     *Input* (one)
-    list_verbs = list of dicts (one per inflected form)
+    list_verbs = VerbStore (one row per inflected form)
 
     *Output* (one)
     list_tenses (list of str) = list of all the available tenses (names in French, and only one of each) in the csv.
         => Ex: ["present", "imparfait", "futur"]
     """
 
-    list_tenses = []
-    for verb in list_verbs:
-        if verb["tense"] not in list_tenses:
-            list_tenses.append(verb["tense"])
-    return list_tenses
+    return list_verbs.values("tense")
 
 
-def get_groups(list_verbs) -> list[int]:
+def get_groups(list_verbs: VerbStore) -> list[int]:
     """Gets all the verb groups available in the list of potential questions/answers (0, 1, 2, 3 or 4) and lists them (only once each) in a dedicated list.
 
     *Input* (one)
-    list_verbs = list of dicts (one per inflected form)
+    list_verbs = VerbStore (one row per inflected form)
 
     *Output* (one)
     list_groups (list of int) = list of the groups (0, 1, 2, 3, 4 and 5).
         => Ex: [0, 1, 3]
     """
 
-    list_groups = []
-    for verb in list_verbs:
-        if verb["group"] not in list_groups:
-            list_groups.append(verb["group"])
-    list_groups.sort()
-
-    return list_groups
+    return [int(group) for group in np.unique(list_verbs.group[list_verbs.rows])]
 
 
-def filter_tense(tense_user: list[str]|None, list_verbs) -> list[dict]:
+def filter_tense(tense_user: list[str]|None, list_verbs: VerbStore) -> VerbStore:
     """Filters the list of potential questions/answers (list_verbs) so as to keep only those matching the user's choice regarding the tense, if applicable.
 
     From main():
@@ -67,25 +194,18 @@ def filter_tense(tense_user: list[str]|None, list_verbs) -> list[dict]:
     *Input* (two)
     tense_user (str) = the user's choice regarding the tense (if applicable).
         => Ex: "présent"
-    list_verbs = list of dicts (one per inflected form)
+    list_verbs = VerbStore (one row per inflected form)
 
     *Output* (one)
-    filtered_verbs (list of dict) = list of all the potential questions/answers, filtered according to the user's choice regarding the tense.
+    filtered_verbs (VerbStore) = view on all the potential questions/answers, filtered according to the user's choice regarding the tense.
         => Ex: a list with only the verbs in present.
-    OR list_verbs (list of dict) = the output is the same as the input when the user has declared no choice regarding the tense.
+    OR list_verbs (VerbStore) = the output has the same rows as the input when the user has declared no choice regarding the tense.
     """
 
-    filtered_verbs = []
-    if tense_user:
-        for verb in list_verbs:
-            if verb["tense"] in tense_user:
-                filtered_verbs.append(verb)
-        return filtered_verbs
-    else:
-        return list_verbs
+    return list_verbs.filter(tense=tense_user)
 
 
-def filter_group(group_user: list[int]|None, list_verbs) -> list[dict]:
+def filter_group(group_user: list[int]|None, list_verbs: VerbStore) -> VerbStore:
     """Filters the list of potential questions/answers (list_verbs) so as to keep only those matching the user's choice regarding the verb group, if applicable.
 
     From main():
@@ -95,25 +215,18 @@ def filter_group(group_user: list[int]|None, list_verbs) -> list[dict]:
     *Input* (two)
     group_user (int) = the user's choice regarding the verb group (if applicable).
         => Ex: "2"
-    list_verbs = list of dicts (one per inflected form)
+    list_verbs = VerbStore (one row per inflected form)
 
     *Output* (one)
-    filtered_verbs (list of dict) = list of all the potential questions/answers, filtered according to the user's choice regarding the verb group.
+    filtered_verbs (VerbStore) = view on all the potential questions/answers, filtered according to the user's choice regarding the verb group.
         => Ex: a list with only the verbs of the second group.
-    OR list_verbs (list of dict) = the output is the same as the input when the user has declared no choice regarding the verb group.
+    OR list_verbs (VerbStore) = the output has the same rows as the input when the user has declared no choice regarding the verb group.
     """
 
-    filtered_verbs = []
-    if group_user:
-        for verb in list_verbs:
-            if verb["group"] in group_user:
-                filtered_verbs.append(verb)
-        return filtered_verbs
-    else:
-        return list_verbs
+    return list_verbs.filter(group=group_user)
 
 
-def filter_person(person_user: list[int]|None, list_verbs) -> list[dict]:
+def filter_person(person_user: list[int]|None, list_verbs: VerbStore) -> VerbStore:
     """Filters the list of potential questions/answers (list_verbs) so as to keep only those matching the user's choice regarding the person, if applicable.
 
     From main():
@@ -123,25 +236,18 @@ def filter_person(person_user: list[int]|None, list_verbs) -> list[dict]:
     *Input* (two)
     person_user (int) = the user's choice regarding the person (if applicable).
         => Ex: "4"
-    list_verbs = list of dicts (one per inflected form)
+    list_verbs = VerbStore (one row per inflected form)
 
     *Output* (one)
-    filtered_verbs (list of dict) = list of all the potential questions/answers, filtered according to the user's choice regarding the person.
+    filtered_verbs (VerbStore) = view on all the potential questions/answers, filtered according to the user's choice regarding the person.
         => Ex: a list with all the verbs, but only conjugated at the fourth person ("we").
-    OR list_verbs (list of dict) = the output is the same as the input when the user has declared no choice regarding the person.
+    OR list_verbs (VerbStore) = the output has the same rows as the input when the user has declared no choice regarding the person.
     """
 
-    filtered_verbs = []
-    if person_user:
-        for verb in list_verbs:
-            if verb["person"] in person_user:
-                filtered_verbs.append(verb)
-        return filtered_verbs
-    else:
-        return list_verbs
+    return list_verbs.filter(person=person_user)
 
 
-def filter_voice(voice_user, list_verbs) -> list[dict]:
+def filter_voice(voice_user, list_verbs: VerbStore) -> VerbStore:
     """Filters the list of potential questions/answers (list_verbs) so as to keep only those matching the user's choice regarding the voice, if applicable.
 
     From main():
@@ -151,25 +257,18 @@ def filter_voice(voice_user, list_verbs) -> list[dict]:
     *Input* (two)
     voice_user (str) = the user's choice regarding the voice (if applicable).
         => Ex: "active"
-    list_verbs = list of dicts (one per inflected form)
+    list_verbs = VerbStore (one row per inflected form)
 
     *Output* (one)
-    filtered_verbs (list of dict) = list of all the potential questions/answers, filtered according to the user's choice regarding the voice.
+    filtered_verbs (VerbStore) = view on all the potential questions/answers, filtered according to the user's choice regarding the voice.
         => Ex: a list with all the verbs, but only conjugated at the passive voice.
-    OR list_verbs (list of dict) = the output is the same as the input when the user has declared no choice regarding the voice.
+    OR list_verbs (VerbStore) = the output has the same rows as the input when the user has declared no choice regarding the voice.
     """
 
-    filtered_verbs = []
-    if voice_user:
-        for verb in list_verbs:
-            if verb["voice"] == voice_user:
-                filtered_verbs.append(verb)
-        return filtered_verbs
-    else:
-        return list_verbs
+    return list_verbs.filter(voice=voice_user)
 
 
-def filter_mood(mood_user, list_verbs) -> list[dict]:
+def filter_mood(mood_user, list_verbs: VerbStore) -> VerbStore:
     """Filters the list of potential questions/answers (list_verbs) so as to keep only those matching the user's choice regarding the mood, if applicable.
 
     From main():
@@ -179,38 +278,54 @@ def filter_mood(mood_user, list_verbs) -> list[dict]:
     *Input* (two)
     mood_user (str) = the user's choice regarding the mood (if applicable).
         => Ex: "active"
-    list_verbs = list of dicts (one per inflected form)
+    list_verbs = VerbStore (one row per inflected form)
 
     *Output* (one)
-    filtered_verbs (list of dict) = list of all the potential questions/answers, filtered according to the user's choice regarding the mood.
+    filtered_verbs (VerbStore) = view on all the potential questions/answers, filtered according to the user's choice regarding the mood.
         => Ex: a list with all the verbs, but only conjugated at the subjonctive mood.
-    OR list_verbs (list of dict) = the output is the same as the input when the user has declared no choice regarding the mood.
+    OR list_verbs (VerbStore) = the output has the same rows as the input when the user has declared no choice regarding the mood.
     """
-    filtered_verbs = []
-    if mood_user:
-        for verb in list_verbs:
-            if verb["mood"] == mood_user:
-                filtered_verbs.append(verb)
-        return filtered_verbs
-    else:
-        return list_verbs
+    return list_verbs.filter(mood=mood_user)
+
+
+def filter_verbs(list_verbs: VerbStore, tense_user=None, group_user=None, person_user=None, voice_user=None, mood_user=None) -> VerbStore:
+    """Filters the list of potential questions/answers according to all the user's choices at once.
+
+    Equivalent to chaining filter_tense(), filter_group(), filter_person(), filter_voice() and filter_mood(),
+    but the choices are combined into a single boolean mask over the columns of the store.
+
+    *Input* (six)
+    list_verbs = VerbStore (one row per inflected form)
+    tense_user, group_user, person_user, voice_user, mood_user = the user's choices (None when not applicable)
+
+    *Output* (one)
+    filtered_verbs (VerbStore) = view on the potential questions/answers matching all the user's choices.
+    """
+
+    return list_verbs.filter(
+        tense=tense_user,
+        group=group_user,
+        person=person_user,
+        voice=voice_user,
+        mood=mood_user,
+    )
 
 
-def random_verb(list_verbs: list[dict]) -> dict:
+def random_verb(list_verbs: VerbStore) -> dict:
     """Randomly picks a line (dict) randomly from the list of all potential questions/answers (list of dict), which might have been previously filtered according to the user's choice, when applicable.
 
     From main():
     chosen_verb = random_verb(filtered_verbs)
 
     *Input* (one)
-    list_verbs = list of dicts (one per inflected form)
+    list_verbs = VerbStore (one row per inflected form)
 
     *Output* (one)
     a dict corresponding to a verb in latin, conjugated to one person and one tense, and its translation in French, as well as its Latin and French infinitive and primitive tenses
         => Ex: {amare;aimer;1;actif;imparfait;1;amabam;j'aimais;amo, as, are, avi, atum}
     """
 
-    return random.choice(list_verbs)
+    return list_verbs.record(random.choice(list_verbs.rows))
 
 
 def ask(message: str, validator, error_message):
@@ -226,205 +341,186 @@ def ask(message: str, validator, error_message):
             print(error_message)
 
 
-def ask_verb(verb, list_verbs) -> int:
-    score = 0
-
-    # Logique de l'entonnoir : construire le vivier de profils valides
-    # (toutes les entrées partageant la même forme latine)
-    valid_profiles = [v for v in list_verbs if v["latin"] == verb["latin"]]
-
-    if debug:
-        print(f"Profils valides pour '{verb['latin']}' : {len(valid_profiles)}")
-
-    print("Nouveau verbe à trouver :", verb["latin"])
-
-    # Personne (1 à 6)
-    while True:
-        valid_persons = list(set(p["person"] for p in valid_profiles))
-        if debug:
-            print("Personnes acceptées :", valid_persons)
-        person_input = int(
-            ask(
-                "Indiquer la personne (de 1 à 6) : ",
-                lambda x: int(x) in range(1, 7),
-                "La personne doit être comprise entre 1 et 6.",
-            )
+# Messages of the CLI for each step of a question (see quiz.py)
+ACCEPTED_MESSAGES = {
+    "person": "Personnes acceptées :",
+    "tense": "Temps acceptés :",
+    "voice": "Voix acceptées :",
+    "mood": "Modes acceptés :",
+    "translation": "Traductions acceptées :",
+    "latin": "Formes latines acceptées :",
+}
+
+
+def french_completer(list_verbs: VerbStore):
+    """readline completer of the French infinitives (see VerbStore.french_index): "cond" + Tab -> "conduire" """
+    completions = []
+
+    def completer(text, state):
+        # readline asks for the completions one by one (state = 0, 1...) until it gets None
+        if state == 0:
+            completions[:] = [label for label, _ in list_verbs.french_index.complete(text, limit=None)]
+        return completions[state] if state < len(completions) else None
+
+    return completer
+
+
+def input_french(message: str, list_verbs: VerbStore | None) -> str:
+    """input(), with the completion of the French infinitives (Tab) while the answer is typed"""
+    if readline is None or list_verbs is None:
+        return input(message)
+    completer, delims = readline.get_completer(), readline.get_completer_delims()
+    readline.set_completer(french_completer(list_verbs))
+    # The whole line is completed ("considérer comme"), not only its last word
+    readline.set_completer_delims("")
+    readline.parse_and_bind("bind ^I rl_complete" if "libedit" in (readline.__doc__ or "") else "tab: complete")
+    try:
+        return input(message)
+    finally:
+        readline.set_completer(completer)
+        readline.set_completer_delims(delims)
+
+
+def ask_step(step: str, verb: dict, list_verbs: VerbStore | None = None) -> str:
+    """Asks the user the answer of a step of the question (see quiz.py)"""
+    if step == "person":
+        return ask(
+            "Indiquer la personne (de 1 à 6) : ",
+            lambda x: int(x) in range(1, 7),
+            "La personne doit être comprise entre 1 et 6.",
         )
-        if person_input in valid_persons:
-            valid_profiles = [p for p in valid_profiles if p["person"] == person_input]
-            score += 1
-            print("Bravo !")
-            break
-        else:
-            print("Mauvaise réponse ! Errare humanum est...")
-            choice_user = int(
-                ask(
-                    "Essayer à nouveau cette question (1), voir les temps primitifs (2) ou voir la réponse (3) ? ",
-                    lambda x: int(x) in range(1, 4),
-                    "La réponse doit être comprise entre 1 et 3.",
-                )
-            )
-            if choice_user == 1:
-                continue
-            elif choice_user == 2:
-                print("Voici les temps primitifs :", verb["primitive tenses"])
-            elif choice_user == 3:
-                print(", ".join(str(p) for p in valid_persons))
-                break
-
-    # Temps (présent, imparfait, futur, parfait, plus-que-parfait ou futur antérieur)
-    while True:
-        valid_tenses = list(set(p["tense"] for p in valid_profiles))
-        if debug:
-            print("Temps acceptés :", valid_tenses)
+    if step == "tense":
         print(
             "Temps possibles : présent, imparfait, futur, parfait, plus-que-parfait ou futur antérieur"
         )
-        tense_input = input("Réponse : ").strip().lower()
-        if tense_input in valid_tenses:
-            valid_profiles = [p for p in valid_profiles if p["tense"] == tense_input]
-            score += 1
-            print("Bravo !")
-            break
-        else:
-            print("Mauvaise réponse ! Errare humanum est...")
-            choice_user = int(
-                ask(
-                    "Essayer à nouveau cette question (1), voir les temps primitifs (2) ou voir la réponse (3) ? ",
-                    lambda x: int(x) in range(1, 4),
-                    "La réponse doit être comprise entre 1 et 3.",
-                )
-            )
-            if choice_user == 1:
-                continue
-            elif choice_user == 2:
-                print("Voici les temps primitifs :", verb["primitive tenses"])
-            elif choice_user == 3:
-                print(", ".join(valid_tenses))
-                break
-
-    # Voix (passif, actif ou déponent)
-    while True:
-        valid_voices = list(set(p["voice"] for p in valid_profiles))
-        if debug:
-            print("Voix acceptées :", valid_voices)
-        voice_input = ask(
+        return input("Réponse : ")
+    if step == "voice":
+        return ask(
             "Indiquer la voix (actif, passif ou déponent) : ",
             lambda x: x.lower() in ["actif", "passif", "déponent"],
             "La réponse doit être 'actif', 'passif' ou 'déponent'.",
         )
+    if step == "mood":
+        return input("Indiquer le mode (indicatif, subjonctif ou impératif) : ")
+    if step == "translation":
+        return input_french("Indiquer la traduction en français (à l'infinitif) : ", list_verbs)
+    return ask(
+        f"Indiquer la forme fléchie pour le(s) verbe(s) '{", ".join(verb["translation"])}', à la {personne(verb["person"])}, {verb["tense"]}, {verb["voice"]}, {verb["mood"]} : ",
+        lambda x: x,
+        "Veuillez indiquer une réponse.",
+    )
 
-        if voice_input in valid_voices:
-            valid_profiles = [p for p in valid_profiles if p["voice"] == voice_input]
-            score += 1
-            print("Bravo !")
-            break
-        else:
-            print("Mauvaise réponse ! Errare humanum est...")
-            choice_user = int(
-                ask(
-                    "Essayer à nouveau cette question (1), voir les temps primitifs (2) ou voir la réponse (3) ? ",
-                    lambda x: int(x) in range(1, 4),
-                    "La réponse doit être comprise entre 1 et 3.",
-                )
-            )
-            if choice_user == 1:
-                continue
-            elif choice_user == 2:
-                print("Voici les temps primitifs :", verb["primitive tenses"])
-            elif choice_user == 3:
-                print(", ".join(valid_voices))
-                break
 
-    # Mode (indicatif, subjonctif ou impératif)
-    while True:
-        valid_moods = list(set(p["mood"] for p in valid_profiles))
+# Choices offered after a wrong answer, by direction (and for the translation step)
+RETRY_CHOICES = {
+    "latin": (
+        ["retry", "primitive tenses", "reveal"],
+        "Essayer à nouveau cette question (1), voir les temps primitifs (2) ou voir la réponse (3) ? ",
+    ),
+    "translation": (
+        ["retry", "reveal"],
+        "Essayer à nouveau cette question (1) ou voir la réponse (2) ? ",
+    ),
+    "français": (
+        ["retry", "primitive tenses", "lemma", "reveal"],
+        "Essayer à nouveau cette question (1), voir les temps primitifs (2), voir le lemme (3) ou voir la réponse (4) ? ",
+    ),
+}
+
+
+def ask_question(quiz: Quiz) -> int:
+    """Thin adapter of the quiz engine (quiz.py) to the terminal: asks each step of the current question
+    until it is answered or revealed, and returns the score of the question
+    """
+    while not quiz.done:
+        step = quiz.step
         if debug:
-            print("Modes acceptés :", valid_moods)
-        mood_input = (
-            input("Indiquer le mode (indicatif, subjonctif ou impératif) : ").strip().lower()
-        )
-        if mood_input in valid_moods:
-            valid_profiles = [p for p in valid_profiles if p["mood"] == mood_input]
-            score += 1
+            print(ACCEPTED_MESSAGES[step], quiz.accepted(step))
+        result = quiz.submit(step, ask_step(step, quiz.verb, quiz.list_verbs))
+        if result["correct"]:
             print("Bravo !")
-            break
-        else:
-            print("Mauvaise réponse ! Errare humanum est...")
-            choice_user = int(
-                ask(
-                    "Essayer à nouveau cette question (1), voir les temps primitifs (2) ou voir la réponse (3) ? ",
-                    lambda x: int(x) in range(1, 4),
-                    "La réponse doit être comprise entre 1 et 3.",
-                )
-            )
-            if choice_user == 1:
-                continue
-            elif choice_user == 2:
-                print("Voici les temps primitifs :", verb["primitive tenses"])
-            elif choice_user == 3:
-                print(", ".join(valid_moods))
-                break
-
-    # Traduction : accepter toutes les traductions des profils restants
-    all_translations = set()
-    for p in valid_profiles:
-        all_translations.update(p["translation"])
+            continue
 
-    while True:
-        if debug:
-            print("Traductions acceptées :", all_translations)
-        translation_input = (
-            input("Indiquer la traduction en français (à l'infinitif) : ")
-            .strip()
-            .lower()
-        )
-        if translation_input in all_translations:
-            score += 1
-            print("Bravo !")
-            break
-        else:
-            print("Mauvaise réponse ! Errare humanum est...")
-            choice_user = int(
-                ask(
-                    "Essayer à nouveau cette question (1) ou voir la réponse (2) ? ",
-                    lambda x: int(x) in range(1, 3),
-                    "La réponse doit être comprise entre 1 et 2.",
-                )
+        print("Mauvaise réponse ! Errare humanum est...")
+        if result.get("suggestions"):
+            print(f"Vouliez-vous dire : {" ou ".join(result["suggestions"])} ?")
+        choices, message = RETRY_CHOICES["translation" if step == "translation" else quiz.direction]
+        choice_user = int(
+            ask(
+                message,
+                lambda x: int(x) in range(1, len(choices) + 1),
+                f"La réponse doit être comprise entre 1 et {len(choices)}.",
             )
-            if choice_user == 1:
-                continue
-            elif choice_user == 2:
-                print(", ".join(all_translations))
-                break
+        )
+        choice = choices[choice_user - 1]
+        if choice == "primitive tenses":
+            print("Voici les temps primitifs :", quiz.hint(choice)["value"])
+        elif choice == "lemma":
+            print("Voici le lemme :", quiz.hint(choice)["value"])
+        elif choice == "reveal":
+            print(", ".join(str(answer) for answer in quiz.reveal(step)["answers"]))
 
-    return score
+    return quiz.score
 
 
-def ask_verbs(verbs: list[dict], direction):
-    rounds_input = int(
-        ask(
-            "Combien de verbes voulez-vous pratiquer (entre 1 et 10) ? ",
-            lambda x: int(x) in range(1, 11),
-            "Entrez un nombre compris entre 1 et 10",
-        )
-    )
-    total_score = 0
+def ask_verb(verb, list_verbs: VerbStore, quiz: Quiz | None = None) -> int:
+    quiz = quiz or Quiz(list_verbs)
+    question = quiz.start_question(verb, "latin")
 
-    for _ in range(rounds_input):
-        verb = random_verb(verbs)
+    if debug:
+        print(f"Profils valides pour '{verb['latin']}' : {len(quiz.profiles)}")
 
-        if not direction:
-            choice = random.choice(["latin", "français"])
-        else:
-            choice = direction
+    print("Nouveau verbe à trouver :", question["prompt"]["latin"])
+    return ask_question(quiz)
 
-        if choice == "latin":
-            score = ask_verb(verb, verbs) / 5
-        elif choice == "français":
-            score = ask_verb_reverse(verb, verbs)
 
-        total_score += score
+def ask_verbs(verbs: VerbStore, direction, scheduler: Scheduler | None = None, progress: ProgressSession | None = None):
+    """Asks a series of questions. With a scheduler (spaced repetition), the verbs already mastered are asked less often.
+    With a progress session (see progress.py), the answers are saved, and an interrupted session is resumed where it stopped.
+    """
+    if progress is not None and progress.round:
+        rounds_input = progress.rounds
+        total_score = progress.total_score
+        print(f"Reprise de la partie : verbe {progress.round + 1} sur {rounds_input}")
+    else:
+        rounds_input = int(
+            ask(
+                "Combien de verbes voulez-vous pratiquer (entre 1 et 10) ? ",
+                lambda x: int(x) in range(1, 11),
+                "Entrez un nombre compris entre 1 et 10",
+            )
+        )
+        total_score = 0
+        if progress is not None:
+            progress.rounds = rounds_input
+
+    try:
+        for _ in range(progress.round if progress is not None else 0, rounds_input):
+            if scheduler is None:
+                verb = random_verb(verbs)
+            else:
+                item, verb = scheduler.draw()
+
+            if not direction:
+                choice = random.choice(["latin", "français"])
+            else:
+                choice = direction
+
+            quiz = Quiz(verbs)
+            if choice == "latin":
+                score = ask_verb(verb, verbs, quiz) / 5
+            elif choice == "français":
+                score = ask_verb_reverse(verb, verbs, quiz)
+
+            if scheduler is not None:
+                scheduler.update(item, score)
+            if progress is not None:
+                progress.record_question(quiz, scheduler.box(item) if scheduler is not None else 0)
+            total_score += score
+    finally:
+        # The answers are written once per session (or when interrupted, so that the session can be resumed)
+        if progress is not None:
+            progress.flush()
     print(f"Score total : {total_score}/{rounds_input}")
     print("Prêt-e pour une nouvelle partie ?")
 
@@ -439,74 +535,67 @@ def personne(person: int) -> str:
     return f"{person}e personne du {nb}"
 
 
-def ask_verb_reverse(verb, list_verbs) -> int:
-    score = 0
-
-    # Construire la liste de toutes les formes latines acceptées (syncrétisme + synonymes)
-    verb_translations = set(verb["translation"])
-    accepted_latins = [
-        v["latin"] for v in list_verbs
-        if v["person"] == verb["person"]
-        and v["tense"] == verb["tense"]
-        and v["voice"] == verb["voice"]
-        and v["mood"] == verb["mood"]
-        and bool(set(v["translation"]) & verb_translations)
-    ]
-
-    if debug:
-        print("Formes latines acceptées :", accepted_latins)
-
-    while True:
-        answer = ask(
-            f"Indiquer la forme fléchie pour le(s) verbe(s) '{", ".join(verb["translation"])}', à la {personne(verb["person"])}, {verb["tense"]}, {verb["voice"]}, {verb["mood"]} : ",
-            lambda x: x,
-            "Veuillez indiquer une réponse.",
-        )
-        if answer in accepted_latins:
-            score += 1
-            print("Bravo !")
-            break
-        else:
-            print("Mauvaise réponse ! Errare humanum est...")
-            choice_user = int(
-                ask(
-                    "Essayer à nouveau cette question (1), voir les temps primitifs (2), voir le lemme (3) ou voir la réponse (4) ? ",
-                    lambda x: int(x) in range(1, 5),
-                    "La réponse doit être comprise entre 1 et 4.",
-                )
-            )
-            if choice_user == 1:
-                continue
-            if choice_user == 2:
-                print("Voici les temps primitifs :", verb["primitive tenses"])
-            if choice_user == 3:
-                print("Voici le lemme :", verb["lemma"])
-            if choice_user == 4:
-                print(", ".join(accepted_latins))
-                break
-
-    return score
+def ask_verb_reverse(verb, list_verbs: VerbStore, quiz: Quiz | None = None) -> int:
+    quiz = quiz or Quiz(list_verbs)
+    quiz.start_question(verb, "français")
+    return ask_question(quiz)
 
 
 def main():
     """
-    #1 get_verbs(): Loads all the verbs from a CSV file (format in README.md)
-    #2(a) get_tenses(): Gets all the tenses available in the list of potential questions/answers (present, future,...) and lists them (only once each) in a dedicated list.
-    #2(b) get_groups(): Gets all the verb groups available in the list of potential questions/answers (0, 1, 2, 3 or 4) and lists them (only once each) in a dedicated list.
+    #1 get_manifest(): Loads the tenses and groups available from the manifest written by nooj.py, so that the CLI params can be parsed without loading the verbs
+    #2(a) get_tenses(): (without manifest) Gets all the tenses available in the list of potential questions/answers (present, future,...) and lists them (only once each) in a dedicated list.
+    #2(b) get_groups(): (without manifest) Gets all the verb groups available in the list of potential questions/answers (0, 1, 2, 3 or 4) and lists them (only once each) in a dedicated list.
+    #2(d) get_verbs(): Loads all the verbs from the binary dataset or the JSON file, once the CLI params are valid
     #2(c): We assume that all the persons (I, you, he...) are in the list of potential questions/answers so we don't list them
-    #3 filter_tense() filter_group() filter_person(): Filters the list of potential questions/answers (list_verbs) so as to keep only those matching the user's choice regarding the tense / verb group / person, if applicable.
+    #3 filter_verbs(): Filters the list of potential questions/answers (list_verbs) so as to keep only those matching the user's choice regarding the tense / verb group / person / voice / mood, if applicable.
     #4 random_verb(): Randomly picks a line (dict) randomly from the list of all potential questions/answers (list of dict), which might have been previously filtered according to the user's choice, when applicable.
+    (or Scheduler.draw(), see scheduler.py: the verbs already answered correctly are picked less often, unless --aleatoire)
+    (--eleve: the boxes of the scheduler are restored from the progress of the learner, and an interrupted session can be resumed, see progress.py)
     #5 ask_verbs(): Displays a verb in Latin or in French and asks the user to write the answer in input. Checks the answer's format. If not valid, the user must try again
+    (grade: the answers of a file are graded with the same rules, see grade.py)
+    (analyse: all the analyses of Latin forms, see analyser.py)
+    (annotate: the verb forms of a Latin text and their frequencies, see annotate.py)
     """
 
+    # Batch mode (grading of a file of answers): python scripts/magister.py grade --input answers.jsonl --jobs N
+    if sys.argv[1:2] == ["grade"]:
+        import grade
+
+        grade.main(sys.argv[2:])
+        return
+
+    # Morphological analysis of Latin forms: python scripts/magister.py analyse amauit "amatus sum"
+    if sys.argv[1:2] == ["analyse"]:
+        import analyser
+
+        analyser.main(sys.argv[2:])
+        return
+
+    # Verb forms of a Latin text: python scripts/magister.py annotate texte.txt --frequences frequences.json --jobs N
+    if sys.argv[1:2] == ["annotate"]:
+        import annotate
+
+        annotate.main(sys.argv[2:])
+        return
+
     ###
-    # Load JSON files from a folder
+    # Load the manifest (or the JSON files if there is none)
     ###
 
-    verbs_latin_path = "verbs_latin.json"
-    list_verbs = get_verbs(verbs_latin_path)
-    list_tenses = get_tenses(list_verbs)
-    list_groups = get_groups(list_verbs)
+    verbs_latin_path = default_verbs_path()
+
+    # The manifest is enough to build the CLI params: the verbs are only loaded once they are valid
+    manifest_path = "verbs_latin.manifest.json"
+    manifest = get_manifest(manifest_path)
+    if manifest:
+        list_verbs = None
+        list_tenses = manifest["tenses"]
+        list_groups = manifest["groups"]
+    else:
+        list_verbs = get_verbs(verbs_latin_path)
+        list_tenses = get_tenses(list_verbs)
+        list_groups = get_groups(list_verbs)
 
     ###
     # Get CLI params
@@ -568,8 +657,27 @@ def main():
         default=None,
         help="Le mode (indicatif, subjonctif ou impératif) que vous souhaitez pratiquer",
     )
+    parser.add_argument(
+        "-e",
+        "--eleve",
+        type=str,
+        default=None,
+        help=f"Le nom de l'élève, pour enregistrer sa progression (dans {PROGRESS_PATH}) et reprendre une partie interrompue",
+    )
+    parser.add_argument(
+        "--faibles",
+        action="store_true",
+        help="afficher les formes les moins maîtrisées par l'élève (avec --eleve)",
+    )
+    parser.add_argument(
+        "--aleatoire",
+        action="store_true",
+        help="tirer les verbes au hasard, sans revenir plus souvent sur les formes les moins maîtrisées",
+    )
     parser.add_argument("--debug", action="store_true", help="activer le mode debug")
     args = parser.parse_args()
+    if args.faibles and not args.eleve:
+        parser.error("--faibles nécessite --eleve")
 
     direction_user = args.direction
     tense_user = args.temps
@@ -581,6 +689,59 @@ def main():
     global debug
     debug = args.debug
 
+    ###
+    # Progress of the learner (see progress.py)
+    ###
+
+    progress_store = progress = None
+    if args.eleve:
+        progress_store = ProgressStore(PROGRESS_PATH)
+        if args.faibles:
+            for item in progress_store.weakest(args.eleve):
+                print(
+                    f"{item['latin']} ({item['lemma']}, {personne(item['person'])}, {item['tense']}, {item['voice']}, {item['mood']}) :"
+                    f" {item['failures']} échec(s) sur {item['questions']} question(s)"
+                )
+            return
+
+        progress = progress_store.resume_session(args.eleve)
+        if progress is not None:
+            resume = ask(
+                f"Une partie interrompue a été trouvée (verbe {progress.round + 1} sur {progress.rounds}). La reprendre (o/n) ? ",
+                lambda x: x.lower() in ["o", "n"],
+                "La réponse doit être 'o' ou 'n'.",
+            )
+            if resume.lower() == "o":
+                # The session is resumed with its own direction and filters
+                direction_user = progress.settings["direction"]
+                tense_user = progress.settings["temps"]
+                group_user = progress.settings["groupe"]
+                person_user = progress.settings["personne"]
+                voice_user = progress.settings["voix"]
+                mood_user = progress.settings["mode"]
+            else:
+                progress_store.abandon_session(progress)
+                progress = None
+        if progress is None:
+            settings = {
+                "direction": direction_user,
+                "temps": tense_user,
+                "groupe": group_user,
+                "personne": person_user,
+                "voix": voice_user,
+                "mode": mood_user,
+            }
+            progress = progress_store.start_session(args.eleve, settings)
+
+    ###
+    # Load JSON files from a folder
+    ###
+
+    if list_verbs is None:
+        list_verbs = get_verbs(verbs_latin_path)
+        if not check_manifest(manifest, verbs_latin_path, full=debug):
+            print(f"Attention : {manifest_path} n'est pas à jour, relancer scripts/nooj.py")
+
     ###
     # Filter verbs according to params
     ###
@@ -588,11 +749,9 @@ def main():
     if debug:
         print(f"Loaded {len(list_verbs)} from {verbs_latin_path}")
 
-    filtered_verbs = filter_tense(tense_user, list_verbs)
-    filtered_verbs = filter_group(group_user, filtered_verbs)
-    filtered_verbs = filter_person(person_user, filtered_verbs)
-    filtered_verbs = filter_voice(voice_user, filtered_verbs)
-    filtered_verbs = filter_mood(mood_user, filtered_verbs)
+    filtered_verbs = filter_verbs(
+        list_verbs, tense_user, group_user, person_user, voice_user, mood_user
+    )
     if len(filtered_verbs) == 0:
         print("Aucun verbe disponible pour ces options")
         sys.exit(1)
@@ -600,7 +759,10 @@ def main():
     if debug:
         print(f"Kept {len(filtered_verbs)} after filtering")
 
-    ask_verbs(filtered_verbs, direction_user)
+    scheduler = Scheduler(filtered_verbs, uniform=args.aleatoire)
+    if progress_store is not None:
+        progress_store.restore(scheduler, args.eleve)
+    ask_verbs(filtered_verbs, direction_user, scheduler, progress)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+import unicodedata
+from bisect import bisect_left, bisect_right
+
+# Latin spelling: "v" and "j" are later spellings of "u" and "i" (see the README), the dataset only uses "u" and "i"
+LATIN_LETTERS = str.maketrans({"v": "u", "j": "i"})
+# Maximum Levenshtein distance of a suggestion (see Matcher.suggest())
+MAX_DISTANCE = 2
+
+
+def fold(text: str) -> str:
+    """Normalise an answer for comparison: case, accents, apostrophes and whitespace"""
+    text = unicodedata.normalize("NFKD", text.lower().replace("’", "'"))
+    return " ".join("".join(char for char in text if not unicodedata.combining(char)).split())
+
+
+def fold_latin(text: str) -> str:
+    """Same as fold(), and u/v, i/j are interchangeable"""
+    return fold(text).translate(LATIN_LETTERS)
+
+
+def distance(a: str, b: str) -> int:
+    """Levenshtein distance (insertion, deletion or substitution of one character)"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def deletions(word: str) -> set[str]:
+    """The word and all the words obtained by deleting one of its characters"""
+    return {word} | {word[:i] + word[i + 1 :] for i in range(len(word))}
+
+
+class Matcher:
+    """Index of the known answers of a step (the Latin forms or the French translations) by their normalised
+    spelling: an answer is matched with a dict lookup, whatever its case, accents, spaces or u/v, i/j
+
+    The suggestions come from a second index, built the first time a suggestion is asked for: each normalised
+    answer is indexed under itself and under each of its deletions of one character (symmetric deletion). Two
+    words share a key when they differ by a substitution, an insertion, a deletion or a transposition of two
+    characters, so the candidates of a misspelled answer are found with a few lookups instead of a scan.
+
+    example:
+        matcher = Matcher(["amaui", "amatus sum"], fold_latin)
+        matcher.match(" Amavi ")   # ["amaui"]
+        matcher.suggest("amaiu")   # ["amaui"]
+    """
+
+    def __init__(self, answers, normalise=fold):
+        self.normalise = normalise
+        self.index = {}
+        for answer in answers:
+            self.index.setdefault(normalise(answer), []).append(answer)
+        self.neighbours = None
+
+    def match(self, answer: str) -> list[str]:
+        """Known answers spelled as the given answer (empty if it is not a known answer)"""
+        # An answer already normalised (the usual case) is found without normalising it again
+        return self.index.get(answer) or self.index.get(self.normalise(answer), [])
+
+    def suggest(self, answer: str, limit: int = 3) -> list[str]:
+        """Known answers the closest to a misspelled answer ("did you mean...?"), at most MAX_DISTANCE away"""
+        if self.neighbours is None:
+            self.neighbours = {}
+            for normalised in self.index:
+                for key in deletions(normalised):
+                    self.neighbours.setdefault(key, []).append(normalised)
+        normalised = self.normalise(answer)
+        candidates = {candidate for key in deletions(normalised) for candidate in self.neighbours.get(key, [])}
+        ranked = sorted((distance(normalised, candidate), candidate) for candidate in candidates)
+        return [known for d, candidate in ranked[:limit] if 0 < d <= MAX_DISTANCE for known in self.index[candidate]]
+
+
+class PrefixIndex:
+    """Labels (ex: French infinitives) with their values (ex: the lemmas translated by each infinitive), sorted by
+    normalised label: the labels starting with a prefix are contiguous, and found with a binary search (bisect)
+    instead of a scan, so that a completion can be asked at each keystroke
+
+    example:
+        index = PrefixIndex({"conduire": ["ducere"], "connaître": ["cognoscere"]})
+        index.get("Conduire")     # ["ducere"]
+        index.complete("con")     # [("conduire", ["ducere"]), ("connaître", ["cognoscere"])]
+    """
+
+    def __init__(self, entries: dict, normalise=fold):
+        self.normalise = normalise
+        entries = sorted((normalise(label), label, list(values)) for label, values in entries.items())
+        self.keys = [key for key, _, _ in entries]
+        self.labels = [label for _, label, _ in entries]
+        self.values = [values for _, _, values in entries]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def get(self, label: str) -> list:
+        """Values of a label, whatever its case, accents or spaces (empty if it is not known)"""
+        key = self.normalise(label)
+        start = bisect_left(self.keys, key)
+        return [value for i in range(start, bisect_right(self.keys, key)) for value in self.values[i]]
+
+    def complete(self, prefix: str, limit: int | None = 10) -> list[tuple[str, list]]:
+        """(label, values) of the labels starting with prefix, in alphabetical order"""
+        prefix = self.normalise(prefix)
+        start = bisect_left(self.keys, prefix)
+        # The keys starting with prefix are all before prefix + the last character of the Unicode range
+        end = bisect_left(self.keys, prefix + "\U0010ffff", start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return [(self.labels[i], self.values[i]) for i in range(start, end)]
@@ -1,5 +1,26 @@
 import pynooj
+import argparse
+import gzip
+import hashlib
+import importlib.metadata
 import json
+import os
+import re
+import tempfile
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from pynooj.main import unescape
+
+import inflection
+from inflection import Inflector, read_entries
+from verb_store import VerbStore, write_binary
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 
 def group_inflected_forms_by_lemma(inflected_forms):
@@ -13,75 +34,119 @@ def group_inflected_forms_by_lemma(inflected_forms):
     return lemmas
 
 
-def check_inflected_forms(inflected_forms):
-    """Verify that all the necessary mood/voice/tense/person combinations have been generated by NooJ"""
+# Expected paradigm of a (non-deponent) verb: for each mood, the tenses and persons which must exist.
+# Any other mood/voice/tense/person combination must not exist.
+EXPECTED_PARADIGM = {
+    "indicatif": {
+        "tenses": ["présent", "imparfait", "futur", "parfait", "plus-que-parfait", "futur antérieur"],
+        "persons": [1, 2, 3, 4, 5, 6],
+    },
+    # No future nor future perfect in the subjunctive
+    "subjonctif": {
+        "tenses": ["présent", "imparfait", "parfait", "plus-que-parfait"],
+        "persons": [1, 2, 3, 4, 5, 6],
+    },
+    # Only the 2nd persons of the present in the imperative
+    "impératif": {
+        "tenses": ["présent"],
+        "persons": [2, 5],
+    },
+}
+
+# Deponent verbs only have the deponent voice, the others the active and passive voices
+EXPECTED_VOICES = {
+    False: ["actif", "passif"],
+    True: ["déponent"],
+}
+
+# Grid of the combinations which are checked (the tenses and persons of EXPECTED_PARADIGM): a form outside of it
+# (ex: a passive form of a deponent verb) is never reported, neither as missing nor as extra
+CHECKED_TENSES = list(dict.fromkeys(tense for cells in EXPECTED_PARADIGM.values() for tense in cells["tenses"]))
+CHECKED_PERSONS = sorted({person for cells in EXPECTED_PARADIGM.values() for person in cells["persons"]})
+
+# Groups which are not checked (0 = "esse" and its compounds)
+UNCHECKED_GROUPS = [0]
+
+# Combinations which are not checked for some lemmas (neither missing nor extra)
+PARADIGM_EXCEPTIONS = [
+    # "timere" has no passive perfectum
+    {"lemma": "timere", "voice": "passif", "tenses": ["parfait", "plus-que-parfait", "futur antérieur"]},
+]
+
+
+def expected_paradigm(deponent) -> list[tuple]:
+    """List the (mood, voice, tense, person) combinations which must exist for a deponent or non-deponent verb"""
+    return [
+        (mood, voice, tense, person)
+        for mood, cells in EXPECTED_PARADIGM.items()
+        for voice in EXPECTED_VOICES[deponent]
+        for tense in cells["tenses"]
+        for person in cells["persons"]
+    ]
+
+
+def paradigm_exceptions(lemma) -> set[tuple]:
+    """(voice, tense) combinations which are not checked for this lemma"""
+    return {
+        (exception["voice"], tense)
+        for exception in PARADIGM_EXCEPTIONS
+        if exception["lemma"] == lemma
+        for tense in exception["tenses"]
+    }
+
+
+def paradigm_coverage(inflected_forms) -> tuple[dict, dict]:
+    """Compare the mood/voice/tense/person combinations generated by NooJ for each lemma with the expected paradigm
+
+    return: (missing, extras)
+    missing = {"group=1, mood=indicatif, voice=actif, tense=futur, person=2": ["amare", ...], ...}  # Should exist but not found
+    extras = same format  # Found but should not exist (only within the checked grid, see CHECKED_TENSES)
+    """
     lemmas = group_inflected_forms_by_lemma(inflected_forms)
+    expected = {deponent: expected_paradigm(deponent) for deponent in EXPECTED_VOICES}
 
-    missing = {}  # Should exist but not found
-    extras = {}  # Found but should not exist
+    missing = {}
+    extras = {}
 
     for inflected_forms in sorted(lemmas.values(), key=lambda x: x[0]["group"]):
         group = inflected_forms[0]["group"]
         lemma = inflected_forms[0]["lemma"]
+        if group in UNCHECKED_GROUPS:
+            continue
 
         # Renvoie True si le verbe est déponent, False dans le cas contraire
         deponent = inflected_forms[0]["voice"] == "déponent"
+        exceptions = paradigm_exceptions(lemma)
+
+        found = {
+            (form["mood"], form["voice"], form["tense"], form["person"])
+            for form in inflected_forms
+            if (form["voice"], form["tense"]) not in exceptions
+        }
+        lemma_expected = [cell for cell in expected[deponent] if (cell[1], cell[2]) not in exceptions]
+
+        for mood, voice, tense, person in lemma_expected:
+            if (mood, voice, tense, person) not in found:
+                key = f"group={group}, mood={mood}, voice={voice}, tense={tense}, person={person}"
+                missing.setdefault(key, []).append(lemma)
+        checked = {
+            (mood, voice, tense, person)
+            for mood, voice, tense, person in found
+            if mood in EXPECTED_PARADIGM
+            and voice in EXPECTED_VOICES[deponent]
+            and tense in CHECKED_TENSES
+            and person in CHECKED_PERSONS
+        }
+        for mood, voice, tense, person in sorted(checked - set(lemma_expected), key=str):
+            key = f"group={group}, mood={mood}, voice={voice}, tense={tense}, person={person}"
+            extras.setdefault(key, []).append(lemma)
+
+    return missing, extras
 
-        if group == 0:
-            continue
-        for mood in ["indicatif", "subjonctif", "impératif"]:
-
-            # Si le verbe est déponent, il n'aura pas de voix active ou passive, et inversement
-            # Il ne faut donc vérifier que la voix passive pour les verbes déponents,
-            # et que les voix actives et passives pour les verbes non déponents.
-            voices_to_check = ["déponent"] if deponent else ["actif", "passif"]
-            for voice in voices_to_check:
-                for tense in [
-                    "présent",
-                    "imparfait",
-                    "futur",
-                    "parfait",
-                    "plus-que-parfait",
-                    "futur antérieur",
-                ]:
-                    for person in [1, 2, 3, 4, 5, 6]:
-                        key = f"group={group}, mood={mood}, voice={voice}, tense={tense}, person={person}"
-
-                        if (
-                            lemma == "timere"
-                            and voice == "passif"
-                            and (
-                                tense == "parfait"
-                                or tense == "plus-que-parfait"
-                                or tense == "futur antérieur"
-                            )
-                        ):
-                            continue
-
-                        exist = False
-                        for inflected_form in inflected_forms:
-                            if (
-                                inflected_form["person"] == person
-                                and inflected_form["mood"] == mood
-                                and inflected_form["voice"] == voice
-                                and inflected_form["tense"] == tense
-                            ):
-                                exist = True
-
-                        if (
-                            mood == "subjonctif"
-                            and (tense == "futur" or tense == "futur antérieur")
-                        ) or (
-                            mood == "impératif"
-                            and (person not in [2, 5] or tense != "présent")
-                        ):
-                            if exist:
-                                extras.setdefault(key, [])
-                                extras[key].append(lemma)
-                        else:
-                            if not exist:
-                                missing.setdefault(key, [])
-                                missing[key].append(lemma)
+
+def check_inflected_forms(inflected_forms):
+    """Verify that all the necessary mood/voice/tense/person combinations have been generated by NooJ (and only them)"""
+    missing, extras = paradigm_coverage(inflected_forms)
 
     if len(missing) or len(extras):
         for key, lemmas in extras.items():
@@ -89,9 +154,9 @@ def check_inflected_forms(inflected_forms):
         for key, lemmas in missing.items():
             print("missing:", key, lemmas)
 
-            raise Exception(
-                f"{len(missing)} missing forms and {len(extras)} extra forms"
-            )
+        raise Exception(
+            f"{len(missing)} missing forms and {len(extras)} extra forms"
+        )
 
 
 def deduplicate(verbs_lst: list[dict]) -> list[dict]:
@@ -237,98 +302,489 @@ def deduplicate(verbs_lst: list[dict]) -> list[dict]:
     return verbs_lst_copy
 
 
-def main():
-    verbs_lst = []
-    dic_path = "NooJ/lat_verbes-flx.dic"
-    print("reading verbs from NooJ dic:", dic_path)
-    dics_nooj = pynooj.read_dic(dic_path)
-    print(f"loaded {len(dics_nooj)} inflected forms (lines)")
-
-    abreviations = {
-        "masc": "masculin",
-        "fem": "féminin",
-        "ind": "indicatif",
-        "sub": "subjonctif",
-        "imp": "impératif",
-        "act": "actif",
-        "pas": "passif",
-        "dep": "déponent",
-        "pres": "présent",
-        "impf": "imparfait",
-        "fut": "futur",
-        "pft": "parfait",
-        "pqp": "plus-que-parfait",
-        "fta": "futur antérieur",
+def build_manifest(store, data_paths) -> dict:
+    """Describe the dataset, so that magister.py can build its CLI params without loading all the inflected forms:
+    available tenses, groups, moods and voices, number of inflected forms per facet, content hash and size of each data file
+    """
+    counts = {"forms": len(store), "lemmas": len(store.values("lemma"))}
+    for facet in ["tense", "mood", "voice"]:
+        values, numbers = np.unique(store.codes[facet], return_counts=True)
+        counts[facet] = {store.tables[facet][value]: int(number) for value, number in zip(values, numbers)}
+    for facet in ["group", "person"]:
+        values, numbers = np.unique(getattr(store, facet), return_counts=True)
+        counts[facet] = {str(value): int(number) for value, number in zip(values, numbers)}
+
+    hashes = {}
+    sizes = {}
+    for path in data_paths:
+        with open(path, "rb") as f:
+            hashes[os.path.basename(path)] = hashlib.sha256(f.read()).hexdigest()
+        sizes[os.path.basename(path)] = os.path.getsize(path)
+
+    return {
+        "tenses": store.values("tense"),
+        "groups": [int(group) for group in np.unique(store.group)],
+        "moods": store.values("mood"),
+        "voices": store.values("voice"),
+        "counts": counts,
+        "sha256": hashes,
+        "sizes": sizes,
     }
 
-    for dic_nooj in dics_nooj:
-        dic_mc = {}
 
-        # Only the few forms based on the supinum have gender marks.
-        raw_gender = dic_nooj["traits"].get("GEN")
-        dic_mc["gender"] = abreviations.get(raw_gender)
+ABREVIATIONS = {
+    "masc": "masculin",
+    "fem": "féminin",
+    "ind": "indicatif",
+    "sub": "subjonctif",
+    "imp": "impératif",
+    "act": "actif",
+    "pas": "passif",
+    "dep": "déponent",
+    "pres": "présent",
+    "impf": "imparfait",
+    "fut": "futur",
+    "pft": "parfait",
+    "pqp": "plus-que-parfait",
+    "fta": "futur antérieur",
+}
+
+# Per-lemma build cache (see build_lemmas() and cache_key())
+CACHE_PATH = ".nooj_cache.json"
+
+
+def convert_inflected_form(dic_nooj) -> dict:
+    """Convert an inflected form read by pynooj into the dict used by magister.py (see deduplicate())"""
+    dic_mc = {}
+
+    # Only the few forms based on the supinum have gender marks.
+    raw_gender = dic_nooj["traits"].get("GEN")
+    dic_mc["gender"] = ABREVIATIONS.get(raw_gender)
+
+    # Mood, voice and tense
+    # If we can't find the code in the abreviations dict, we keep its raw name.
+    raw_mood = dic_nooj["traits"]["MOD"]
+    dic_mc["mood"] = ABREVIATIONS.get(raw_mood, raw_mood)
+
+    raw_voice = dic_nooj["traits"]["VX"]
+    dic_mc["voice"] = ABREVIATIONS.get(raw_voice, raw_voice)
+
+    raw_tense = dic_nooj["traits"]["TP"]
+    dic_mc["tense"] = ABREVIATIONS.get(raw_tense, raw_tense)
+
+    try:
+        dic_mc["latin"] = (
+            dic_nooj["inflected form"].replace("v", "u").replace("j", "i")
+        )
+        dic_mc["lemma"] = dic_nooj["lemma"].replace("v", "u").replace("j", "i")
+        dic_mc["group"] = int(dic_nooj["traits"]["GP"])
+        dic_mc["translation"] = dic_nooj["traits"]["TRAD"].split(";")
+        dic_mc["primitive tenses"] = dic_nooj["traits"]["PRIM"].replace(";", ", ")
+        dic_mc["person"] = int(dic_nooj["traits"]["P"])
+        if dic_mc["person"] not in range(1, 4):
+            raise ValueError("Invalid form, the person is invalid")
+
+        if dic_nooj["traits"]["NB"] == "pl":
+            dic_mc["person"] += 3
 
-        # Mood, voice and tense
-        # If we can't find the code in the abreviations dict, we keep its raw name.
-        raw_mood = dic_nooj["traits"]["MOD"]
-        dic_mc["mood"] = abreviations.get(raw_mood, raw_mood)
+        dic_mc["flx"] = dic_nooj["traits"].get("FLX", "")
 
-        raw_voice = dic_nooj["traits"]["VX"]
-        dic_mc["voice"] = abreviations.get(raw_voice, raw_voice)
+        if dic_nooj["traits"].get("FORM") == "irr":
+            dic_mc["irrégulier"] = True
+    except Exception as e:
+        print("Error with:", dic_nooj)
+        raise e
 
-        raw_tense = dic_nooj["traits"]["TP"]
-        dic_mc["tense"] = abreviations.get(raw_tense, raw_tense)
+    return dic_mc
+
+
+def read_dic_lines_by_lemma(dic_path) -> dict[str, list[str]]:
+    """Read the raw lines of a NooJ dictionary and group them by lemma (same u/v and i/j normalisation as the lemmas of the json)
+
+    The lines are not parsed: they are only used to detect which lemmas have changed since the last build.
+    """
+    lemmas = {}
+    with open(dic_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            # Same lines as the ones kept by pynooj.read_dic(): no comments, 2 or 3 comma-separated fields
+            if line.startswith("#") or not 2 <= len(line.split(",")) <= 3:
+                continue
+            fields = line.split(",")
+            # Same lemma as the one pynooj returns (NooJ escapes its special characters: "\\-", "\\+"...)
+            lemma = unescape(fields[1]) if len(fields) == 3 else ""
+            lemma = lemma.replace("v", "u").replace("j", "i")
+            lemmas.setdefault(lemma, []).append(line)
+    return lemmas
 
-        try:
-            dic_mc["latin"] = (
-                dic_nooj["inflected form"].replace("v", "u").replace("j", "i")
-            )
-            dic_mc["lemma"] = dic_nooj["lemma"].replace("v", "u").replace("j", "i")
-            dic_mc["group"] = int(dic_nooj["traits"]["GP"])
-            dic_mc["translation"] = dic_nooj["traits"]["TRAD"].split(";")
-            dic_mc["primitive tenses"] = dic_nooj["traits"]["PRIM"].replace(";", ", ")
-            dic_mc["person"] = int(dic_nooj["traits"]["P"])
-            if dic_mc["person"] not in range(1, 4):
-                raise ValueError("Invalid form, the person is invalid")
 
-            if dic_nooj["traits"]["NB"] == "pl":
-                dic_mc["person"] += 3
+def inflect_lines_by_lemma(dic_path, nof_path) -> dict[str, list[str]]:
+    """Generate the inflected forms (lines of lat_verbes-flx.dic) with inflection.py instead of NooJ,
+    grouped by lemma like read_dic_lines_by_lemma()
+    """
+    inflector = Inflector(nof_path)
+    lemmas = {}
+    for lemma, entries in read_entries(dic_path).items():
+        lemma = unescape(lemma).replace("v", "u").replace("j", "i")
+        for entry in entries:
+            lemmas.setdefault(lemma, []).extend(inflector.inflect(entry))
+    return lemmas
 
-            dic_mc["flx"] = dic_nooj["traits"].get("FLX", "")
 
-            if dic_nooj["traits"].get("FORM") == "irr":
-                dic_mc["irrégulier"] = True
+def process_lines(lines) -> list[dict]:
+    """Parse, convert, sort, check and deduplicate the inflected forms of some NooJ dictionary lines"""
+    if not lines:
+        return []
 
-            verbs_lst.append(dic_mc)
-        except Exception as e:
-            print("Error with:", dic_nooj)
-            raise e
+    # pynooj only reads files
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = os.path.join(tmp_dir, "lines.dic")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        dics_nooj = pynooj.read_dic(tmp_path)
 
     # Sort by lemma > mood > voice > tense > person
+    # (the forms are converted on the fly, so that the lines read by pynooj are freed once sorted)
     verbs_lst = sorted(
-        verbs_lst,
+        map(convert_inflected_form, dics_nooj),
         key=lambda x: (x["lemma"], x["mood"], x["voice"], x["tense"], x["person"]),
     )
+    del dics_nooj
 
     # Verify that all the necessary mood/voice/tense/person combinations have been generated by NooJ
     check_inflected_forms(verbs_lst)
 
     # Filter out some invalid inflected forms.
-    filtered_verbs = deduplicate(verbs_lst)
+    return deduplicate(verbs_lst)
 
-    json_path = "verbs_latin.json"
-    print(f"writing {len(filtered_verbs)} verbs to json file:", json_path)
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(filtered_verbs, f, indent=2, ensure_ascii=False)
 
-    js_path = "web/verbs_latin.js"
-    # Generated for static hosting: allows loading data without fetch/CORS on GitHub Pages.
-    print(f"writing {len(filtered_verbs)} verbs to js file:", js_path)
+def json_fragment(verbs_lst) -> str:
+    """Same text as json.dump(verbs_lst, indent=2) without the surrounding brackets, so that fragments can be joined"""
+    return ",\n".join(
+        "  " + json.dumps(verb, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        for verb in verbs_lst
+    )
+
+
+def build_chunk(lines_by_lemma) -> dict[str, dict]:
+    """Build the inflected forms (and their json text) of some lemmas, from their NooJ lines
+
+    return:
+    {"amare": {"forms": [{"latin": "amabam", ...}, ...], "json": "  {\n    ..."}, ...}
+    """
+    built = {lemma: {"forms": []} for lemma in lines_by_lemma}
+    lines = [line for lemma_lines in lines_by_lemma.values() for line in lemma_lines]
+    for verb in process_lines(lines):
+        built[verb["lemma"]]["forms"].append(verb)
+    for lemma in built:
+        built[lemma]["json"] = json_fragment(built[lemma]["forms"])
+    return built
+
+
+def partition_lemmas(lines_by_lemma, jobs) -> list[dict[str, list[str]]]:
+    """Split the lemmas into (at most) `jobs` chunks holding roughly the same number of lines"""
+    chunks = [{} for _ in range(jobs)]
+    sizes = [0] * jobs
+    for lemma in sorted(lines_by_lemma, key=lambda x: (-len(lines_by_lemma[x]), x)):
+        smallest = sizes.index(min(sizes))
+        chunks[smallest][lemma] = lines_by_lemma[lemma]
+        sizes[smallest] += len(lines_by_lemma[lemma])
+    return [chunk for chunk in chunks if chunk]
+
+
+def cache_key(resource_paths=()) -> str:
+    """Key of the build cache: it changes (and the whole cache is dropped) as soon as the code which builds the forms
+    of the lemmas changes (this script, inflection.py, the version of pynooj), or one of the NooJ resources shared by
+    all the lemmas (ex: the paradigms of NooJ/latin_verbs.nof). The NooJ lines of each lemma are hashed apart.
+    """
+    digest = hashlib.sha256(f"pynooj {importlib.metadata.version('pynooj')}\n".encode("utf-8"))
+    for path in [__file__, inflection.__file__, *resource_paths]:
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def build_lemmas(lines_by_lemma, use_cache=True, jobs=1, key=None) -> dict[str, dict]:
+    """Build the inflected forms of every lemma, reusing the per-lemma build cache.
+
+    The cache maps each lemma to the hash of its NooJ lines, its (deduplicated) inflected forms,
+    and their json text. Only the lemmas whose lines have changed since the last build are processed
+    again through check_inflected_forms() and deduplicate().
+
+    The cache is only reused if its key is the given one (cache_key() by default).
+
+    With jobs > 1, the changed lemmas are split into chunks processed by a pool of processes.
+    Each lemma is processed independently, so the result does not depend on the number of jobs.
+
+    return:
+    {"amare": {"sha256": "...", "forms": [{"latin": "amabam", ...}, ...], "json": "  {\n    ..."}, ...}
+    """
+    key = key or cache_key()
+    cache = {}
+    if use_cache and os.path.exists(CACHE_PATH):
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            content = json.load(f)
+        if content.get("key") == key:
+            cache = content["lemmas"]
+
+    built = {}
+    changed = {}
+    for lemma, lines in lines_by_lemma.items():
+        digest = hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+        if lemma in cache and cache[lemma]["sha256"] == digest:
+            built[lemma] = cache[lemma]
+        else:
+            built[lemma] = {"sha256": digest}
+            changed[lemma] = lines
+
+    print(f"processing {len(changed)} lemmas ({len(built) - len(changed)} unchanged, from cache)")
+    if jobs > 1 and len(changed) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(build_chunk, partition_lemmas(changed, jobs)))
+    else:
+        results = [build_chunk(changed)]
+    # Results are merged by lemma: the order in which the chunks are processed does not matter
+    for result in results:
+        for lemma, lemma_built in result.items():
+            built[lemma].update(lemma_built)
+
+    if changed or len(built) != len(cache):
+        with open(CACHE_PATH, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"key": key, "lemmas": built}, ensure_ascii=False))
+
+    return built
+
+
+def slugify(text) -> str:
+    """File-name friendly version of a facet value (ex: "futur antérieur" -> "futur-anterieur")"""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return text.lower().replace(" ", "-")
+
+
+def write_shards(store, shards_dir) -> dict:
+    """Write the website dataset as one shard per group and tense (compact layout), plus a shard index
+
+    The index (index.js) lists the shards with their number of inflected forms per mood/voice/person,
+    so that the website can count the available questions and load only the shards needed by a session.
+    Each shard registers itself in window.VERBS_LATIN_SHARDS.loaded when its script is loaded.
+
+    A shard also holds the analyses of its Latin forms which belong to other shards ("syncretic", same layout):
+    "agam" is a futur as well as a subjonctif présent, and both analyses must be accepted whichever shards
+    have been loaded when the question is graded.
+    """
+    os.makedirs(shards_dir, exist_ok=True)
+    shards = []
+    for group in [int(group) for group in np.unique(store.group)]:
+        for tense in store.values("tense"):
+            shard = store.filter(tense=[tense], group=[group])
+            if not len(shard):
+                continue
+            counts = {}
+            for verb in shard:
+                key = f"{verb['mood']}|{verb['voice']}|{verb['person']}"
+                counts[key] = counts.get(key, 0) + 1
+            file_name = f"g{group}-{slugify(tense)}.js"
+            shards.append({"file": file_name, "group": group, "tense": tense, "count": len(shard), "counts": counts})
+
+            data = shard.to_compact()
+            selected = shard.selected
+            syncretic = sorted(
+                {row for latin in set(data["forms"]["latin"]) for row in store.latin_index[latin] if not selected[row]}
+            )
+            if syncretic:
+                data["syncretic"] = store.view(np.array(syncretic, dtype=np.int32)).to_compact()
+            compact = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            with open(os.path.join(shards_dir, file_name), "w", encoding="utf-8") as f:
+                f.write(f'window.VERBS_LATIN_SHARDS.loaded["{file_name}"] = {compact};\n')
+
+    # Remove the shards of a previous build which no longer exist (the hashed copies are handled by write_assets)
+    for file_name in os.listdir(shards_dir):
+        if (
+            file_name.endswith(".js")
+            and not HASHED_ASSET.search(file_name)
+            and file_name != "index.js"
+            and file_name not in [s["file"] for s in shards]
+        ):
+            os.remove(os.path.join(shards_dir, file_name))
+
+    index = {
+        "count": len(store),
+        "tenses": store.values("tense"),
+        "groups": [int(group) for group in np.unique(store.group)],
+        "shards": shards,
+        "loaded": {},
+    }
+    with open(os.path.join(shards_dir, "index.js"), "w", encoding="utf-8") as f:
+        f.write("window.VERBS_LATIN_SHARDS = " + json.dumps(index, ensure_ascii=False) + ";\n")
+    return index
+
+
+def write_french_index(store, js_path) -> int:
+    """Write the French infinitives and their lemmas (see VerbStore.french_index) for the completion of the website
+
+    The entries [normalised infinitive, infinitive, lemmas] are sorted by normalised infinitive, as in PrefixIndex:
+    app.js finds the infinitives starting with a prefix with a binary search.
+    """
+    index = store.french_index
+    entries = [[key, label, values] for key, label, values in zip(index.keys, index.labels, index.values)]
     with open(js_path, "w", encoding="utf-8") as f:
-        payload = "window.VERBS_LATIN = " + json.dumps(
-            filtered_verbs, ensure_ascii=False
-        )
-        f.write(payload + ";\n")
+        f.write("window.MAGISTER_FRENCH_INDEX = " + json.dumps(entries, ensure_ascii=False, separators=(",", ":")) + ";\n")
+    return len(entries)
+
+
+# Content-hashed copy of a web artifact: "shards/g1-present.js" -> "shards/g1-present.0123456789.js"
+HASHED_ASSET = re.compile(r"\.[0-9a-f]{10}\.js(\.gz|\.br)?$")
+
+
+def hashed_name(name, content) -> str:
+    """Name of the content-hashed copy of a web artifact (the hash changes only when the content changes)"""
+    root, extension = os.path.splitext(name)
+    return f"{root}.{hashlib.sha256(content).hexdigest()[:10]}{extension}"
+
+
+def write_assets(web_dir, names) -> dict:
+    """Write a content-hashed copy of each web artifact, precompressed with gzip (and brotli, if installed)
+
+    The hashed copies never change once written, so they can be cached indefinitely by the browsers;
+    the .gz/.br variants can be served as such by the static servers supporting it (e.g. gzip_static).
+    The manifest (assets.js, and assets.json for the tools) maps the logical names to the hashed copies:
+    it is the only file of the website which has to be revalidated after a build.
+    """
+    files = {}
+    for name in names:
+        with open(os.path.join(web_dir, name), "rb") as f:
+            content = f.read()
+        files[name] = hashed_name(name, content)
+        path = os.path.join(web_dir, files[name])
+        # Each variant is written only if it is missing (ex: the .br files, once brotli is installed)
+        variants = {
+            path: lambda: content,
+            # mtime=0: the compressed files only depend on the content (reproducible builds)
+            path + ".gz": lambda: gzip.compress(content, compresslevel=9, mtime=0),
+        }
+        if brotli is not None:
+            variants[path + ".br"] = lambda: brotli.compress(content)
+        for variant_path, encode in variants.items():
+            if not os.path.exists(variant_path):
+                with open(variant_path, "wb") as f:
+                    f.write(encode())
+
+    manifest = {"files": files, "encodings": ["gzip", "br"] if brotli is not None else ["gzip"]}
+
+    # Remove the hashed copies of a previous build which are no longer referenced by the manifest
+    current = set(files.values())
+    for root, _, file_names in os.walk(web_dir):
+        for file_name in file_names:
+            path = os.path.join(root, file_name)
+            name = os.path.relpath(path, web_dir).replace(os.sep, "/")
+            if HASHED_ASSET.search(name) and re.sub(r"\.(gz|br)$", "", name) not in current:
+                os.remove(path)
+
+    with open(os.path.join(web_dir, "assets.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    with open(os.path.join(web_dir, "assets.js"), "w", encoding="utf-8") as f:
+        f.write("window.MAGISTER_ASSETS = " + json.dumps(manifest, ensure_ascii=False) + ";\n")
+    return manifest
+
+
+def stream_dataset(built, lemmas, json_path):
+    """Write the json dataset lemma by lemma, and yield its inflected forms in the same pass
+
+    The text of each lemma comes from build_lemmas() (json.dump(verbs, indent=2)),
+    so the whole list of verbs is never serialised at once.
+    """
+    with open(json_path, "w", encoding="utf-8") as json_file:
+        json_file.write("[")
+        first = True
+        for lemma in lemmas:
+            if not built[lemma]["forms"]:
+                continue
+            json_file.write(("\n" if first else ",\n") + built[lemma]["json"])
+            first = False
+            yield from built[lemma]["forms"]
+        json_file.write("]" if first else "\n]")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="nooj.py",
+        description="Converts the inflected forms generated by NooJ into the datasets used by magister.py and the website",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"process all the lemmas again, without reusing the build cache ({CACHE_PATH})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of processes used to convert and check the lemmas (default: 1)",
+    )
+    parser.add_argument(
+        "--inflect",
+        action="store_true",
+        help="generate the inflected forms from NooJ/lat_verbes.dic and NooJ/latin_verbs.nof (inflection.py), "
+        "instead of reading the dictionary inflected by NooJ (NooJ/lat_verbes-flx.dic)",
+    )
+    args = parser.parse_args()
+
+    if args.inflect:
+        dic_path, nof_path = "NooJ/lat_verbes.dic", "NooJ/latin_verbs.nof"
+        print("inflecting verbs from NooJ dic:", dic_path, "with paradigms:", nof_path)
+        lines_by_lemma = inflect_lines_by_lemma(dic_path, nof_path)
+        key = cache_key([nof_path])
+    else:
+        dic_path = "NooJ/lat_verbes-flx.dic"
+        print("reading verbs from NooJ dic:", dic_path)
+        lines_by_lemma = read_dic_lines_by_lemma(dic_path)
+        key = cache_key()
+    print(f"loaded {sum(len(lines) for lines in lines_by_lemma.values())} inflected forms (lines)")
+
+    built = build_lemmas(lines_by_lemma, use_cache=not args.no_cache, jobs=max(args.jobs, 1), key=key)
+
+    # Lemmas in alphabetical order, each with its forms sorted by mood > voice > tense > person
+    lemmas = sorted(built)
+    count = sum(len(built[lemma]["forms"]) for lemma in lemmas)
+
+    json_path = "verbs_latin.json"
+    print(f"writing {count} verbs to json file:", json_path)
+    # One pass over the verbs: the json file is written while the columns of the store are filled
+    store = VerbStore.from_records(stream_dataset(built, lemmas, json_path))
+    # Normalised layout: one lemma table, and the inflected forms as columns of integer codes
+    compact = json.dumps(store.to_compact(), ensure_ascii=False, separators=(",", ":"))
+
+    compact_path = "verbs_latin.compact.json"
+    print(f"writing {count} verbs to compact json file:", compact_path)
+    with open(compact_path, "w", encoding="utf-8") as f:
+        f.write(compact)
+
+    shards_dir = "web/shards"
+    # The website only loads the shards (group x tense) needed by the current session
+    index = write_shards(store, shards_dir)
+    print(f"writing {len(index['shards'])} shards (group x tense) to:", shards_dir)
+
+    french_path = "web/french_index.js"
+    print(f"writing {write_french_index(store, french_path)} French infinitives (completion) to:", french_path)
+
+    web_dir = "web"
+    # The website loads the data through the manifest of the content-hashed artifacts
+    assets = ["shards/index.js", "french_index.js"] + [f"shards/{shard['file']}" for shard in index["shards"]]
+    manifest = write_assets(web_dir, assets)
+    print(f"writing {len(assets)} hashed assets ({', '.join(manifest['encodings'])}) and their manifest to:", web_dir)
+
+    bin_path = "verbs_latin.bin"
+    # Memory-mappable dataset for magister.py (the json file remains the interchange format)
+    print(f"writing {count} verbs to binary file:", bin_path)
+    write_binary(store, bin_path)
+
+    manifest_path = "verbs_latin.manifest.json"
+    print("writing manifest:", manifest_path)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(build_manifest(store, [json_path, compact_path, bin_path]), f, indent=2, ensure_ascii=False)
+        f.write("\n")
 
 
 if __name__ == "__main__":
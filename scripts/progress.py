@@ -0,0 +1,247 @@
+import json
+import sqlite3
+import time
+
+from quiz import Quiz
+from scheduler import Scheduler
+
+# Default database of the CLI and of the server (created in the current folder)
+PROGRESS_PATH = "progress.sqlite"
+# How long (in seconds) a writer waits for the lock of another writer before giving up
+BUSY_TIMEOUT = 10
+# Settings of a session (the CLI params of magister.py): a setting left out by a client (see server.py) is None
+SETTINGS = ["direction", "temps", "groupe", "personne", "voix", "mode"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    learner TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    rounds INTEGER NOT NULL,
+    round INTEGER NOT NULL DEFAULT 0,
+    total_score REAL NOT NULL DEFAULT 0,
+    finished INTEGER NOT NULL DEFAULT 0,
+    started REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_unfinished ON sessions (learner, finished, updated);
+
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    learner TEXT NOT NULL,
+    session INTEGER NOT NULL REFERENCES sessions (id),
+    form TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    step TEXT NOT NULL,
+    answer TEXT,
+    correct INTEGER NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS attempts_form ON attempts (learner, form);
+
+CREATE TABLE IF NOT EXISTS items (
+    learner TEXT NOT NULL,
+    form TEXT NOT NULL,
+    lemma TEXT NOT NULL,
+    mood TEXT NOT NULL,
+    voice TEXT NOT NULL,
+    tense TEXT NOT NULL,
+    person INTEGER NOT NULL,
+    latin TEXT NOT NULL,
+    questions INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    box INTEGER NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (learner, form)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS items_weakest ON items (learner, box, failures DESC, last_seen);
+"""
+
+
+def form_key(verb: dict) -> str:
+    """Identifier of an inflected form, stable across the regenerations of the dataset"""
+    return "|".join(str(verb[key]) for key in ["lemma", "mood", "voice", "tense", "person", "latin"])
+
+
+def full_settings(settings: dict) -> dict:
+    """All the SETTINGS of a session, whichever front end started it (the CLI or server.py)"""
+    return {key: settings.get(key) for key in SETTINGS}
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Connection in WAL mode: the readers never wait, and the writers wait for each other (up to BUSY_TIMEOUT)"""
+    connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class ProgressStore:
+    """Progress of the learners (SQLite): every answer of every step, and the Leitner box of each form (see scheduler.py)
+
+    Several processes (CLI, server) can use the same database at once.
+
+    example:
+        store = ProgressStore("progress.sqlite")
+        session = store.start_session("marcus", {"direction": "latin", "temps": ["futur"]}, rounds=5)
+        ...
+        session.record_question(quiz, box)  # kept in memory
+        session.close()                       # written in one transaction
+        store.weakest("marcus")
+    """
+
+    def __init__(self, path: str = PROGRESS_PATH):
+        self.path = path
+        self.connection = connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def start_session(self, learner: str, settings: dict, rounds: int = 0) -> "ProgressSession":
+        """New session of a learner; settings are the direction and the filters (the CLI params), to resume it
+
+        Nothing is written before the first flush(), so that starting a session never waits for the database.
+        """
+        return ProgressSession(self, None, learner, full_settings(settings), rounds)
+
+    def resume_session(self, learner: str) -> "ProgressSession | None":
+        """Last unfinished session of a learner (None if there is none)"""
+        row = self.connection.execute(
+            "SELECT id, settings, rounds, round, total_score FROM sessions "
+            "WHERE learner = ? AND finished = 0 AND round > 0 ORDER BY updated DESC LIMIT 1",
+            (learner,),
+        ).fetchone()
+        if row is None:
+            return None
+        session_id, settings, rounds, round, total_score = row
+        return ProgressSession(self, session_id, learner, full_settings(json.loads(settings)), rounds, round, total_score)
+
+    def abandon_session(self, session: "ProgressSession"):
+        """Close a session which won't be resumed (see resume_session(): it was already written)"""
+        with self.connection:
+            self.connection.execute("UPDATE sessions SET finished = 1, updated = ? WHERE id = ?", (time.time(), session.id))
+
+    def boxes(self, learner: str) -> dict[str, int]:
+        """Leitner box of each form already asked to a learner"""
+        return dict(self.connection.execute("SELECT form, box FROM items WHERE learner = ?", (learner,)))
+
+    def restore(self, scheduler: Scheduler, learner: str):
+        """Put the items of a scheduler back in the boxes of a learner (the lowest box of its forms for a cell)
+
+        Only the forms already asked are looked up (by their Latin form, see VerbStore.latin_index).
+        """
+        list_verbs = scheduler.list_verbs
+        row_boxes = {}
+        for key, box in self.connection.execute("SELECT form, box FROM items WHERE learner = ? AND box > 0", (learner,)):
+            for row in list_verbs.latin_index.get(key.rsplit("|", 1)[-1], []):
+                if form_key(list_verbs.record(row)) == key:
+                    row_boxes[row] = box
+        scheduler.set_row_boxes(row_boxes)
+
+    def weakest(self, learner: str, limit: int = 10) -> list[dict]:
+        """Forms the least mastered by a learner: lowest box first, then most failed (served by items_weakest)"""
+        cursor = self.connection.execute(
+            "SELECT lemma, mood, voice, tense, person, latin, questions, failures, box FROM items "
+            "WHERE learner = ? ORDER BY box, failures DESC, last_seen LIMIT ?",
+            (learner, limit),
+        )
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+
+class ProgressSession:
+    """Answers of a session, kept in memory and written by batches (see flush())"""
+
+    def __init__(self, store: ProgressStore, session_id: int | None, learner: str, settings: dict, rounds: int, round: int = 0, total_score: float = 0):
+        self.store = store
+        self.id = session_id
+        self.learner = learner
+        self.settings = settings
+        self.rounds = rounds
+        self.round = round
+        self.total_score = total_score
+        self.started = time.time()
+        self.attempts = []
+        self.items = {}
+
+    def record_question(self, quiz: Quiz, box: int):
+        """Keep the answers of a question once it is over, and the new box of its form"""
+        now = time.time()
+        key = form_key(quiz.verb)
+        for attempt in quiz.history:
+            answer = attempt["answer"]
+            self.attempts.append(
+                (key, quiz.direction, attempt["step"], None if answer is None else str(answer), attempt["correct"], now)
+            )
+        self.add_item(key, quiz.verb, 1, quiz.score < len(quiz.steps), box, now)
+        self.round += 1
+        self.total_score += quiz.score / len(quiz.steps)
+
+    def add_item(self, key: str, verb: dict, questions: int, failures: int, box: int, last_seen: float):
+        if key in self.items:
+            _, previous_questions, previous_failures, _, _ = self.items[key]
+            questions += previous_questions
+            failures += previous_failures
+        self.items[key] = (verb, questions, failures, box, last_seen)
+
+    @property
+    def finished(self) -> bool:
+        return self.round >= self.rounds
+
+    def flush(self):
+        """Write the pending answers, the boxes and the state of the session in a single transaction
+
+        It opens its own connection, so that it can be run in a thread (see server.py).
+        """
+        if self.id is None and not self.attempts:
+            return
+        attempts, items = self.attempts, self.items
+        self.attempts, self.items = [], {}
+        session_id = self.id
+        connection = connect(self.store.path)
+        try:
+            # BEGIN IMMEDIATE takes the write lock at once: a busy database is waited for here, not in the middle
+            connection.execute("BEGIN IMMEDIATE")
+            if self.id is None:
+                self.id = connection.execute(
+                    "INSERT INTO sessions (learner, settings, rounds, started, updated) VALUES (?, ?, ?, ?, ?)",
+                    (self.learner, json.dumps(self.settings, ensure_ascii=False), self.rounds, self.started, self.started),
+                ).lastrowid
+            connection.executemany(
+                "INSERT INTO attempts (learner, session, form, direction, step, answer, correct, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(self.learner, self.id, *attempt) for attempt in attempts],
+            )
+            connection.executemany(
+                "INSERT INTO items (learner, form, lemma, mood, voice, tense, person, latin, questions, failures, box, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (learner, form) DO UPDATE SET questions = questions + excluded.questions, "
+                "failures = failures + excluded.failures, box = excluded.box, last_seen = excluded.last_seen",
+                [
+                    (self.learner, key, verb["lemma"], verb["mood"], verb["voice"], verb["tense"], verb["person"],
+                     verb["latin"], questions, failures, box, last_seen)
+                    for key, (verb, questions, failures, box, last_seen) in items.items()
+                ],
+            )
+            connection.execute(
+                "UPDATE sessions SET rounds = ?, round = ?, total_score = ?, finished = ?, updated = ? WHERE id = ?",
+                (self.rounds, self.round, self.total_score, self.finished, time.time(), self.id),
+            )
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            self.id = session_id
+            # Nothing is lost: the answers are written with the next batch
+            self.attempts = attempts + self.attempts
+            newer, self.items = self.items, {}
+            for pending in [items, newer]:
+                for key, item in pending.items():
+                    self.add_item(key, *item)
+            raise
+        finally:
+            connection.close()
+
+    def close(self):
+        self.flush()
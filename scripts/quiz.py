@@ -0,0 +1,168 @@
+import random
+
+from matcher import fold
+from verb_store import VerbStore
+
+
+# Steps of a question, in the order they are asked
+# - latin: a Latin form is given, its person, tense, voice, mood and translation must be found
+# - français: a translation, a person, a tense, a voice and a mood are given, the Latin form must be found
+STEPS = {
+    "latin": ["person", "tense", "voice", "mood", "translation"],
+    "français": ["latin"],
+}
+
+# Hints which can be asked for during a question
+HINTS = {
+    "latin": ["primitive tenses"],
+    "français": ["primitive tenses", "lemma"],
+}
+
+
+class Quiz:
+    """Grading logic of the questions, as a state machine without input()/print()
+
+    A question is started with start_question(), then each step is either answered with submit()
+    (the step is passed only if the answer is accepted) or skipped with reveal(). hint() gives a hint at any time.
+    All the actions return their result as a dict, so that the quiz can be driven by the CLI (see magister.py),
+    a server or a script.
+
+    example:
+        quiz = Quiz(list_verbs)
+        quiz.start_question(verb, "latin")
+        quiz.submit("person", "1")  # {"step": "person", "correct": True, "score": 1, "next": "tense", "done": False}
+        quiz.reveal("tense")        # {"step": "tense", "answers": ["présent"], "score": 1, "next": "voice", "done": False}
+    """
+
+    def __init__(self, list_verbs: VerbStore):
+        self.list_verbs = list_verbs
+        self.verb = None
+        self.direction = None
+        self.index = 0
+        self.score = 0
+        self.profiles = []
+        self.accepted_latins = []
+        self.history = []  # answers of the current question: {"step", "answer", "correct"} (answer None when revealed)
+
+    @property
+    def steps(self) -> list[str]:
+        return STEPS[self.direction]
+
+    @property
+    def done(self) -> bool:
+        return self.index >= len(self.steps)
+
+    @property
+    def step(self) -> str | None:
+        """Step waiting for an answer (None once the question is over)"""
+        return None if self.done else self.steps[self.index]
+
+    def start_question(self, verb: dict | None = None, direction: str = "latin") -> dict:
+        """Start a question about a verb (a random verb of the store if None)"""
+        if direction not in STEPS:
+            raise ValueError(f"Unknown direction: {direction}")
+        if verb is None:
+            verb = self.list_verbs.record(random.choice(self.list_verbs.rows))
+        self.verb = verb
+        self.direction = direction
+        self.index = 0
+        self.score = 0
+        self.history = []
+
+        if direction == "latin":
+            # Logique de l'entonnoir : toutes les analyses de la forme latine, réduites à chaque bonne réponse
+            self.profiles = self.list_verbs.analyses(verb["latin"])
+            prompt = {"latin": verb["latin"]}
+        else:
+            # Toutes les formes latines acceptées (syncrétisme + synonymes)
+            self.accepted_latins = self.list_verbs.accepted_latins(
+                verb["person"], verb["tense"], verb["voice"], verb["mood"], verb["translation"]
+            )
+            prompt = {key: verb[key] for key in ["translation", "person", "tense", "voice", "mood"]}
+
+        return {
+            "direction": direction,
+            "prompt": prompt,
+            "steps": self.steps,
+            "step": self.step,
+            "max score": len(self.steps),
+        }
+
+    def accepted(self, step: str) -> list:
+        """Answers accepted for a step, given the answers already accepted for the previous steps"""
+        if step == "latin":
+            return self.accepted_latins
+        if step == "translation":
+            return list(dict.fromkeys(t for profile in self.profiles for t in profile["translation"]))
+        return list(dict.fromkeys(profile[step] for profile in self.profiles))
+
+    def _check_step(self, step: str):
+        if self.verb is None:
+            raise ValueError("No question started")
+        if step != self.step:
+            raise ValueError(f"Expected an answer for step {self.step}, not {step}")
+
+    def match(self, step: str, answer) -> list:
+        """Known answers of a step spelled as the given answer (u/v, i/j, case, accents and spaces are ignored)"""
+        if step == "person" or not isinstance(answer, str):
+            answer = normalise(step, answer)
+            return [] if answer is None else [answer]
+        if step == "latin":
+            return self.list_verbs.latin_matcher.match(answer)
+        if step == "translation":
+            return self.list_verbs.translation_matcher.match(answer)
+        accepted = self.accepted(step)
+        if answer in accepted:
+            return [answer]
+        return [value for value in accepted if fold(value) == fold(answer)]
+
+    def submit(self, step: str, answer) -> dict:
+        """Grade the answer of the current step: the quiz moves to the next step only if it is accepted
+
+        When a Latin form or a translation is wrong because it doesn't exist (a typo), the closest known
+        answers are given as "suggestions".
+        """
+        self._check_step(step)
+        known = self.match(step, answer)
+        accepted = self.accepted(step)
+        matched = next((value for value in known if value in accepted), None)
+        correct = matched is not None
+        self.history.append({"step": step, "answer": matched if correct else normalise(step, answer), "correct": correct})
+        if correct:
+            if step not in ["latin", "translation"]:
+                self.profiles = [profile for profile in self.profiles if profile[step] == matched]
+            self.score += 1
+            self.index += 1
+        result = {"step": step, "correct": correct, "score": self.score, "next": self.step, "done": self.done}
+        if not known and isinstance(answer, str) and step in ["latin", "translation"]:
+            matcher = self.list_verbs.latin_matcher if step == "latin" else self.list_verbs.translation_matcher
+            result["suggestions"] = matcher.suggest(answer)
+        return result
+
+    def reveal(self, step: str) -> dict:
+        """Give the accepted answers of the current step, and move to the next step (without point)"""
+        self._check_step(step)
+        answers = self.accepted(step)
+        self.history.append({"step": step, "answer": None, "correct": False})
+        self.index += 1
+        return {"step": step, "answers": answers, "score": self.score, "next": self.step, "done": self.done}
+
+    def hint(self, kind: str) -> dict:
+        """Give a hint about the verb of the question (see HINTS)"""
+        if self.verb is None:
+            raise ValueError("No question started")
+        if kind not in HINTS[self.direction]:
+            raise ValueError(f"Unknown hint for direction {self.direction}: {kind}")
+        return {"hint": kind, "value": self.verb[kind]}
+
+
+def normalise(step: str, answer):
+    """Normalise an answer as typed by the user (None if it can't be an answer of this step)"""
+    if step == "person":
+        try:
+            return int(answer)
+        except (TypeError, ValueError):
+            return None
+    if not isinstance(answer, str):
+        return None
+    return answer.strip().lower()
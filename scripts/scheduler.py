@@ -0,0 +1,100 @@
+import random
+
+import numpy as np
+
+from verb_store import VerbStore
+
+# Leitner boxes: an item goes up one box when it is answered correctly, and back to the first box when it is failed.
+# Its weight (probability to be drawn) is halved at each box.
+MAX_BOX = 5
+
+
+def box_weight(box: int) -> float:
+    return 2.0 ** -box
+
+
+class Scheduler:
+    """Spaced repetition over the inflected forms of a store (or a filtered view)
+
+    An item is either an inflected form (unit="form"), or a cell lemma x tense (unit="cell"), whose forms are then
+    drawn uniformly. The items which are answered correctly are drawn less and less often (see MAX_BOX).
+
+    Only the items out of the first box are kept (most of them are never asked in a session): a draw picks an item
+    uniformly, and keeps it with a probability proportional to its weight. The expected number of tries is about one
+    while few items are mastered, and 2 ** MAX_BOX once all of them are in the last box. With uniform=True, the
+    weights are ignored (the boxes are still updated, so that the progress of a learner is kept).
+
+    example:
+        scheduler = Scheduler(filtered_verbs)
+        item, verb = scheduler.draw()
+        ...
+        scheduler.update(item, score)  # score between 0 and 1
+    """
+
+    def __init__(self, list_verbs: VerbStore, unit: str = "form", uniform: bool = False):
+        self.list_verbs = list_verbs
+        self.unit = unit
+        self.uniform = uniform
+        if unit == "form":
+            # The item of a form is its position in the rows of the store
+            self.cells = self.item_rows = None
+            self.size = len(list_verbs.rows)
+        elif unit == "cell":
+            rows = list_verbs.rows
+            cells = list_verbs.codes["lemma"][rows].astype(np.int64) * len(list_verbs.tables["tense"]) + list_verbs.codes["tense"][rows]
+            _, self.cells = np.unique(cells, return_inverse=True)
+            self.item_rows = [[] for _ in range(self.cells.max() + 1 if len(self.cells) else 0)]
+            for row, item in zip(rows.tolist(), self.cells.tolist()):
+                self.item_rows[item].append(row)
+            self.size = len(self.item_rows)
+        else:
+            raise ValueError(f"Unknown scheduling unit: {unit}")
+        # Box of the items out of the first box
+        self.boxes = {}
+
+    def __len__(self):
+        return self.size
+
+    def rows(self, item: int) -> list[int]:
+        """Rows of the inflected forms of an item"""
+        if self.item_rows is None:
+            return [int(self.list_verbs.rows[item])]
+        return self.item_rows[item]
+
+    def box(self, item: int) -> int:
+        return self.boxes.get(item, 0)
+
+    def draw(self) -> tuple[int, dict]:
+        """Draw an item according to the weights, and one of its inflected forms"""
+        if not self.size:
+            raise ValueError("No item to draw: the store of the scheduler is empty")
+        while True:
+            item = random.randrange(self.size)
+            if self.uniform or item not in self.boxes or random.random() < box_weight(self.boxes[item]) / box_weight(0):
+                return item, self.list_verbs.record(random.choice(self.rows(item)))
+
+    def update(self, item: int, score: float):
+        """Move an item between the boxes according to the score (out of 1) of its last question"""
+        box = self.box(item)
+        if score >= 1:
+            box = min(box + 1, MAX_BOX)
+        elif score < 0.5:
+            box = 0
+        self.set_box(item, box)
+
+    def set_box(self, item: int, box: int):
+        if box:
+            self.boxes[item] = box
+        else:
+            self.boxes.pop(item, None)
+
+    def set_row_boxes(self, row_boxes: dict[int, int]):
+        """Put the items of some rows in the boxes of these rows (the lowest box of its forms for a cell)"""
+        if not row_boxes:
+            return
+        positions = np.flatnonzero(np.isin(self.list_verbs.rows, np.fromiter(row_boxes, dtype=np.int64)))
+        items = positions if self.cells is None else self.cells[positions]
+        for item in dict.fromkeys(items.tolist()):
+            box = min(row_boxes.get(row, 0) for row in self.rows(item))
+            if box:
+                self.set_box(item, box)
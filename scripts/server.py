@@ -0,0 +1,399 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import secrets
+import struct
+import time
+
+from magister import default_verbs_path, filter_verbs, get_verbs
+from progress import PROGRESS_PATH, ProgressSession, ProgressStore
+from quiz import STEPS, Quiz
+from scheduler import Scheduler
+from verb_store import VerbStore
+
+# Key of the WebSocket handshake (RFC 6455)
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+# Sessions without activity for this long (in seconds) are removed
+SESSION_TTL = 3600
+# Same limits as the CLI (see ask_verbs())
+MAX_ROUNDS = 10
+# Maximum number of French infinitives returned by a completion
+MAX_COMPLETIONS = 20
+# Maximum size (in bytes) of a message: body of a POST request, or payload of a WebSocket frame
+MAX_MESSAGE_SIZE = 1 << 16
+# Time (in seconds) given to a client to send its request, or the rest of a WebSocket frame
+READ_TIMEOUT = 30
+# JSON types of the fields of a message (a missing field, or null, is accepted)
+FIELDS = {
+    "action": str,
+    "session": str,
+    "step": str,
+    "answer": (str, int),
+    "kind": str,
+    "rounds": int,
+    "direction": str,
+    "filters": dict,
+    "learner": str,
+    "prefix": str,
+    "limit": int,
+}
+# JSON types of the values of the filters of a "new" message: lists of values, except the voice and the mood
+# (see VerbStore.mask())
+FILTERS = {"temps": str, "groupe": int, "personne": int, "voix": str, "mode": str}
+SINGLE_FILTERS = ("voix", "mode")
+
+
+class Session:
+    """A quiz of several rounds on the verbs matching the filters of a user (see main() of magister.py)"""
+
+    def __init__(self, list_verbs: VerbStore, rounds: int, direction: str | None, progress: ProgressSession | None = None):
+        self.quiz = Quiz(list_verbs)
+        self.scheduler = Scheduler(list_verbs)
+        self.item = None
+        self.progress = progress
+        self.rounds = rounds
+        self.direction = direction
+        self.round = 0
+        self.total_score = 0
+        self.question = None
+        self.last_seen = time.monotonic()
+
+    @property
+    def finished(self) -> bool:
+        return self.round >= self.rounds
+
+    def next_question(self) -> dict:
+        # Random direction for each question when none is chosen, like ask_verbs()
+        direction = self.direction or random.choice(["latin", "français"])
+        self.round += 1
+        self.item, verb = self.scheduler.draw()
+        self.question = self.quiz.start_question(verb, direction)
+        return self.question
+
+    def status(self) -> dict:
+        return {"round": self.round, "rounds": self.rounds, "total score": self.total_score, "finished": self.finished}
+
+    def after(self, result: dict) -> dict:
+        """Once a question is over, its score is added (out of 1, like the CLI) and the next question is started"""
+        if result["done"]:
+            score = self.quiz.score / len(self.quiz.steps)
+            self.scheduler.update(self.item, score)
+            if self.progress is not None:
+                self.progress.record_question(self.quiz, self.scheduler.box(self.item))
+            self.total_score += score
+            if not self.finished:
+                result["question"] = self.next_question()
+        result.update(self.status())
+        return result
+
+
+class QuizServer:
+    """Quiz sessions of many users, on the dataset loaded once
+
+    The same JSON messages are accepted over HTTP (POST /api, one message per request)
+    and over WebSocket (GET /ws, one message per text frame):
+        {"action": "new", "rounds": 5, "direction": "latin", "filters": {"temps": ["présent"], "groupe": [1]}, "learner": "marcus"}
+        {"action": "submit", "session": "...", "step": "person", "answer": "1"}
+        {"action": "reveal", "session": "...", "step": "person"}
+        {"action": "hint", "session": "...", "kind": "primitive tenses"}
+        {"action": "status", "session": "..."}
+        {"action": "complete", "prefix": "cond"}  (French infinitives and their lemmas, no session needed)
+
+    With a progress store and a "learner", the answers of a session are saved once it is over (see progress.py).
+    """
+
+    def __init__(self, list_verbs: VerbStore, progress_store: ProgressStore | None = None):
+        self.list_verbs = list_verbs
+        self.progress_store = progress_store
+        self.sessions = {}
+
+    def handle(self, message: dict) -> dict:
+        """Apply a message to its session, and return the response (a dict with "error" when the message is invalid)"""
+        if not isinstance(message, dict):
+            return {"error": "Message JSON invalide"}
+        try:
+            check_message(message)
+            action = message.get("action")
+            if action == "new":
+                return self.new_session(message)
+            if action == "complete":
+                return self.complete(message)
+            session = self.sessions.get(message.get("session"))
+            if session is None:
+                return {"error": "Session inconnue ou expirée"}
+            session.last_seen = time.monotonic()
+            if action == "status":
+                return session.status()
+            if session.finished and session.quiz.done:
+                return {"error": "La session est terminée", **session.status()}
+            if action == "submit":
+                return self.after(session, session.quiz.submit(message.get("step"), message.get("answer")))
+            if action == "reveal":
+                return self.after(session, session.quiz.reveal(message.get("step")))
+            if action == "hint":
+                return session.quiz.hint(message.get("kind"))
+            return {"error": f"Action inconnue : {action}"}
+        except (ValueError, TypeError) as e:
+            return {"error": str(e)}
+
+    def new_session(self, message: dict) -> dict:
+        self.expire_sessions()
+
+        rounds = message.get("rounds", MAX_ROUNDS)
+        if rounds not in range(1, MAX_ROUNDS + 1):
+            return {"error": f"Le nombre de verbes doit être compris entre 1 et {MAX_ROUNDS}"}
+        direction = message.get("direction")
+        if direction is not None and direction not in STEPS:
+            return {"error": "La direction doit être 'latin' ou 'français'"}
+
+        # Same facets as the CLI params of magister.py
+        filters = message.get("filters") or {}
+        filtered_verbs = filter_verbs(
+            self.list_verbs,
+            filters.get("temps"),
+            filters.get("groupe"),
+            filters.get("personne"),
+            filters.get("voix"),
+            filters.get("mode"),
+        )
+        if len(filtered_verbs) == 0:
+            return {"error": "Aucun verbe disponible pour ces options"}
+
+        progress = None
+        learner = message.get("learner")
+        if learner and self.progress_store is not None:
+            progress = self.progress_store.start_session(learner, {"direction": direction, **filters}, rounds)
+
+        session_id = secrets.token_hex(8)
+        session = self.sessions[session_id] = Session(filtered_verbs, rounds, direction, progress)
+        if progress is not None:
+            self.progress_store.restore(session.scheduler, progress.learner)
+        return {"session": session_id, "question": session.next_question(), **session.status()}
+
+    def complete(self, message: dict) -> dict:
+        """French infinitives starting with a prefix, with the lemmas they translate (see VerbStore.french_index)"""
+        limit = message.get("limit", MAX_COMPLETIONS)
+        if limit not in range(1, MAX_COMPLETIONS + 1):
+            return {"error": f"La limite doit être comprise entre 1 et {MAX_COMPLETIONS}"}
+        completions = self.list_verbs.french_index.complete(message.get("prefix") or "", limit)
+        return {"completions": [{"translation": translation, "lemmas": lemmas} for translation, lemmas in completions]}
+
+    def after(self, session: Session, result: dict) -> dict:
+        result = session.after(result)
+        if session.finished and session.quiz.done:
+            self.save(session)
+        return result
+
+    def save(self, session: Session):
+        """Write the answers of a session: in a thread when the event loop is running, so that the questions
+        of the other sessions are not delayed while SQLite waits for another writer
+        """
+        if session.progress is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            session.progress.flush()
+            return
+        loop.run_in_executor(None, session.progress.flush).add_done_callback(report_error)
+
+    def expire_sessions(self):
+        now = time.monotonic()
+        for session_id in [s for s, session in self.sessions.items() if now - session.last_seen > SESSION_TTL]:
+            # An unfinished session is saved as well, so that its answers are not lost
+            self.save(self.sessions.pop(session_id))
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line, headers = await asyncio.wait_for(read_http_head(reader), READ_TIMEOUT)
+            method, path, _ = request_line.split(" ", 2)
+            if method == "GET" and path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self.serve_websocket(reader, writer, headers)
+            elif method == "POST" and path == "/api":
+                length = int(headers.get("content-length", 0))
+                if length not in range(MAX_MESSAGE_SIZE + 1):
+                    response = {"error": f"Le message ne doit pas dépasser {MAX_MESSAGE_SIZE} octets"}
+                    write_http_response(writer, 413, response)
+                else:
+                    body = await asyncio.wait_for(reader.readexactly(length), READ_TIMEOUT)
+                    try:
+                        response = self.handle(json.loads(body))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        response = {"error": "Message JSON invalide"}
+                    write_http_response(writer, 400 if "error" in response else 200, response)
+            else:
+                write_http_response(writer, 404, {"error": "Not found"})
+            await writer.drain()
+        except (
+            asyncio.IncompleteReadError, asyncio.LimitOverrunError, TimeoutError, ConnectionError, ValueError, KeyError
+        ):
+            # Connection closed, client too slow, or invalid request (the size of the head is limited by the
+            # buffer of the StreamReader)
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve_websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, headers: dict):
+        accept = base64.b64encode(hashlib.sha1((headers["sec-websocket-key"] + WEBSOCKET_GUID).encode()).digest())
+        writer.write(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+        )
+        while True:
+            # A client may think about its answer as long as its session lasts
+            try:
+                opcode, payload = await read_frame(reader, SESSION_TTL)
+            except FrameError as e:
+                writer.write(encode_frame(0x8, struct.pack("!H", e.code)))
+                break
+            if opcode == 0x8:  # close
+                writer.write(encode_frame(0x8, payload[:2]))
+                break
+            if opcode == 0x9:  # ping
+                writer.write(encode_frame(0xA, payload))
+            elif opcode == 0x1:  # text
+                try:
+                    response = self.handle(json.loads(payload))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    response = {"error": "Message JSON invalide"}
+                writer.write(encode_frame(0x1, json.dumps(response, ensure_ascii=False).encode("utf-8")))
+            await writer.drain()
+
+
+async def read_http_head(reader: asyncio.StreamReader) -> tuple[str, dict]:
+    """Read the request line and the headers (names in lower case) of an HTTP request"""
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    request_line, *lines = head.split("\r\n")
+    headers = {}
+    for line in lines:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return request_line, headers
+
+
+def check_message(message: dict):
+    """ValueError when a field of a message (see FIELDS), or a filter of a "new" message, hasn't the expected type"""
+    for name, types in FIELDS.items():
+        if message.get(name) is not None and not has_type(message[name], types):
+            raise ValueError(f"Champ invalide : {name}")
+    filters = message.get("filters") or {}
+    for name, types in FILTERS.items():
+        value = filters.get(name)
+        if value is None:
+            continue
+        values = [value] if name in SINGLE_FILTERS else value
+        if not isinstance(values, list) or not all(has_type(item, types) for item in values):
+            raise ValueError(f"Filtre invalide : {name}")
+
+
+def has_type(value, types) -> bool:
+    """isinstance() for a JSON value: a boolean isn't a number"""
+    return isinstance(value, types) and not isinstance(value, bool)
+
+
+def write_http_response(writer: asyncio.StreamWriter, status: int, response: dict):
+    body = json.dumps(response, ensure_ascii=False).encode("utf-8")
+    reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large"}[status]
+    writer.write(
+        f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+    )
+
+
+class FrameError(ValueError):
+    """A WebSocket frame which isn't accepted, and the status code of the close frame sent in reply"""
+
+    def __init__(self, message: str, code: int):
+        super().__init__(message)
+        self.code = code
+
+
+async def read_frame(reader: asyncio.StreamReader, timeout: float | None = None) -> tuple[int, bytes]:
+    """Read a WebSocket frame (unmasked if masked, as sent by a client)
+
+    The frame is awaited for at most timeout seconds (None: no limit), then the rest of it for READ_TIMEOUT seconds.
+    """
+    first, second = await asyncio.wait_for(reader.readexactly(2), timeout)
+    return await asyncio.wait_for(read_frame_rest(reader, first, second), READ_TIMEOUT)
+
+
+async def read_frame_rest(reader: asyncio.StreamReader, first: int, second: int) -> tuple[int, bytes]:
+    # The messages are small (see MAX_MESSAGE_SIZE): the fragmented ones are not supported
+    if not first & 0x80 or first & 0x0F == 0x0:
+        raise FrameError("Fragmented WebSocket message", 1003)  # unsupported data
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_MESSAGE_SIZE:
+        raise FrameError(f"WebSocket frame of {length} bytes", 1009)  # message too big
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+    return first & 0x0F, payload
+
+
+def encode_frame(opcode: int, payload: bytes, mask: bool = False) -> bytes:
+    """Encode a final WebSocket frame (the frames sent by a client must be masked)"""
+    header = bytes([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    if len(payload) < 126:
+        header += bytes([mask_bit | len(payload)])
+    elif len(payload) < 1 << 16:
+        header += bytes([mask_bit | 126]) + struct.pack("!H", len(payload))
+    else:
+        header += bytes([mask_bit | 127]) + struct.pack("!Q", len(payload))
+    if not mask:
+        return header + payload
+    key = secrets.token_bytes(4)
+    return header + key + bytes(byte ^ key[i % 4] for i, byte in enumerate(payload))
+
+
+def report_error(future: asyncio.Future):
+    if not future.cancelled() and future.exception() is not None:
+        print(f"Progress not saved: {future.exception()!r}")
+
+
+async def serve(list_verbs: VerbStore, host: str, port: int, progress_path: str | None = None):
+    quiz_server = QuizServer(list_verbs, ProgressStore(progress_path) if progress_path else None)
+    server = await asyncio.start_server(quiz_server.serve_client, host, port)
+    print(f"Serving on http://{host}:{port} (POST /api, WebSocket /ws)")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="server.py",
+        description="Serveur HTTP/WebSocket d'interrogation sur les verbes latins, pour plusieurs utilisateurs",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="adresse d'écoute (défaut : 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="port d'écoute (défaut : 8000)")
+    parser.add_argument(
+        "--progression",
+        nargs="?",
+        const=PROGRESS_PATH,
+        default=None,
+        help=f"enregistrer la progression des élèves dans une base SQLite (défaut : {PROGRESS_PATH})",
+    )
+    args = parser.parse_args()
+
+    verbs_latin_path = default_verbs_path()
+    list_verbs = get_verbs(verbs_latin_path)
+    print(f"Loaded {len(list_verbs)} inflected forms from {verbs_latin_path}")
+
+    asyncio.run(serve(list_verbs, args.host, args.port, args.progression))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+from analyser import *
+
+
+@pytest.fixture(scope="module")
+def analyser(list_verbs):
+    return Analyser(list_verbs)
+
+
+def test_dawg():
+    random.seed(0)
+    words = sorted({"".join(random.choice("abc") for _ in range(random.randint(1, 6))) for _ in range(300)})
+    dawg = DAWG(words)
+    assert len(dawg) == len(words)
+    assert [dawg.index(word) for word in words] == list(range(len(words)))
+    assert dawg.index("abcabcabc") is None
+    assert dawg.words() == words
+    assert dawg.words("ab") == [word for word in words if word.startswith("ab")]
+    assert dawg.prefix_range("ab") == range(words.index(dawg.words("ab")[0]), words.index(dawg.words("ab")[-1]) + 1)
+    # The common endings are shared
+    assert len(dawg.final) < sum(len(word) for word in words)
+
+
+def test_analyse(analyser, list_verbs):
+    analyses = analyser.analyse("Amavit")
+    assert analyses == [
+        {"latin": "amauit", "lemma": "amare", "mood": "indicatif", "voice": "actif", "tense": "parfait", "person": 3, "translation": ["aimer"]}
+    ]
+    # Syncretic form
+    assert len(analyser.analyse("amauerit")) == len(list_verbs.analyses("amauerit")) == 2
+    # Two-word form (supinum), with its gender
+    assert analyser.analyse("amatus  sum")[0]["gender"] == "masculin"
+    assert analyser.analyse("amatus") == []
+    assert "iussi" in analyser and "jussi" in analyser
+
+
+def test_all_forms(analyser, list_verbs):
+    for latin, rows in list_verbs.latin_index.items():
+        assert len(analyser.analyse(latin)) == len(rows)
+
+
+def test_prefix(analyser):
+    forms = analyser.complete("amatus e")
+    assert analyser.count("amatus e") == len(forms) > 0
+    assert all(form.startswith("amatus e") for form in forms)
+    assert forms == sorted(forms)
+    assert analyser.complete("amav", limit=3) == analyser.complete("amau")[:3]
+    assert analyser.complete("xyz") == []
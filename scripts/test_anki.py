@@ -0,0 +1,58 @@
+import os
+
+from anki import *
+from magister import filter_verbs
+
+
+def test_syncretic_forms(list_verbs):
+    model = create_model()
+    notes = create_notes(model, list_verbs)
+    assert len(notes) == len({verb["latin"] for verb in list_verbs})
+    name, note = notes[note_guid("amabaris")]
+    assert note.fields[0] == "amabaris"
+    assert note.fields[1] == answer(list_verbs.analyses("amabaris"))
+
+    # Syncretic form: all its analyses are on its card, even those the filter excludes
+    syncretic = next(latin for latin, rows in list_verbs.latin_index.items() if len({list_verbs.record(row)["tense"] for row in rows}) > 1)
+    tense = list_verbs.analyses(syncretic)[0]["tense"]
+    filtered_notes = create_notes(model, list_verbs, filter_verbs(list_verbs, [tense]))
+    name, note = filtered_notes[note_guid(syncretic)]
+    assert note.fields[1].count("<br>") == len(set(answer([verb]) for verb in list_verbs.analyses(syncretic))) - 1
+    assert len(filtered_notes) < len(notes)
+    assert note.guid == note_guid(syncretic)
+
+
+def test_subdecks(list_verbs):
+    verb = list_verbs.filter(tense=["futur"], group=[1])[0]
+    assert deck_name(verb, None) == "Latin verbs"
+    assert deck_name(verb, "temps") == "Latin verbs::futur"
+    assert deck_name(verb, "groupe") == "Latin verbs::Groupe 1"
+    assert deck_id("Latin verbs") == DECK_ID
+    assert deck_id("Latin verbs::futur") == deck_id("Latin verbs::futur") != DECK_ID
+
+
+def test_incremental_export(list_verbs, tmp_path):
+    model = create_model()
+    verbs = list_verbs.filter(tense=["présent"], group=[1], person=[1])
+    notes = create_notes(model, list_verbs, verbs)
+    manifest_path = str(tmp_path / "latin_verbs.export.json")
+    settings = {"temps": ["présent"]}
+
+    changed, hashes, removed = changed_notes(notes, get_export_manifest(manifest_path, settings))
+    assert len(changed) == len(notes)
+    save_export_manifest(manifest_path, hashes, settings)
+    assert get_export_manifest(manifest_path, {"temps": ["futur"]}) == {}
+
+    # A fixed translation, a removed form and a new form
+    guids = list(notes)
+    name, note = notes[guids[0]]
+    notes[guids[0]] = (name, create_note(model, note.fields[0], note.fields[1] + " (corrigé)", note.guid))
+    del notes[guids[-1]]
+    futur = list_verbs.filter(tense=["futur"], group=[1], person=[1])
+    notes.update(create_notes(model, list_verbs, futur.view(futur.rows[:1])))
+    changed, hashes, removed = changed_notes(notes, get_export_manifest(manifest_path, settings))
+    assert set(changed) == {guids[0], list(notes)[-1]}
+    assert removed == [guids[-1]]
+
+    save_deck(create_decks(changed), str(tmp_path / "latin_verbs.apkg"))
+    assert os.path.getsize(tmp_path / "latin_verbs.apkg") > 0
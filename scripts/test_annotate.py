@@ -0,0 +1,54 @@
+import io
+
+import pytest
+from analyser import Analyser
+from annotate import *
+
+
+@pytest.fixture(scope="module")
+def analyser(list_verbs):
+    return Analyser(list_verbs)
+
+
+def test_annotate_chunk(analyser):
+    lines = ["Caesar a Labieno amatus est; milites\n", "laudati sunt et est iussus, hostesque Vicerunt.\n"]
+    annotations, tokens, lemmas, tenses = annotate_chunk((10, lines), analyser)
+    annotations = [json.loads(annotation) for annotation in annotations]
+    assert tokens == 13
+    assert [annotation["token"] for annotation in annotations] == ["amatus est", "laudati sunt", "est iussus", "Vicerunt"]
+    assert annotations[0]["line"] == 10
+    assert annotations[0]["column"] == lines[0].index("amatus")
+    # The two words of a passive may be on two lines
+    assert annotations[1]["line"] == 11
+    assert annotations[2]["analyses"][0]["lemma"] == "iubere"
+    assert annotations[3]["analyses"][0]["latin"] == "uicerunt"
+    assert lemmas["amare"] == 1
+    assert tenses == {"parfait": 4}
+
+
+def test_two_words_across_punctuation(analyser):
+    lines = ["Caesar amatus. Est enim\n", "laudatus\n", "est.\n"]
+    annotations, _, _, _ = annotate_chunk((1, lines), analyser)
+    annotations = [json.loads(annotation) for annotation in annotations]
+    # "amatus" and "Est" are in two sentences (the participle alone isn't a verb form), "laudatus" and "est"
+    # are only separated by a line break
+    assert [annotation["token"] for annotation in annotations] == ["Est", "laudatus est"]
+
+
+def test_enclitic(analyser):
+    annotations, _, lemmas, _ = annotate_chunk((1, ["amatque amoque"]), analyser)
+    assert [json.loads(annotation)["token"] for annotation in annotations] == ["amatque", "amoque"]
+    assert lemmas == {"amare": 2}
+
+
+def test_read_chunks():
+    text = io.StringIO("".join(f"ligne {i}{'.' if i % 3 == 0 else ''}\n" for i in range(1, 11)))
+    chunks = list(read_chunks(text, chunk_lines=2))
+    # Cut at the end of a sentence only
+    assert [(first, len(lines)) for first, lines in chunks] == [(1, 3), (4, 3), (7, 3), (10, 1)]
+
+
+def test_annotate_chunks(verbs_path):
+    chunks = [(1, ["amo amas\n"]), (2, ["amatus est\n"])]
+    results = list(annotate_chunks(iter(chunks), verbs_path))
+    assert [len(annotations) for annotations, _, _, _ in results] == [2, 1]
@@ -0,0 +1,27 @@
+import json
+import os
+
+from benchmark import *
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def test_measure():
+    calls = []
+    result = measure(lambda: calls.append(None), operations=10, repeat=3, min_time=0.001)
+    assert result["repeat"] == 3
+    assert result["number"] > 1
+    # Warm-up, calibration and samples
+    assert len(calls) > 3 * result["number"]
+    assert 0 < result["min"] <= result["median"]
+
+
+def test_run(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    results = run(["filter", "nooj.check"], repeat=2, min_time=0, log=lambda line: None)
+    assert list(results["benchmarks"]) == ["filter.chain", "filter.verbs", "nooj.check"]
+    assert results["sizes"]["json"]["bytes"] > results["sizes"]["json"]["gzip"] > 0
+    assert results["environment"]["dataset"]
+    # The results are written as JSON, and can be compared with those of another run
+    previous = json.loads(json.dumps(results))
+    assert compare(results, previous)[1:] == [f"  {name:28} x1.00" for name in results["benchmarks"]]
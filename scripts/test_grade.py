@@ -0,0 +1,34 @@
+import json
+
+from grade import *
+
+
+def test_grade_latin(list_verbs):
+    answer = {"id": 1, "latin": "amauerit", "person": 3, "tense": "futur antérieur", "voice": "actif", "mood": "subjonctif", "translation": "aimer"}
+    result = grade_answer(answer, list_verbs)
+    assert result["id"] == 1
+    assert result["direction"] == "latin"
+    # Both analyses are accepted for the tense, but the future perfect is only an indicative
+    assert result["steps"] == {"person": True, "tense": True, "voice": True, "mood": False, "translation": True}
+    assert result["score"] == 4
+
+
+def test_grade_latin_spelling(list_verbs):
+    answer = {"latin": "amavit", "person": 3, "tense": "parfait", "voice": "actif", "mood": "indicatif", "translation": "aimer"}
+    assert grade_answer(answer, list_verbs)["score"] == 5
+    assert grade_answer({"latin": "Jussi", "person": 1}, list_verbs)["steps"]["person"] == True
+
+
+def test_grade_french(list_verbs):
+    prompt = {"translation": "aimer", "person": 1, "tense": "présent", "voice": "actif", "mood": "indicatif"}
+    assert grade_answer({**prompt, "answer": "amo"}, list_verbs)["score"] == 1
+    assert grade_answer({**prompt, "answer": "amas"}, list_verbs)["steps"] == {"latin": False}
+
+
+def test_grade_lines(list_verbs):
+    lines = [(1, json.dumps({"latin": "amo", "person": 1})), (2, "{"), (3, json.dumps({"person": 1}))]
+    results = grade_lines(lines, list_verbs)
+    assert results[0]["line"] == 1
+    assert results[0]["steps"]["person"] == True
+    assert "error" in results[1]
+    assert "error" in results[2]
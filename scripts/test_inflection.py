@@ -0,0 +1,51 @@
+import os
+from collections import Counter
+
+import pytest
+from inflection import *
+
+NOOJ_DIR = os.path.join(os.path.dirname(__file__), "..", "NooJ")
+
+
+@pytest.fixture(scope="module")
+def inflector():
+    return Inflector(os.path.join(NOOJ_DIR, "latin_verbs.nof"))
+
+
+@pytest.fixture(scope="module")
+def entries():
+    return read_entries(os.path.join(NOOJ_DIR, "lat_verbes.dic"))
+
+
+def test_matches_nooj(inflector, entries):
+    # Differential test: same lines as the dictionary inflected by NooJ (the order of the lines aside)
+    generated = Counter(line for lemma in entries for line in inflect_lemma(inflector, entries, lemma))
+    with open(os.path.join(NOOJ_DIR, "lat_verbes-flx.dic"), "r", encoding="utf-8") as f:
+        expected = Counter(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    assert generated - expected == Counter()
+    assert expected - generated == Counter()
+
+
+def test_inflect_lemma(inflector, entries):
+    forms = [line.split(",")[0] for line in inflect_lemma(inflector, entries, "amare")]
+    assert "amo" in forms
+    assert "amabar" in forms
+    assert "amatae essetis" in forms
+    assert "amim" not in forms  # present subjunctive of the group 0
+
+
+def test_compile_cache(inflector):
+    assert inflector.compile("GP1_INF") is inflector.compile("GP1_INF")
+    with pytest.raises(KeyError):
+        inflector.compile("GP9_INF")
+
+
+def test_apply_operations():
+    assert apply_operations("amaba", [("text", "or"), ("command", "L", 1), ("command", "B", 1)]) == "amabar"
+    assert apply_operations("es", [("command", "B", 2), ("text", "su"), ("text", "m")]) == "sum"
+    assert apply_operations("leg", [("command", "B", "W"), ("text", "a")]) == "a"
+
+
+def test_merge_features():
+    assert merge_features(["V", "GP=1"], ["VX=act", "GP=1"]) == ["V", "VX=act", "GP=1"]
+    assert merge_features(["NB=sg"], ["NB=pl"]) == ["NB=sg", "NB=pl"]
@@ -0,0 +1,72 @@
+import builtins
+import os
+
+from magister import *
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def test_get_verbs(list_verbs):
+    assert len(list_verbs) > 0
+    # The French index is built with the store, before the first completion
+    assert "french" in list_verbs._indexes
+    verb = list_verbs.analyses("amo")[0]
+    assert verb["person"] == 1
+    assert verb["lemma"] == "amare"
+    assert verb["translation"] == ["aimer"]
+    assert verb["primitive tenses"] == "o, as, are, aui, atum"
+    # Same inflected forms in the three layouts written by nooj.py
+    for path in ["verbs_latin.compact.json", "verbs_latin.bin"]:
+        other = get_verbs(os.path.join(ROOT, path))
+        assert len(other) == len(list_verbs)
+        assert other[1000] == list_verbs[1000]
+    assert list_verbs.french_index.get("aimer") == ["amare"]
+
+
+def test_get_tenses_and_groups(list_verbs):
+    assert get_tenses(list_verbs) == ["futur", "futur antérieur", "imparfait", "parfait", "plus-que-parfait", "présent"]
+    assert get_groups(list_verbs) == [0, 1, 2, 3, 4, 5]
+
+
+def test_filters(list_verbs):
+    filtered_verbs = filter_tense(["présent"], list_verbs)
+    assert len(filtered_verbs) > 0
+    assert all(verb["tense"] == "présent" for verb in filtered_verbs)
+    filtered_verbs = filter_person([3], filter_group([2], filtered_verbs))
+    assert all(verb["group"] == 2 and verb["person"] == 3 for verb in filtered_verbs)
+    assert filter_tense(None, list_verbs).rows.tolist() == list_verbs.rows.tolist()
+
+    # The chain of filters and the single mask of filter_verbs() select the same rows
+    chained = filter_mood("indicatif", filter_voice("actif", filter_person([1, 6], filter_group([1, 3], filter_tense(["futur"], list_verbs)))))
+    combined = filter_verbs(list_verbs, ["futur"], [1, 3], [1, 6], "actif", "indicatif")
+    assert chained.rows.tolist() == combined.rows.tolist()
+
+
+def test_personne():
+    assert personne(1) == "1e personne du singulier"
+    assert personne(6) == "3e personne du pluriel"
+
+
+def test_ask_verb(list_verbs, monkeypatch, capsys):
+    answers = iter(["3", "futur", "actif", "indicatif", "aimer", "amabunt"])
+    monkeypatch.setattr(builtins, "input", lambda message="": next(answers))
+    assert ask_verb(list_verbs.analyses("amabit")[0], list_verbs) == 5
+    assert "Bravo !" in capsys.readouterr().out
+    assert ask_verb_reverse(list_verbs.analyses("amabunt")[0], list_verbs) == 1
+
+
+def test_check_manifest(tmp_path, verbs_path):
+    manifest = get_manifest(os.path.join(ROOT, "verbs_latin.manifest.json"))
+    assert check_manifest(manifest, verbs_path)
+    assert check_manifest(manifest, verbs_path, full=True)
+    # Same name, another content: the size differs
+    changed = tmp_path / "verbs_latin.json"
+    changed.write_text("[]", encoding="utf-8")
+    assert not check_manifest(manifest, str(changed))
+
+
+def test_default_verbs_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert default_verbs_path() == "verbs_latin.json"
+    (tmp_path / "verbs_latin.bin").write_bytes(b"")
+    assert default_verbs_path() == "verbs_latin.bin"
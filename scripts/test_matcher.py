@@ -0,0 +1,58 @@
+import random
+
+from matcher import *
+
+
+def test_fold():
+    assert fold("  Être   Absent ") == "etre absent"
+    assert fold("s’enfuir") == "s'enfuir"
+    assert fold_latin("Jussi") == "iussi"
+    assert fold_latin("amātus  SVM") == "amatus sum"
+
+
+def test_distance():
+    assert distance("amaui", "amaui") == 0
+    assert distance("amaui", "amauit") == 1
+    assert distance("amaui", "amiau") == 2
+    assert distance("", "sum") == 3
+
+
+def test_matcher():
+    forms = ["amaui", "amauit", "amatus sum", "iussi", "monui"]
+    matcher = Matcher(forms, fold_latin)
+    assert matcher.match("Amavi") == ["amaui"]
+    assert matcher.match("jussi") == ["iussi"]
+    assert matcher.match("amatus   sum") == ["amatus sum"]
+    assert matcher.match("amaus") == []
+    assert matcher.suggest("amaiu")[0] == "amaui"
+    assert matcher.suggest("amatus sim") == ["amatus sum"]
+    assert matcher.suggest("xyz") == []
+
+
+def test_suggestions_are_the_closest():
+    # Same results as a scan of all the words, for the typos the index covers
+    random.seed(0)
+    words = list({"".join(random.choice("aeimnorstu") for _ in range(random.randint(3, 8))) for _ in range(2000)})
+    matcher = Matcher(words)
+    for word in random.sample(words, 50):
+        position = random.randrange(len(word))
+        typo = word[:position] + "x" + word[position + 1 :]
+        closest = min(distance(typo, other) for other in words)
+        assert distance(typo, matcher.suggest(typo)[0]) == closest
+
+
+def test_prefix_index():
+    index = PrefixIndex({"conduire": ["ducere"], "connaître": ["cognoscere"], "écouter": ["audire"], "être": ["esse"]})
+    assert index.get("Conduire") == ["ducere"]
+    assert index.get("etre") == ["esse"]
+    assert index.get("cond") == []
+    assert index.complete("con") == [("conduire", ["ducere"]), ("connaître", ["cognoscere"])]
+    assert index.complete("E", limit=1) == [("écouter", ["audire"])]
+    assert index.complete("x") == []
+    # Same results as a scan of all the labels
+    random.seed(0)
+    words = {"".join(random.choice("abcé") for _ in range(random.randint(1, 6))): [i] for i in range(500)}
+    index = PrefixIndex(words)
+    for prefix in ["", "a", "e", "ab", "cea", "ébé"]:
+        expected = sorted((fold(word), word) for word in words if fold(word).startswith(fold(prefix)))
+        assert [label for label, _ in index.complete(prefix, limit=None)] == [word for _, word in expected]
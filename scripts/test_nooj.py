@@ -0,0 +1,122 @@
+import os
+import sys
+
+from nooj import *
+
+DIC_PATH = os.path.join(os.path.dirname(__file__), "..", "NooJ", "lat_verbes-flx.dic")
+
+
+def lemma_lines(*lemmas) -> list[str]:
+    """Lines of NooJ/lat_verbes-flx.dic of some lemmas"""
+    with open(DIC_PATH, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if not line.startswith("#") and line.split(",")[1:2] and line.split(",")[1] in lemmas]
+
+
+def test_escaped_lemma(tmp_path):
+    # NooJ escapes its special characters: the lines are grouped by the lemma pynooj returns
+    lines = [line.replace(",amare,", ",am\\-are,") for line in lemma_lines("amare")]
+    dic_path = tmp_path / "escaped.dic"
+    dic_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    lines_by_lemma = read_dic_lines_by_lemma(str(dic_path))
+    assert list(lines_by_lemma) == ["am-are"]
+    built = build_chunk(lines_by_lemma)
+    assert built["am-are"]["forms"][0]["lemma"] == "am-are"
+
+
+def build(tmp_path, name, lines, *options) -> dict[str, bytes]:
+    """Run nooj.py on some NooJ lines in a directory of its own, and return its outputs (path -> content)"""
+    root = tmp_path / name
+    (root / "NooJ").mkdir(parents=True, exist_ok=True)
+    (root / "web").mkdir(exist_ok=True)
+    (root / "NooJ" / "lat_verbes-flx.dic").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.chdir(root)
+    sys.argv = ["nooj.py", *options]
+    main()
+    outputs = {}
+    for directory, _, file_names in os.walk(root):
+        for file_name in file_names:
+            path = os.path.join(directory, file_name)
+            if file_name != CACHE_PATH and not path.endswith(".dic"):
+                with open(path, "rb") as f:
+                    outputs[os.path.relpath(path, root)] = f.read()
+    return outputs
+
+
+def test_same_outputs(tmp_path, monkeypatch):
+    # Same files without the cache, with the cache (second build), and with several processes
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", sys.argv)
+    lines = lemma_lines("amare", "audire", "esse", "legere", "sequi")
+    reference = build(tmp_path, "reference", lines, "--no-cache")
+    assert "verbs_latin.json" in reference and "verbs_latin.bin" in reference
+    assert build(tmp_path, "parallel", lines, "--no-cache", "--jobs", "2") == reference
+
+    cached = build(tmp_path, "cached", lines)
+    assert os.path.exists(CACHE_PATH)
+    os.remove("verbs_latin.json")
+    assert build(tmp_path, "cached", lines) == cached == reference
+    # A changed lemma is rebuilt, the others come from the cache
+    changed = [line.replace("TRAD=aimer", "TRAD=chérir") for line in lines]
+    assert build(tmp_path, "cached", changed) == build(tmp_path, "changed", changed, "--no-cache")
+
+
+def test_paradigm_coverage():
+    def forms(lemma, cells):
+        return [{"lemma": lemma, "group": 3, "mood": mood, "voice": voice, "tense": tense, "person": person} for mood, voice, tense, person in cells]
+
+    assert paradigm_coverage(forms("legere", expected_paradigm(False))) == ({}, {})
+
+    cells = expected_paradigm(False)
+    cells.remove(("indicatif", "passif", "futur", 2))
+    cells.append(("subjonctif", "actif", "futur", 1))
+    missing, extras = paradigm_coverage(forms("legere", cells))
+    assert missing == {"group=3, mood=indicatif, voice=passif, tense=futur, person=2": ["legere"]}
+    assert extras == {"group=3, mood=subjonctif, voice=actif, tense=futur, person=1": ["legere"]}
+
+    # Outside of the checked grid: a passive form of a deponent verb is not reported
+    cells = expected_paradigm(True) + [("indicatif", "passif", "présent", 1)]
+    assert paradigm_coverage(forms("sequi", cells)) == ({}, {})
+
+
+def test_shards_hold_syncretic_analyses(tmp_path):
+    # "agam" is a futur (shard g3-futur) as well as a subjonctif présent (shard g3-present)
+    store = VerbStore.from_records(process_lines(lemma_lines("agere")))
+    write_shards(store, str(tmp_path))
+    content = (tmp_path / "g3-futur.js").read_text(encoding="utf-8")
+    data = json.loads(content[content.index("=") + 1 : content.rindex(";")])
+    syncretic = data["syncretic"]
+    assert "agam" in data["forms"]["latin"]
+    rows = [i for i, latin in enumerate(syncretic["forms"]["latin"]) if latin == "agam"]
+    assert [syncretic["tables"]["tense"][syncretic["forms"]["tense"][i]] for i in rows] == ["présent"]
+    # Only the analyses of the other shards
+    assert "futur" not in syncretic["tables"]["tense"]
+
+
+def test_write_assets_variants(tmp_path, monkeypatch):
+    (tmp_path / "app.js").write_text("window.APP = 1;\n", encoding="utf-8")
+    monkeypatch.setattr("nooj.brotli", None)
+    manifest = write_assets(str(tmp_path), ["app.js"])
+    hashed = tmp_path / manifest["files"]["app.js"]
+    assert hashed.exists() and os.path.exists(f"{hashed}.gz") and not os.path.exists(f"{hashed}.br")
+
+    # Brotli installed later: the missing .br variant is written, the others are kept
+    class Brotli:
+        compress = staticmethod(lambda content: b"br" + content)
+
+    monkeypatch.setattr("nooj.brotli", Brotli)
+    manifest = write_assets(str(tmp_path), ["app.js"])
+    assert manifest["encodings"] == ["gzip", "br"]
+    assert (tmp_path / f"{manifest['files']['app.js']}.br").read_bytes() == b"brwindow.APP = 1;\n"
+
+
+def test_cache_key(tmp_path, monkeypatch):
+    paradigms = tmp_path / "latin_verbs.nof"
+    paradigms.write_text("AMARE = <E>/inf;\n", encoding="utf-8")
+    key = cache_key([str(paradigms)])
+    assert cache_key([str(paradigms)]) == key != cache_key()
+    # A change of the paradigms, or of the version of pynooj, drops the cache
+    paradigms.write_text("AMARE = <B>/inf;\n", encoding="utf-8")
+    assert cache_key([str(paradigms)]) != key
+    code_key = cache_key()
+    monkeypatch.setattr("importlib.metadata.version", lambda name: "0.0.0")
+    assert cache_key() != code_key
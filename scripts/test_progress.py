@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+from progress import *
+from quiz import Quiz
+from scheduler import MAX_BOX
+from server import QuizServer
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProgressStore(str(tmp_path / "progress.sqlite"))
+    yield store
+    store.close()
+
+
+def answer(list_verbs, verb, latin) -> Quiz:
+    """A question in direction français, answered once (and revealed if wrong)"""
+    quiz = Quiz(list_verbs)
+    quiz.start_question(verb, "français")
+    if not quiz.submit("latin", latin)["correct"]:
+        quiz.reveal("latin")
+    return quiz
+
+
+def test_flush_and_weakest(list_verbs, store):
+    verbs = list(list_verbs.filter(tense=["futur"], group=[1], person=[1], voice="actif", mood="indicatif"))[:3]
+    session = store.start_session("marcus", {"direction": "français"}, rounds=4)
+    session.record_question(answer(list_verbs, verbs[0], verbs[0]["latin"]), 1)
+    session.record_question(answer(list_verbs, verbs[1], "x"), 0)
+    session.record_question(answer(list_verbs, verbs[1], "x"), 0)
+    session.record_question(answer(list_verbs, verbs[2], verbs[2]["latin"]), 1)
+    # Nothing is written before the end of the session
+    assert store.connection.execute("SELECT COUNT(*) FROM attempts").fetchone() == (0,)
+    session.close()
+
+    # One answer per correct question, an answer and a reveal per failed one
+    assert store.connection.execute("SELECT COUNT(*) FROM attempts").fetchone() == (6,)
+    weakest = store.weakest("marcus")
+    assert [item["latin"] for item in weakest][0] == verbs[1]["latin"]
+    assert weakest[0]["questions"] == 2
+    assert weakest[0]["failures"] == 2
+    assert store.boxes("marcus") == {form_key(verbs[0]): 1, form_key(verbs[1]): 0, form_key(verbs[2]): 1}
+    assert store.weakest("julia") == []
+    assert store.resume_session("marcus") is None
+
+
+def test_resume_session(list_verbs, store):
+    settings = {"direction": "français", "temps": ["futur"], "groupe": None}
+    verb = list_verbs.filter(tense=["futur"])[0]
+    session = store.start_session("marcus", settings, rounds=3)
+    session.record_question(answer(list_verbs, verb, verb["latin"]), 1)
+    session.flush()
+
+    resumed = store.resume_session("marcus")
+    assert resumed.id == session.id
+    assert resumed.settings == {**settings, "personne": None, "voix": None, "mode": None}
+    assert (resumed.round, resumed.rounds, resumed.total_score) == (1, 3, 1)
+
+    store.abandon_session(resumed)
+    assert store.resume_session("marcus") is None
+
+
+def test_restore(list_verbs, store):
+    filtered_verbs = list_verbs.filter(tense=["futur"], group=[1], person=[1])
+    verb = filtered_verbs[0]
+    session = store.start_session("marcus", {}, rounds=1)
+    session.record_question(answer(list_verbs, verb, verb["latin"]), MAX_BOX)
+    session.close()
+
+    scheduler = Scheduler(filtered_verbs)
+    store.restore(scheduler, "marcus")
+    assert scheduler.boxes == {0: MAX_BOX}
+    # A cell is only restored once all its forms are in a box
+    scheduler = Scheduler(filtered_verbs, unit="cell")
+    store.restore(scheduler, "marcus")
+    assert scheduler.boxes == {}
+
+
+def test_concurrent_writers(list_verbs, store):
+    verbs = list(list_verbs.filter(tense=["présent"], person=[1]))[:20]
+
+    def learner(name):
+        for _ in range(5):
+            session = store.start_session(name, {}, rounds=len(verbs))
+            for verb in verbs:
+                session.record_question(answer(list_verbs, verb, "x"), 0)
+            session.close()
+
+    threads = [threading.Thread(target=learner, args=(f"learner {i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert store.connection.execute("SELECT COUNT(*) FROM sessions WHERE finished = 1").fetchone() == (40,)
+    assert store.connection.execute("SELECT COUNT(*) FROM attempts").fetchone() == (8 * 5 * 20 * 2,)
+    assert store.weakest("learner 3", limit=1)[0]["questions"] == 5
+
+
+def test_resume_server_session(list_verbs, store, monkeypatch):
+    server = QuizServer(list_verbs, store)
+    response = server.handle(
+        {"action": "new", "rounds": 2, "direction": "français", "learner": "marcus", "filters": {"temps": ["futur"]}}
+    )
+    server.handle({"action": "reveal", "session": response["session"], "step": "latin"})
+    # The session expires before its end, and is resumed by the CLI (which needs all the settings)
+    monkeypatch.setattr("server.SESSION_TTL", -1)
+    server.expire_sessions()
+    session = store.resume_session("marcus")
+    assert session.round == 1
+    assert session.settings == {**full_settings({}), "direction": "français", "temps": ["futur"]}
+
+
+def test_server_saves_progress(list_verbs, store):
+    server = QuizServer(list_verbs, store)
+    response = server.handle({"action": "new", "rounds": 2, "direction": "français", "learner": "marcus"})
+    session = response["session"]
+    server.handle({"action": "reveal", "session": session, "step": "latin"})
+    assert store.boxes("marcus") == {}
+    response = server.handle({"action": "reveal", "session": session, "step": "latin"})
+    assert response["finished"] == True
+    assert len(store.weakest("marcus")) in [1, 2]
+    assert all(item["box"] == 0 for item in store.weakest("marcus"))
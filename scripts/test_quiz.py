@@ -0,0 +1,70 @@
+import pytest
+from quiz import *
+
+
+def get_verb(list_verbs, latin):
+    return list_verbs.analyses(latin)[0]
+
+
+def test_latin_question(list_verbs):
+    quiz = Quiz(list_verbs)
+    question = quiz.start_question(get_verb(list_verbs, "amo"), "latin")
+    assert question["prompt"] == {"latin": "amo"}
+    assert question["step"] == "person"
+
+    assert quiz.submit("person", "2")["correct"] == False
+    assert quiz.step == "person"
+    assert quiz.submit("person", " 1 ")["correct"] == True
+    assert quiz.submit("tense", "Présent")["next"] == "voice"
+    assert quiz.reveal("voice") == {"step": "voice", "answers": ["actif"], "score": 2, "next": "mood", "done": False}
+    assert quiz.submit("mood", "indicatif")["score"] == 3
+    result = quiz.submit("translation", "aimer")
+    assert result["done"] == True
+    assert result["score"] == 4
+
+
+def test_syncretism(list_verbs):
+    # "amauerit" is a perfect subjunctive as well as a future perfect indicative
+    quiz = Quiz(list_verbs)
+    quiz.start_question(get_verb(list_verbs, "amauerit"), "latin")
+    quiz.submit("person", "3")
+    assert sorted(quiz.accepted("tense")) == ["futur antérieur", "parfait"]
+    quiz.submit("tense", "parfait")
+    quiz.submit("voice", "actif")
+    assert quiz.accepted("mood") == ["subjonctif"]
+
+
+def test_french_question(list_verbs):
+    quiz = Quiz(list_verbs)
+    quiz.start_question(get_verb(list_verbs, "amo"), "français")
+    assert quiz.hint("lemma") == {"hint": "lemma", "value": "amare"}
+    assert quiz.submit("latin", "amas")["correct"] == False
+    assert quiz.submit("latin", "amo") == {"step": "latin", "correct": True, "score": 1, "next": None, "done": True}
+
+
+def test_invalid_actions(list_verbs):
+    quiz = Quiz(list_verbs)
+    with pytest.raises(ValueError):
+        quiz.submit("person", "1")
+    quiz.start_question(get_verb(list_verbs, "amo"), "latin")
+    with pytest.raises(ValueError):
+        quiz.submit("tense", "présent")
+    with pytest.raises(ValueError):
+        quiz.hint("lemma")
+    assert quiz.submit("person", "un")["correct"] == False
+
+
+def test_spelling_variants(list_verbs):
+    quiz = Quiz(list_verbs)
+    quiz.start_question(get_verb(list_verbs, "amaui"), "français")
+    result = quiz.submit("latin", "amavii")
+    assert result["correct"] == False
+    assert "amaui" in result["suggestions"]
+    # A Latin form which exists is not corrected
+    assert "suggestions" not in quiz.submit("latin", "amas")
+    assert quiz.submit("latin", " AMAVI ")["correct"] == True
+
+    quiz.start_question(get_verb(list_verbs, "aberas"), "latin")
+    for step, answer in [("person", "2"), ("tense", "imparfait"), ("voice", "actif"), ("mood", "indicatif")]:
+        quiz.submit(step, answer)
+    assert quiz.submit("translation", "etre  ABSENT")["correct"] == True
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+from scheduler import *
+
+
+def test_scheduler_forms(list_verbs):
+    filtered_verbs = list_verbs.filter(tense=["présent"], group=[1], person=[1])
+    scheduler = Scheduler(filtered_verbs)
+    assert len(scheduler) == len(filtered_verbs)
+
+    item, verb = scheduler.draw()
+    assert verb["tense"] == "présent"
+    for _ in range(MAX_BOX + 2):
+        scheduler.update(item, 1)
+    assert scheduler.box(item) == MAX_BOX
+    scheduler.update(item, 0.6)
+    assert scheduler.box(item) == MAX_BOX
+    scheduler.update(item, 0)
+    assert scheduler.box(item) == 0
+    # Only the items out of the first box are kept
+    assert scheduler.boxes == {}
+    with pytest.raises(ValueError):
+        Scheduler(list_verbs.filter(tense=["aoriste"])).draw()
+
+
+def test_scheduler_mastered_items_are_drawn_less(list_verbs):
+    scheduler = Scheduler(list_verbs.filter(tense=["futur"], group=[1], person=[1], voice="actif", mood="indicatif"))
+    mastered = set(range(0, len(scheduler), 2))
+    for item in mastered:
+        scheduler.set_box(item, MAX_BOX)
+    random.seed(0)
+    draws = [scheduler.draw()[0] for _ in range(2000)]
+    # Expected share of the mastered items: 2 ** -MAX_BOX / (1 + 2 ** -MAX_BOX), about 3 %
+    assert 20 < sum(item in mastered for item in draws) < 200
+
+    scheduler.uniform = True
+    draws = [scheduler.draw()[0] for _ in range(2000)]
+    assert sum(item in mastered for item in draws) > 800
+
+
+def test_scheduler_cells(list_verbs):
+    scheduler = Scheduler(list_verbs.filter(group=[1]), unit="cell")
+    # One item per lemma x tense
+    assert len(scheduler) == len({(verb["lemma"], verb["tense"]) for verb in list_verbs.filter(group=[1])})
+    item, verb = scheduler.draw()
+    assert all(list_verbs.record(row)["tense"] == verb["tense"] for row in scheduler.rows(item))
+    with pytest.raises(ValueError):
+        Scheduler(list_verbs, unit="lemma")
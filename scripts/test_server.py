@@ -0,0 +1,177 @@
+import asyncio
+import base64
+import json
+import secrets
+
+import server
+from server import *
+
+
+async def post(port, message) -> tuple[int, dict]:
+    """Local HTTP client: one message per request"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(message).encode("utf-8")
+    writer.write(
+        f"POST /api HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    request_line, headers = await read_http_head(reader)
+    response = json.loads(await reader.readexactly(int(headers["content-length"])))
+    writer.close()
+    return int(request_line.split(" ")[1]), response
+
+
+def test_http_session(list_verbs):
+    async def scenario():
+        server = await asyncio.start_server(QuizServer(list_verbs).serve_client, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            status, response = await post(
+                port,
+                {"action": "new", "rounds": 2, "direction": "français", "filters": {"temps": ["futur"], "groupe": [1]}},
+            )
+            assert status == 200
+            session = response["session"]
+            assert response["question"]["prompt"]["tense"] == "futur"
+            assert response["round"] == 1
+
+            status, response = await post(port, {"action": "hint", "session": session, "kind": "lemma"})
+            assert status == 200
+            assert response["value"].endswith("are")
+
+            status, response = await post(port, {"action": "submit", "session": session, "step": "latin", "answer": "x"})
+            assert response["correct"] == False
+
+            status, response = await post(port, {"action": "reveal", "session": session, "step": "latin"})
+            assert response["done"] == True
+            assert response["round"] == 2
+            assert response["question"]["step"] == "latin"
+
+            status, response = await post(port, {"action": "reveal", "session": session, "step": "latin"})
+            assert response["finished"] == True
+            assert response["total score"] == 0
+
+            status, response = await post(port, {"action": "reveal", "session": session, "step": "latin"})
+            assert status == 400
+
+            status, response = await post(port, {"action": "new", "filters": {"temps": ["aoriste"]}})
+            assert response == {"error": "Aucun verbe disponible pour ces options"}
+
+    asyncio.run(scenario())
+
+
+def test_complete(list_verbs):
+    server = QuizServer(list_verbs)
+    response = server.handle({"action": "complete", "prefix": "Cond"})
+    assert {"translation": "conduire", "lemmas": ["ducere"]} in response["completions"]
+    assert all(completion["translation"].startswith("cond") for completion in response["completions"])
+    assert len(server.handle({"action": "complete", "prefix": "", "limit": 3})["completions"]) == 3
+    assert "error" in server.handle({"action": "complete", "prefix": "a", "limit": 0})
+
+
+def test_websocket_session(list_verbs):
+    async def scenario():
+        server = await asyncio.start_server(QuizServer(list_verbs).serve_client, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            key = base64.b64encode(secrets.token_bytes(16)).decode()
+            writer.write(
+                f"GET /ws HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode("latin-1")
+            )
+            request_line, headers = await read_http_head(reader)
+            assert request_line.startswith("HTTP/1.1 101")
+
+            async def send(message):
+                writer.write(encode_frame(0x1, json.dumps(message).encode("utf-8"), mask=True))
+                opcode, payload = await read_frame(reader)
+                assert opcode == 0x1
+                return json.loads(payload)
+
+            response = await send({"action": "new", "rounds": 1, "direction": "latin", "filters": {"personne": [1]}})
+            session = response["session"]
+            # The client answers with one of the analyses of the Latin form (with the person of the filter)
+            analyses = list_verbs.analyses(response["question"]["prompt"]["latin"])
+            profile = [p for p in analyses if p["person"] == 1][0]
+            for step in ["person", "tense", "voice", "mood"]:
+                response = await send({"action": "submit", "session": session, "step": step, "answer": str(profile[step])})
+                assert response["correct"] == True
+            response = await send(
+                {"action": "submit", "session": session, "step": "translation", "answer": profile["translation"][0]}
+            )
+            assert response["done"] == True
+            assert response["finished"] == True
+            assert response["total score"] == 1
+
+            writer.write(encode_frame(0x8, b"", mask=True))
+            opcode, _ = await read_frame(reader)
+            assert opcode == 0x8
+            writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_invalid_messages(list_verbs):
+    quiz_server = QuizServer(list_verbs)
+    for message in [
+        {"action": "new", "filters": ["x"]},
+        {"action": "new", "filters": {"temps": "présent"}},
+        {"action": "new", "filters": {"groupe": [{"x": 1}]}},
+        {"action": "new", "filters": {"voix": ["actif"]}},
+        {"action": "new", "rounds": "5"},
+        {"action": "new", "rounds": True},
+        {"action": "status", "session": ["x"]},
+        {"action": "complete", "prefix": 1},
+    ]:
+        assert "error" in quiz_server.handle(message)
+    session = quiz_server.handle({"action": "new", "direction": "latin", "filters": {"voix": "actif", "personne": [1]}})
+    response = quiz_server.handle({"action": "submit", "session": session["session"], "step": "person", "answer": {}})
+    assert "error" in response
+
+
+def test_connection_limits(list_verbs, monkeypatch):
+    monkeypatch.setattr(server, "READ_TIMEOUT", 0.2)
+
+    async def scenario():
+        quiz_server = await asyncio.start_server(QuizServer(list_verbs).serve_client, "127.0.0.1", 0)
+        port = quiz_server.sockets[0].getsockname()[1]
+        async with quiz_server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"POST /api HTTP/1.1\r\nContent-Length: {MAX_MESSAGE_SIZE + 1}\r\n\r\n".encode("latin-1"))
+            request_line, _ = await read_http_head(reader)
+            assert request_line.startswith("HTTP/1.1 413")
+            writer.close()
+
+            # A client which doesn't send its whole request is disconnected
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"POST /api HTTP/1.1\r\nContent-Length: 10\r\n\r\n{")
+            assert await asyncio.wait_for(reader.read(), 5) == b""
+            writer.close()
+
+            async def websocket():
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                key = base64.b64encode(secrets.token_bytes(16)).decode()
+                handshake = f"GET /ws HTTP/1.1\r\nUpgrade: websocket\r\nSec-WebSocket-Key: {key}\r\n\r\n"
+                writer.write(handshake.encode("latin-1"))
+                await read_http_head(reader)
+                return reader, writer
+
+            reader, writer = await websocket()
+            # A message which isn't UTF-8 is answered with an error, the connection stays open
+            writer.write(encode_frame(0x1, b"\xff", mask=True))
+            opcode, payload = await read_frame(reader)
+            assert (opcode, json.loads(payload)) == (0x1, {"error": "Message JSON invalide"})
+            writer.write(encode_frame(0x1, b" " * (MAX_MESSAGE_SIZE + 1), mask=True))
+            opcode, payload = await read_frame(reader)
+            assert (opcode, payload) == (0x8, struct.pack("!H", 1009))
+            writer.close()
+
+            # First frame of a fragmented message (FIN bit not set)
+            reader, writer = await websocket()
+            writer.write(bytes([0x01, 0x80 | 1]) + bytes(4) + b"{")
+            opcode, payload = await read_frame(reader)
+            assert (opcode, payload) == (0x8, struct.pack("!H", 1003))
+            writer.close()
+
+    asyncio.run(scenario())
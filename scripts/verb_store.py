@@ -0,0 +1,420 @@
+import json
+import mmap
+import struct
+
+import numpy as np
+
+from matcher import Matcher, PrefixIndex, fold, fold_latin
+
+
+# Facets stored as small integer codes, each with its own lookup table of values
+CODED_FACETS = ["gender", "mood", "voice", "tense", "lemma", "translation", "primitive tenses", "flx"]
+
+# Binary dataset (see write_binary()): header, lookup tables (json), fixed-width records, string pool (Latin forms)
+BINARY_MAGIC = b"MAGC"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sHHIII")  # magic, version, reserved, number of records, tables length, pool length
+BINARY_RECORD = np.dtype(
+    [
+        ("latin offset", "<u4"),  # position of the Latin form in the string pool (bytes)
+        ("latin length", "<u2"),
+        ("gender", "u1"),
+        ("mood", "u1"),
+        ("voice", "u1"),
+        ("tense", "u1"),
+        ("lemma", "<u2"),
+        ("translation", "<u2"),
+        ("primitive tenses", "<u2"),
+        ("flx", "u1"),
+        ("person", "u1"),
+        ("group", "u1"),
+        ("irregular", "u1"),
+    ]
+)
+
+
+class VerbStore:
+    """Columnar storage of the inflected forms.
+
+    Instead of one dict per inflected form, each facet (mood, voice, tense, translation...) is a NumPy array
+    of small integer codes, and each value is kept only once in a lookup table.
+
+    A store can be a view on a subset of the rows (see filter()): views share the columns
+    (and the indexes) with the store they come from, only the row indices differ.
+
+    The store is indexed by Latin form (latin_index), so that all the analyses of a syncretic form
+    (ex: "legeris" = présent passif or futur antérieur actif) are found without scanning all the rows.
+    It is also indexed by (person, tense, voice, mood, translation) (answer_index), so that all the
+    Latin forms accepted for a French prompt (syncretism + synonyms) are found the same way, and the
+    lemmas by French infinitive (french_index, with prefix completion: "cond" -> "conduire" -> ["ducere"]).
+    The indexes are built only once per store, the first time they are needed.
+
+    Iterating over a store (or indexing it) rebuilds the usual dicts:
+    {"gender": None, "mood": "indicatif", "voice": "actif", "tense": "futur", "latin": "abero",
+     "lemma": "abesse", "group": 0, "translation": ["être absent"],
+     "primitive tenses": "absum, abes, abesse, afui", "person": 1, "flx": "GP0_INF"}
+    """
+
+    def __init__(self, tables, codes, person, group, irregular, latin, indexes=None, rows=None):
+        self.tables = tables  # facet -> list of values (the code is the index in the list)
+        self.codes = codes  # facet -> np.ndarray of codes (one per inflected form)
+        self.person = person
+        self.group = group
+        self.irregular = irregular
+        self.latin = latin  # list of str, or StringPool
+        # Indexes shared between the store and all its views, built on first use
+        self._indexes = {} if indexes is None else indexes
+        if rows is None:
+            rows = np.arange(len(latin), dtype=np.int32)
+        self.rows = rows
+        self._selected = None
+
+    @classmethod
+    def from_records(cls, records):
+        """Builds a store from an iterable of dicts (one per inflected form), as written by nooj.py"""
+        tables = {facet: [] for facet in CODED_FACETS}
+        lookups = {facet: {} for facet in CODED_FACETS}
+        codes = {facet: [] for facet in CODED_FACETS}
+        person, group, irregular, latin = [], [], [], []
+
+        for record in records:
+            for facet in CODED_FACETS:
+                value = record[facet]
+                # Lists (translations) can't be used as dict keys
+                key = tuple(value) if isinstance(value, list) else value
+                code = lookups[facet].get(key)
+                if code is None:
+                    code = lookups[facet][key] = len(tables[facet])
+                    tables[facet].append(value)
+                codes[facet].append(code)
+            person.append(record["person"])
+            group.append(record["group"])
+            irregular.append(record.get("irrégulier", False))
+            latin.append(record["latin"])
+
+        return cls(
+            tables=tables,
+            codes={facet: np.array(codes[facet], dtype=_code_dtype(tables[facet])) for facet in CODED_FACETS},
+            person=np.array(person, dtype=np.uint8),
+            group=np.array(group, dtype=np.uint8),
+            irregular=np.array(irregular, dtype=bool),
+            latin=latin,
+        )
+
+    @classmethod
+    def from_compact(cls, data):
+        """Builds a store from the compact (normalised) layout written by nooj.py (see to_compact())"""
+        forms = data["forms"]
+        lemma_codes = np.array(forms["lemma"], dtype=_code_dtype(data["lemmas"]["lemma"]))
+        tables = dict(data["tables"], lemma=data["lemmas"]["lemma"])
+        irregular = np.zeros(len(forms["latin"]), dtype=bool)
+        irregular[forms["irrégulier"]] = True
+
+        return cls(
+            tables=tables,
+            codes={
+                facet: lemma_codes if facet == "lemma" else np.array(forms[facet], dtype=_code_dtype(tables[facet]))
+                for facet in CODED_FACETS
+            },
+            person=np.array(forms["person"], dtype=np.uint8),
+            group=np.array(data["lemmas"]["group"], dtype=np.uint8)[lemma_codes],
+            irregular=irregular,
+            latin=forms["latin"],
+        )
+
+    def to_compact(self) -> dict:
+        """Normalised layout of the rows of this store (or view): one lemma table, and the inflected forms as columns
+        of integer codes referring to the lemma table and to the lookup tables of the other facets.
+
+        {"lemmas": {"lemma": ["abesse", ...], "group": [0, ...]},
+         "tables": {"gender": [null, "masculin", "féminin"], "mood": ["indicatif", ...], ...},
+         "forms": {"latin": ["abero", ...], "lemma": [0, ...], "gender": [0, ...], ..., "person": [1, ...],
+                   "irrégulier": [rows of the irregular forms]}}
+        """
+        rows = self.rows
+        forms = {"latin": [self.latin[row] for row in rows]}
+        tables = {}
+        # Only the values used by the rows are kept in the tables (all of them for a whole store)
+        for facet in CODED_FACETS:
+            used, codes = np.unique(self.codes[facet][rows], return_inverse=True)
+            tables[facet] = [self.tables[facet][code] for code in used]
+            forms[facet] = codes.tolist()
+        forms["person"] = self.person[rows].tolist()
+        forms["irrégulier"] = np.flatnonzero(self.irregular[rows]).tolist()
+
+        lemma_groups = np.zeros(len(tables["lemma"]), dtype=np.uint8)
+        lemma_groups[forms["lemma"]] = self.group[rows]
+
+        return {
+            "lemmas": {"lemma": tables["lemma"], "group": lemma_groups.tolist()},
+            "tables": {facet: tables[facet] for facet in CODED_FACETS if facet != "lemma"},
+            "forms": forms,
+        }
+
+    @classmethod
+    def open_binary(cls, bin_path):
+        """Opens a binary dataset written by write_binary().
+
+        The file is memory-mapped: the columns are NumPy views on the mapped records
+        and the Latin forms are only decoded when they are accessed.
+        """
+        with open(bin_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count, tables_length, pool_length = BINARY_HEADER.unpack_from(buffer, 0)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(f"{bin_path} is not a binary dataset (version {BINARY_VERSION})")
+
+        offset = BINARY_HEADER.size
+        tables = json.loads(buffer[offset : offset + tables_length].decode("utf-8"))
+        offset += tables_length
+        records = np.frombuffer(buffer, dtype=BINARY_RECORD, count=count, offset=offset)
+        offset += records.nbytes
+        pool = memoryview(buffer)[offset : offset + pool_length]
+
+        return cls(
+            tables=tables,
+            codes={facet: records[facet] for facet in CODED_FACETS},
+            person=records["person"],
+            group=records["group"],
+            irregular=records["irregular"],
+            latin=StringPool(pool, records["latin offset"], records["latin length"]),
+        )
+
+    @property
+    def latin_index(self) -> dict[str, list[int]]:
+        """Latin form -> rows sharing this form"""
+        if "latin" not in self._indexes:
+            self._indexes["latin"] = build_latin_index(self.latin)
+        return self._indexes["latin"]
+
+    @property
+    def answer_index(self) -> dict[tuple, list[int]]:
+        """(person, tense, voice, mood, translation) -> rows"""
+        if "answer" not in self._indexes:
+            self._indexes["answer"] = build_answer_index(self.tables, self.codes, self.person)
+        return self._indexes["answer"]
+
+    @property
+    def latin_matcher(self) -> Matcher:
+        """Latin forms by normalised spelling (u/v, i/j, case, spaces), see matcher.py"""
+        if "latin matcher" not in self._indexes:
+            self._indexes["latin matcher"] = Matcher(self.latin_index, fold_latin)
+        return self._indexes["latin matcher"]
+
+    @property
+    def translation_matcher(self) -> Matcher:
+        """French translations by normalised spelling (case, accents, spaces), see matcher.py"""
+        if "translation matcher" not in self._indexes:
+            translations = dict.fromkeys(t for ts in self.tables["translation"] for t in ts)
+            self._indexes["translation matcher"] = Matcher(translations, fold)
+        return self._indexes["translation matcher"]
+
+    @property
+    def french_index(self) -> PrefixIndex:
+        """French infinitive -> lemmas translated by it, sorted by normalised infinitive for the completion"""
+        if "french" not in self._indexes:
+            self._indexes["french"] = build_french_index(self.tables, self.codes)
+        return self._indexes["french"]
+
+    def build_indexes(self, *names: str):
+        """Build some of the lazy indexes now (ex: "french_index"), so that their first lookup doesn't wait for them"""
+        for name in names:
+            getattr(self, name)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        for row in self.rows:
+            yield self.record(row)
+
+    def __getitem__(self, index):
+        return self.record(self.rows[index])
+
+    def record(self, row) -> dict:
+        """Rebuilds the dict of the inflected form stored at the given (absolute) row"""
+        codes = self.codes
+        record = {
+            "gender": self.tables["gender"][codes["gender"][row]],
+            "mood": self.tables["mood"][codes["mood"][row]],
+            "voice": self.tables["voice"][codes["voice"][row]],
+            "tense": self.tables["tense"][codes["tense"][row]],
+            "latin": self.latin[row],
+            "lemma": self.tables["lemma"][codes["lemma"][row]],
+            "group": int(self.group[row]),
+            "translation": list(self.tables["translation"][codes["translation"][row]]),
+            "primitive tenses": self.tables["primitive tenses"][codes["primitive tenses"][row]],
+            "person": int(self.person[row]),
+            "flx": self.tables["flx"][codes["flx"][row]],
+        }
+        if self.irregular[row]:
+            record["irrégulier"] = True
+        return record
+
+    def view(self, rows):
+        """Returns a store sharing the same columns, restricted to the given (absolute) rows"""
+        return VerbStore(
+            self.tables,
+            self.codes,
+            self.person,
+            self.group,
+            self.irregular,
+            self.latin,
+            indexes=self._indexes,
+            rows=rows,
+        )
+
+    @property
+    def selected(self):
+        """Boolean mask over all the rows of the store, True for the rows of this view"""
+        if self._selected is None:
+            self._selected = np.zeros(len(self.latin), dtype=bool)
+            self._selected[self.rows] = True
+        return self._selected
+
+    def analyses(self, latin) -> list[dict]:
+        """Lists all the inflected forms of this view written exactly as the given Latin form"""
+        rows = self.latin_index.get(latin, [])
+        selected = self.selected
+        return [self.record(row) for row in rows if selected[row]]
+
+    def accepted_latins(self, person, tense, voice, mood, translations) -> list[str]:
+        """Lists the Latin forms of this view matching the person/tense/voice/mood and at least one of the translations"""
+        rows = set()
+        for translation in translations:
+            rows.update(self.answer_index.get((person, tense, voice, mood, translation), []))
+        selected = self.selected
+        # Keep the order of the rows, each form only once
+        return list(dict.fromkeys(self.latin[row] for row in sorted(rows) if selected[row]))
+
+    def encode(self, facet, values) -> list[int]:
+        """Converts facet values (ex: ["présent", "futur"]) to their codes. Unknown values are ignored."""
+        table = self.tables[facet]
+        return [table.index(value) for value in values if value in table]
+
+    def mask(self, tense=None, group=None, person=None, voice=None, mood=None):
+        """Combines all the user's choices into one boolean mask over all the rows of the store.
+
+        tense, group and person are lists of accepted values, voice and mood a single value.
+        A facet left to None (or empty) is not filtered.
+        """
+        mask = np.ones(len(self.latin), dtype=bool)
+        if tense:
+            mask &= np.isin(self.codes["tense"], self.encode("tense", tense))
+        if group:
+            mask &= np.isin(self.group, group)
+        if person:
+            mask &= np.isin(self.person, person)
+        if voice:
+            mask &= np.isin(self.codes["voice"], self.encode("voice", [voice]))
+        if mood:
+            mask &= np.isin(self.codes["mood"], self.encode("mood", [mood]))
+        return mask
+
+    def filter(self, tense=None, group=None, person=None, voice=None, mood=None):
+        """Returns a view on the rows of this store matching all the user's choices"""
+        mask = self.mask(tense=tense, group=group, person=person, voice=voice, mood=mood)
+        return self.view(self.rows[mask[self.rows]])
+
+    def values(self, facet) -> list:
+        """Lists the values of a coded facet present in this store, in order of first appearance"""
+        codes, first = np.unique(self.codes[facet][self.rows], return_index=True)
+        return [self.tables[facet][code] for code in codes[np.argsort(first)]]
+
+
+class StringPool:
+    """Read-only sequence of strings stored one after the other in a UTF-8 buffer.
+    A string is only decoded when it is accessed.
+    """
+
+    def __init__(self, buffer, offsets, lengths):
+        self.buffer = buffer
+        self.offsets = offsets
+        self.lengths = lengths
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index) -> str:
+        offset = int(self.offsets[index])
+        return str(self.buffer[offset : offset + int(self.lengths[index])], "utf-8")
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def write_binary(store, bin_path):
+    """Writes all the rows of a store as a memory-mappable binary dataset (see VerbStore.open_binary()).
+
+    Layout (little-endian):
+    - header (BINARY_HEADER)
+    - lookup tables of the coded facets (json)
+    - one fixed-width record (BINARY_RECORD) per inflected form: codes of the facets, person, group...
+    - string pool: the Latin forms in UTF-8, one after the other
+    """
+    for facet in CODED_FACETS:
+        if len(store.tables[facet]) > np.iinfo(BINARY_RECORD[facet]).max + 1:
+            raise ValueError(f"Too many distinct values for '{facet}' in the binary dataset")
+
+    tables = json.dumps(store.tables, ensure_ascii=False).encode("utf-8")
+    forms = [form.encode("utf-8") for form in store.latin]
+    pool = b"".join(forms)
+
+    records = np.zeros(len(forms), dtype=BINARY_RECORD)
+    records["latin length"] = [len(form) for form in forms]
+    records["latin offset"] = np.cumsum(records["latin length"], dtype=np.uint32) - records["latin length"]
+    for facet in CODED_FACETS:
+        records[facet] = store.codes[facet]
+    records["person"] = store.person
+    records["group"] = store.group
+    records["irregular"] = store.irregular
+
+    with open(bin_path, "wb") as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, len(forms), len(tables), len(pool)))
+        f.write(tables)
+        f.write(records.tobytes())
+        f.write(pool)
+
+
+def build_latin_index(latin) -> dict[str, list[int]]:
+    """Maps each Latin form to the rows where it appears (several rows for syncretic forms)"""
+    index = {}
+    for row, form in enumerate(latin):
+        index.setdefault(form, []).append(row)
+    return index
+
+
+def build_answer_index(tables, codes, person) -> dict[tuple, list[int]]:
+    """Maps each (person, tense, voice, mood, translation) to the rows of the forms that translate it"""
+    index = {}
+    columns = zip(
+        person.tolist(),
+        codes["tense"].tolist(),
+        codes["voice"].tolist(),
+        codes["mood"].tolist(),
+        codes["translation"].tolist(),
+    )
+    for row, (p, tense, voice, mood, translation) in enumerate(columns):
+        for french in tables["translation"][translation]:
+            key = (p, tables["tense"][tense], tables["voice"][voice], tables["mood"][mood], french)
+            index.setdefault(key, []).append(row)
+    return index
+
+
+def build_french_index(tables, codes) -> PrefixIndex:
+    """Maps each French infinitive to the lemmas it translates (ex: "conduire" -> ["ducere"]), from the distinct
+    (lemma, translation) pairs of the rows rather than from each inflected form
+    """
+    pairs = np.unique(np.stack([codes["lemma"].astype(np.int32), codes["translation"].astype(np.int32)]), axis=1)
+    lemmas = {}
+    for lemma, translation in zip(*pairs.tolist()):
+        for french in tables["translation"][translation]:
+            lemmas.setdefault(french, {})[tables["lemma"][lemma]] = None
+    return PrefixIndex({french: list(found) for french, found in lemmas.items()}, fold)
+
+
+def _code_dtype(table):
+    """Smallest unsigned integer type able to hold a code for every value of the table"""
+    return np.uint8 if len(table) <= 256 else np.uint16
@@ -1,12 +1,62 @@
+// Spaced repetition (same rules as scripts/scheduler.py): a form goes up one box when it is answered
+// correctly and back to the first box when it is failed; its weight is halved at each box.
+const MAX_BOX = 5;
+const MASTERY_STORAGE_KEY = "magister.mastery";
+
+// Binary indexed tree over the weights of the pool: weight update and weighted draw in O(log n).
+class FenwickTree {
+  constructor(weights) {
+    this.size = weights.length;
+    this.tree = new Float64Array(this.size + 1);
+    this.total = 0;
+    for (let i = 1; i <= this.size; i++) {
+      this.tree[i] += weights[i - 1];
+      this.total += weights[i - 1];
+      const parent = i + (i & -i);
+      if (parent <= this.size) {
+        this.tree[parent] += this.tree[i];
+      }
+    }
+  }
+  add(index, delta) {
+    this.total += delta;
+    for (let i = index + 1; i <= this.size; i += i & -i) {
+      this.tree[i] += delta;
+    }
+  }
+  find(value) {
+    let position = 0;
+    for (let bit = 1 << Math.floor(Math.log2(this.size || 1)); bit > 0; bit >>= 1) {
+      const following = position + bit;
+      if (following <= this.size && this.tree[following] <= value) {
+        value -= this.tree[following];
+        position = following;
+      }
+    }
+    return Math.min(position, this.size - 1);
+  }
+  sample() {
+    return this.find(Math.random() * this.total);
+  }
+}
+
 function conjugationApp() {
   return {
     screen: "setup",
     isLoading: true,
     loadError: "",
     verbs: [],
+    shardIndex: null,
+    shardLoads: {},
+    analyses: new Map(),
+    frenchIndex: null,
+    frenchIndexLoad: null,
+    lookup: { query: "", completions: [] },
     tenses: [],
     groups: [],
     pool: [],
+    sampler: null,
+    mastery: {},
     personOptions: [
       { value: 1, label: "1e du singulier" },
       { value: 2, label: "2e du singulier" },
@@ -54,32 +104,161 @@ function conjugationApp() {
       acceptedLatins: [],
     },
     init() {
+      this.loadMastery();
       this.loadVerbs();
     },
+    loadMastery() {
+      try {
+        this.mastery = JSON.parse(localStorage.getItem(MASTERY_STORAGE_KEY)) || {};
+      } catch (error) {
+        this.mastery = {};
+      }
+    },
+    masteryKey(verb) {
+      return [verb.lemma, verb.latin, verb.mood, verb.voice, verb.tense, verb.person].join("|");
+    },
+    masteryWeight(verb) {
+      return 2 ** -(this.mastery[this.masteryKey(verb)] || 0);
+    },
+    updateMastery(index, score) {
+      // Box of the form according to the score of its question, and its new weight in the sampler.
+      const verb = this.pool[index];
+      const key = this.masteryKey(verb);
+      const box = this.mastery[key] || 0;
+      const newBox = score >= 1 ? Math.min(box + 1, MAX_BOX) : score < 0.5 ? 0 : box;
+      this.sampler.add(index, 2 ** -newBox - 2 ** -box);
+      if (newBox === 0) {
+        delete this.mastery[key];
+      } else {
+        this.mastery[key] = newBox;
+      }
+      try {
+        localStorage.setItem(MASTERY_STORAGE_KEY, JSON.stringify(this.mastery));
+      } catch (error) {
+        // Private browsing or storage full: the boxes are kept for this page only.
+      }
+    },
     async loadVerbs() {
       this.isLoading = true;
       this.loadError = "";
       try {
-        // Prefer embedded dataset to avoid CORS issues on static hosting.
-        if (window.VERBS_LATIN && Array.isArray(window.VERBS_LATIN)) {
-          this.verbs = window.VERBS_LATIN;
-        } else {
-          const response = await fetch("verbs_latin.json");
-          if (!response.ok) {
-            throw new Error("Impossible de charger verbs_latin.json");
-          }
-          this.verbs = await response.json();
+        if (window.MAGISTER_ASSETS && !window.VERBS_LATIN_SHARDS) {
+          // Content-hashed artifacts (see nooj.py): the shard index is resolved through the manifest.
+          await this.loadScript(this.assetUrl("shards/index.js"));
+        }
+        if (!window.VERBS_LATIN_SHARDS) {
+          throw new Error("Impossible de charger l'index des shards");
         }
+        // Sharded dataset (see nooj.py): only the shard index is loaded here,
+        // the shards needed by the session are loaded when it starts.
+        this.shardIndex = window.VERBS_LATIN_SHARDS;
+        this.verbs = [];
         this.tenses = this.buildTenses();
         this.groups = this.buildGroups();
         this.pool = this.verbs;
       } catch (error) {
         this.loadError =
-          "Impossible de charger les verbes. Vérifiez verbs_latin.js ou les permissions du navigateur.";
+          "Impossible de charger les verbes. Vérifiez le dossier shards ou les permissions du navigateur.";
       } finally {
         this.isLoading = false;
       }
     },
+    expandVerbs(data) {
+      // Compact layout (see nooj.py): one lemma table, and the inflected forms
+      // as columns of integer codes referring to the lemma table and to the lookup tables.
+      const { lemmas, tables, forms } = data;
+      const irregular = new Set(forms["irrégulier"]);
+      return forms.latin.map((latin, i) => {
+        const lemma = forms.lemma[i];
+        const verb = {
+          gender: tables.gender[forms.gender[i]],
+          mood: tables.mood[forms.mood[i]],
+          voice: tables.voice[forms.voice[i]],
+          tense: tables.tense[forms.tense[i]],
+          latin,
+          lemma: lemmas.lemma[lemma],
+          group: lemmas.group[lemma],
+          translation: tables.translation[forms.translation[i]],
+          "primitive tenses": tables["primitive tenses"][forms["primitive tenses"][i]],
+          person: forms.person[i],
+          flx: tables.flx[forms.flx[i]],
+        };
+        if (irregular.has(i)) {
+          verb["irrégulier"] = true;
+        }
+        return verb;
+      });
+    },
+    matchingShards() {
+      const groups = this.session.groups.map(Number);
+      const tenses = this.session.tenses;
+      return this.shardIndex.shards.filter(
+        (shard) =>
+          (groups.length === 0 || groups.includes(shard.group)) &&
+          (tenses.length === 0 || tenses.includes(shard.tense))
+      );
+    },
+    assetUrl(name) {
+      // Content-hashed copy of a build artifact, listed in the manifest (assets.js) written by nooj.py
+      const assets = window.MAGISTER_ASSETS;
+      return (assets && assets.files[name]) || name;
+    },
+    loadScript(url) {
+      // Scripts rather than fetch, to avoid CORS issues on static hosting.
+      return new Promise((resolve, reject) => {
+        const script = document.createElement("script");
+        script.src = url;
+        script.onload = () => resolve();
+        script.onerror = () => reject(new Error(`Impossible de charger ${url}`));
+        document.head.appendChild(script);
+      });
+    },
+    loadShard(shard) {
+      // Each shard is a script registering its verbs in window.VERBS_LATIN_SHARDS.loaded.
+      // It is only loaded once.
+      if (!this.shardLoads[shard.file]) {
+        this.shardLoads[shard.file] = this.loadScript(this.assetUrl(`shards/${shard.file}`)).then(
+          () => {
+            const loaded = this.shardIndex.loaded;
+            const verbs = this.expandVerbs(loaded[shard.file]);
+            this.verbs = this.verbs.concat(verbs);
+            this.addAnalyses(verbs);
+            // Analyses of the forms of this shard found in other shards (syncretism, see nooj.py)
+            if (loaded[shard.file].syncretic) {
+              this.addAnalyses(this.expandVerbs(loaded[shard.file].syncretic));
+            }
+            delete loaded[shard.file];
+          },
+          (error) => {
+            delete this.shardLoads[shard.file];
+            throw error;
+          }
+        );
+      }
+      return this.shardLoads[shard.file];
+    },
+    addAnalyses(verbs) {
+      // Latin form -> all its analyses, each only once (a shard and the syncretic part of another one may hold the same)
+      for (const verb of verbs) {
+        const analyses = this.analyses.get(verb.latin) || [];
+        const key = this.masteryKey(verb);
+        if (!analyses.some((analysis) => this.masteryKey(analysis) === key)) {
+          analyses.push(verb);
+          this.analyses.set(verb.latin, analyses);
+        }
+      }
+    },
+    async loadRemainingShards() {
+      // Background loading of the other shards: more analyses for syncretic forms
+      // and more choices among the translations offered.
+      for (const shard of this.shardIndex.shards) {
+        try {
+          await this.loadShard(shard);
+        } catch (error) {
+          // Not needed by the current session: it will be retried at the next one.
+        }
+      }
+    },
     buildTenses() {
       const order = [
         "présent",
@@ -89,7 +268,7 @@ function conjugationApp() {
         "plus-que-parfait",
         "futur antérieur",
       ];
-      const set = new Set(this.verbs.map((verb) => verb.tense));
+      const set = new Set(this.shardIndex.tenses);
       const sorted = [];
       order.forEach((tense) => {
         if (set.has(tense)) {
@@ -100,7 +279,7 @@ function conjugationApp() {
       return [...sorted, ...Array.from(set).sort((a, b) => a.localeCompare(b))];
     },
     buildGroups() {
-      const set = new Set(this.verbs.map((verb) => verb.group));
+      const set = new Set(this.shardIndex.groups);
       return Array.from(set).sort((a, b) => a - b);
     },
     formatPerson(person) {
@@ -147,16 +326,50 @@ function conjugationApp() {
       return this.filteredVerbs();
     },
     get filteredCount() {
+      if (this.shardIndex) {
+        // Counted from the shard index, without loading the shards
+        const moods = this.session.moods;
+        const voices = this.session.voices;
+        const persons = this.session.persons.map(Number);
+        let count = 0;
+        this.matchingShards().forEach((shard) => {
+          Object.entries(shard.counts).forEach(([key, value]) => {
+            const [mood, voice, person] = key.split("|");
+            if (
+              (moods.length === 0 || moods.includes(mood)) &&
+              (voices.length === 0 || voices.includes(voice)) &&
+              (persons.length === 0 || persons.includes(Number(person)))
+            ) {
+              count += value;
+            }
+          });
+        });
+        return count;
+      }
       return this.filteredPool.length;
     },
     get totalCount() {
-      return this.verbs.length;
+      return this.shardIndex ? this.shardIndex.count : this.verbs.length;
     },
-    startSession() {
+    async startSession() {
       if (this.isLoading) {
         return;
       }
+      if (this.shardIndex) {
+        this.isLoading = true;
+        try {
+          await Promise.all(this.matchingShards().map((shard) => this.loadShard(shard)));
+        } catch (error) {
+          this.loadError =
+            "Impossible de charger les verbes. Vérifiez le dossier shards ou les permissions du navigateur.";
+          return;
+        } finally {
+          this.isLoading = false;
+        }
+        this.loadRemainingShards();
+      }
       this.pool = this.filteredVerbs();
+      this.sampler = new FenwickTree(this.pool.map((verb) => this.masteryWeight(verb)));
       if (this.pool.length === 0) {
         this.loadError =
           "Aucun verbe ne correspond a ces filtres. Ajustez la selection.";
@@ -183,15 +396,16 @@ function conjugationApp() {
         this.screen = "summary";
         return;
       }
-      // Randomly select a verb and direction for the next round.
-      const verb = this.pool[Math.floor(Math.random() * this.pool.length)];
+      // Select a verb (the forms already mastered less often) and a random direction for the next round.
+      const index = this.sampler.sample();
+      const verb = this.pool[index];
       const direction =
         this.session.direction === "aleatoire"
           ? Math.random() > 0.5
             ? "latin"
             : "français"
           : this.session.direction;
-      this.quiz.current = { verb, direction };
+      this.quiz.current = { verb, direction, index };
       this.quiz.subScore = 0;
       this.quiz.pendingScore = null;
       this.quiz.showHintsModal = false;
@@ -211,7 +425,7 @@ function conjugationApp() {
       this.quiz.hasErred = false;
       this.quiz.latinErrors = { person: false, tense: false, voice: false, mood: false, translation: false };
       // Syncrétisme : calculer les profils valides (Latin→FR) et formes acceptées (FR→Latin)
-      this.quiz.validProfiles = this.verbs.filter((v) => v.latin === verb.latin);
+      this.quiz.validProfiles = [...(this.analyses.get(verb.latin) || [verb])];
       this.quiz.acceptedLatins = [...new Set(
         this.pool
           .filter(
@@ -265,9 +479,12 @@ function conjugationApp() {
       this.onMoodChange();
     },
     buildTranslationOptions(verb, correctTranslation) {
-      // Exclude other translations of the same verb to avoid multiple valid choices.
+      // Exclude the translations of all the analyses of the form to avoid multiple valid choices.
       const options = new Set([correctTranslation]);
-      const excluded = new Set(verb.translation || []);
+      const excluded = new Set([
+        ...(verb.translation || []),
+        ...this.quiz.validProfiles.flatMap((profile) => profile.translation),
+      ]);
       const targetCount = Math.max(6, options.size + 2);
       let guard = 0;
       while (options.size < targetCount && guard < 200) {
@@ -533,12 +750,74 @@ function conjugationApp() {
       )}, ${verb.tense}, ${verb.voice}, ${verb.mood} :`;
     },
     normalizeLatin(value) {
+      // Same normalisation as fold_latin() in scripts/matcher.py
       return value
         .toLowerCase()
+        .normalize("NFD")
+        .replace(/[\u0300-\u036f]/g, "")
         .replaceAll("v", "u")
         .replaceAll("j", "i")
+        .replace(/\s+/g, " ")
+        .trim();
+    },
+    normalizeFrench(value) {
+      // Same normalisation as fold() in scripts/matcher.py
+      return value
+        .toLowerCase()
+        .replaceAll("’", "'")
+        .normalize("NFD")
+        .replace(/[\u0300-\u036f]/g, "")
+        .replace(/\s+/g, " ")
         .trim();
     },
+    loadFrenchIndex() {
+      // French infinitives and their lemmas (see nooj.py), only loaded once the lookup field is used.
+      if (!this.frenchIndexLoad) {
+        const load = window.MAGISTER_FRENCH_INDEX
+          ? Promise.resolve()
+          : this.loadScript(this.assetUrl("french_index.js"));
+        this.frenchIndexLoad = load.then(
+          () => {
+            this.frenchIndex = window.MAGISTER_FRENCH_INDEX;
+          },
+          (error) => {
+            this.frenchIndexLoad = null;
+            throw error;
+          }
+        );
+      }
+      return this.frenchIndexLoad;
+    },
+    completeFrench(prefix, limit = 10) {
+      // The entries are sorted by normalised infinitive: binary search of the first one starting with
+      // the prefix, the others follow it (same as PrefixIndex.complete() in scripts/matcher.py).
+      const entries = this.frenchIndex || [];
+      const key = this.normalizeFrench(prefix);
+      let low = 0;
+      let high = entries.length;
+      while (low < high) {
+        const middle = (low + high) >> 1;
+        if (entries[middle][0] < key) {
+          low = middle + 1;
+        } else {
+          high = middle;
+        }
+      }
+      const completions = [];
+      for (let i = low; i < entries.length && completions.length < limit && entries[i][0].startsWith(key); i++) {
+        completions.push({ translation: entries[i][1], lemmas: entries[i][2] });
+      }
+      return completions;
+    },
+    async onLookupInput() {
+      try {
+        await this.loadFrenchIndex();
+      } catch (error) {
+        this.lookup.completions = [];
+        return;
+      }
+      this.lookup.completions = this.lookup.query.trim() ? this.completeFrench(this.lookup.query) : [];
+    },
     submitLatinBundle() {
       if (!this.latinAnswersComplete) {
         this.quiz.feedback = {
@@ -684,6 +963,7 @@ function conjugationApp() {
       this.quiz.totalScore += this.quiz.subScore;
       if (this.quiz.current) {
         const verb = this.quiz.current.verb;
+        this.updateMastery(this.quiz.current.index, this.quiz.subScore);
         this.quiz.history.push({
           latin: this.quiz.acceptedLatins.join(', '),
           person: this.formatPerson(verb.person),
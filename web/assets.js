@@ -0,0 +1 @@
+window.MAGISTER_ASSETS = {"files": {"shards/index.js": "shards/index.c4855bfee4.js", "french_index.js": "french_index.d0b56dea5c.js", "shards/g0-futur.js": "shards/g0-futur.76d306ae92.js", "shards/g0-futur-anterieur.js": "shards/g0-futur-anterieur.86f5edfa00.js", "shards/g0-imparfait.js": "shards/g0-imparfait.f62b51002b.js", "shards/g0-parfait.js": "shards/g0-parfait.0f2bad2eab.js", "shards/g0-plus-que-parfait.js": "shards/g0-plus-que-parfait.dce8ffb729.js", "shards/g0-present.js": "shards/g0-present.b5a439e98a.js", "shards/g1-futur.js": "shards/g1-futur.4d3c3154f2.js", "shards/g1-futur-anterieur.js": "shards/g1-futur-anterieur.e102bed014.js", "shards/g1-imparfait.js": "shards/g1-imparfait.f824d409bc.js", "shards/g1-parfait.js": "shards/g1-parfait.e640544f0c.js", "shards/g1-plus-que-parfait.js": "shards/g1-plus-que-parfait.76f2a78921.js", "shards/g1-present.js": "shards/g1-present.3cec6b2bcd.js", "shards/g2-futur.js": "shards/g2-futur.5f28f14104.js", "shards/g2-futur-anterieur.js": "shards/g2-futur-anterieur.66227fc7b0.js", "shards/g2-imparfait.js": "shards/g2-imparfait.a6a399ddb9.js", "shards/g2-parfait.js": "shards/g2-parfait.90d87060dc.js", "shards/g2-plus-que-parfait.js": "shards/g2-plus-que-parfait.e3dae6dbe9.js", "shards/g2-present.js": "shards/g2-present.e46e345aa2.js", "shards/g3-futur.js": "shards/g3-futur.7b180c8345.js", "shards/g3-futur-anterieur.js": "shards/g3-futur-anterieur.2d4af843ac.js", "shards/g3-imparfait.js": "shards/g3-imparfait.74a839d601.js", "shards/g3-parfait.js": "shards/g3-parfait.b8d734a94c.js", "shards/g3-plus-que-parfait.js": "shards/g3-plus-que-parfait.e265d4c2e5.js", "shards/g3-present.js": "shards/g3-present.829a4a602b.js", "shards/g4-futur.js": "shards/g4-futur.f472f681cc.js", "shards/g4-futur-anterieur.js": "shards/g4-futur-anterieur.6a37fd35ad.js", "shards/g4-imparfait.js": "shards/g4-imparfait.ba0727c452.js", "shards/g4-parfait.js": "shards/g4-parfait.fdf547b048.js", "shards/g4-plus-que-parfait.js": "shards/g4-plus-que-parfait.47cbcea5a3.js", "shards/g4-present.js": "shards/g4-present.381c64b2b4.js", "shards/g5-futur.js": "shards/g5-futur.5d1c19ec50.js", "shards/g5-futur-anterieur.js": "shards/g5-futur-anterieur.2d004839f7.js", "shards/g5-imparfait.js": "shards/g5-imparfait.355e71c6c4.js", "shards/g5-parfait.js": "shards/g5-parfait.7c0426291e.js", "shards/g5-plus-que-parfait.js": "shards/g5-plus-que-parfait.72abd3ae2d.js", "shards/g5-present.js": "shards/g5-present.eb37e73050.js"}, "encodings": ["gzip", "br"]};
@@ -0,0 +1 @@
+window.MAGISTER_FRENCH_INDEX = [["accomplir","accomplir",["agere","gerere"]],["accueillir","accueillir",["accipere"]],["aimer","aimer",["amare"]],["appeler","appeler",["uocare"]],["apprendre a connaitre","apprendre à connaître",["cognoscere"]],["approuver","approuver",["laudare"]],["arracher","arracher",["rapere"]],["augmenter","augmenter",["augere"]],["avertir","avertir",["monere"]],["avoir","avoir",["habere"]],["chasser","chasser",["pellere"]],["choisir","choisir",["legere"]],["combattre","combattre",["pugnare"]],["commencer","commencer",["incipere"]],["comprendre","comprendre",["intellegere"]],["conduire","conduire",["ducere"]],["connaitre","connaître",["cognoscere"]],["conseiller","conseiller",["suadere"]],["considerer comme","considérer comme",["ducere"]],["craindre","craindre",["timere","uereri"]],["croire","croire",["credere"]],["cueillir","cueillir",["legere"]],["cultiver","cultiver",["colere"]],["decider","décider",["statuere"]],["demander","demander",["orare","petere","rogare"]],["desirer","désirer",["cupere"]],["determiner","déterminer",["statuere"]],["detruire","détruire",["delere"]],["devoir","devoir",["debere"]],["dire","dire",["dicere"]],["donner","donner",["dare"]],["ecouter","écouter",["audire"]],["ecrire","écrire",["scribere"]],["emouvoir","émouvoir",["mouere"]],["encourager","encourager",["hortari"]],["entendre","entendre",["audire"]],["envoyer","envoyer",["mittere"]],["errer","errer",["errare"]],["estimer","estimer",["existimare"]],["etre","être",["esse"]],["etre absent","être absent",["abesse"]],["etre la","être là",["adesse"]],["etre utile","être utile",["prodesse"]],["exhorter","exhorter",["hortari"]],["faire","faire",["agere","facere","gerere"]],["faire en sorte","faire en sorte",["efficere"]],["faire l'experience de","faire l'expérience de",["experiri"]],["habiter","habiter",["colere"]],["honorer","honorer",["colere"]],["imiter","imiter",["imitari"]],["juger","juger",["sentire"]],["laisser","laisser",["relinquere"]],["lire","lire",["legere"]],["louer","louer",["laudare"]],["mourir","mourir",["mori"]],["mouvoir","mouvoir",["mouere"]],["naitre","naître",["nasci","oriri"]],["offrir","offrir",["praebere"]],["ordonner","ordonner",["imperare","iubere"]],["paraitre","paraître",["uideri"]],["parler","parler",["loqui"]],["partir","partir",["proficisci"]],["penser","penser",["cogitare","existimare","putare"]],["percevoir","percevoir",["sentire"]],["persuader","persuader",["suadere"]],["pousser","pousser",["agere","pellere"]],["pouvoir","pouvoir",["posse"]],["prendre","prendre",["capere"]],["presenter","présenter",["praebere"]],["raconter","raconter",["narrare","tradere"]],["ravir","ravir",["rapere"]],["recevoir","recevoir",["accipere"]],["redouter","redouter",["uereri"]],["regarder","regarder",["spectare"]],["rester","rester",["manere"]],["s'en aller","s'en aller",["proficisci"]],["s'etonner","s'étonner",["mirari"]],["savoir","savoir",["scire"]],["se lever","se lever",["oriri"]],["se rendre compte","se rendre compte",["sentire"]],["se tromper","se tromper",["errare"]],["sembler","sembler",["uideri"]],["soigner","soigner",["curare"]],["souffrir","souffrir",["pati"]],["souhaiter","souhaiter",["optare"]],["suivre","suivre",["sequi"]],["supporter","supporter",["pati"]],["susciter","susciter",["mouere"]],["tomber","tomber",["occidere","relinquere"]],["transmettre","transmettre",["tradere"]],["trouver","trouver",["inuenire"]],["tuer","tuer",["interficere","occidere"]],["utiliser","utiliser",["uti"]],["vaincre","vaincre",["uincere"]],["venir","venir",["uenire"]],["vivre","vivre",["uiuere"]],["voir","voir",["uidere"]]];
@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g0-futur-anterieur.js"] = {"lemmas":{"lemma":["abesse","adesse","esse","posse","prodesse"],"group":[0,0,0,0,0]},"tables":{"gender":[null],"mood":["indicatif"],"voice":["actif"],"tense":["futur antérieur"],"translation":[["être absent"],["être là"],["être"],["pouvoir"],["être utile"]],"primitive tenses":["absum, abes, abesse, afui","adsum, ades, adesse, adfui","sum, es, esse, fui","posum, potes, posse, potui","prosum, prodes, prodesse, profui"],"flx":["GP0_PER"]},"forms":{"latin":["afuero","afueris","afuerit","afuerimus","afueritis","afuerint","adfuero","adfueris","adfuerit","adfuerimus","adfueritis","adfuerint","fuero","fueris","fuerit","fuerimus","fueritis","fuerint","potuero","potueris","potuerit","potuerimus","potueritis","potuerint","profuero","profueris","profuerit","profuerimus","profueritis","profuerint"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,3,3,3,3,3,3,4,4,4,4,4,4],"translation":[0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,3,3,3,3,3,3,4,4,4,4,4,4],"primitive tenses":[0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,3,3,3,3,3,3,4,4,4,4,4,4],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"person":[1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6],"irrégulier":[]}};
@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g0-imparfait.js"] = {"lemmas":{"lemma":["abesse","adesse","esse","posse","prodesse"],"group":[0,0,0,0,0]},"tables":{"gender":[null],"mood":["indicatif","subjonctif"],"voice":["actif"],"tense":["imparfait"],"translation":[["être absent"],["être là"],["être"],["pouvoir"],["être utile"]],"primitive tenses":["absum, abes, abesse, afui","adsum, ades, adesse, adfui","sum, es, esse, fui","posum, potes, posse, potui","prosum, prodes, prodesse, profui"],"flx":["GP0_INF","GP0_INF_POSSE"]},"forms":{"latin":["aberam","aberas","aberat","aberamus","aberatis","aberant","abessem","abesses","abesset","abessemus","abessetis","abessent","aderam","aderas","aderat","aderamus","aderatis","aderant","adessem","adesses","adesset","adessemus","adessetis","adessent","eram","eras","erat","eramus","eratis","erant","essem","esses","esset","essemus","essetis","essent","poteram","poteras","poterat","poteramus","poteratis","poterant","potessem","potesses","potesset","potessemus","potessetis","potessent","proderam","proderas","proderat","proderamus","proderatis","proderant","prodessem","prodesses","prodesset","prodessemus","prodessetis","prodessent"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0],"person":[1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6],"irrégulier":[]}};
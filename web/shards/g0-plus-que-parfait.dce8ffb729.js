@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g0-plus-que-parfait.js"] = {"lemmas":{"lemma":["abesse","adesse","esse","posse","prodesse"],"group":[0,0,0,0,0]},"tables":{"gender":[null],"mood":["indicatif","subjonctif"],"voice":["actif"],"tense":["plus-que-parfait"],"translation":[["être absent"],["être là"],["être"],["pouvoir"],["être utile"]],"primitive tenses":["absum, abes, abesse, afui","adsum, ades, adesse, adfui","sum, es, esse, fui","posum, potes, posse, potui","prosum, prodes, prodesse, profui"],"flx":["GP0_PER"]},"forms":{"latin":["afueram","afueras","afuerat","afueramus","afueratis","afuerant","afuissem","afuisses","afuisset","afuissemus","afuissetis","afuissent","adfueram","adfueras","adfuerat","adfueramus","adfueratis","adfuerant","adfuissem","adfuisses","adfuisset","adfuissemus","adfuissetis","adfuissent","fueram","fueras","fuerat","fueramus","fueratis","fuerant","fuissem","fuisses","fuisset","fuissemus","fuissetis","fuissent","potueram","potueras","potuerat","potueramus","potueratis","potuerant","potuissem","potuisses","potuisset","potuissemus","potuissetis","potuissent","profueram","profueras","profuerat","profueramus","profueratis","profuerant","profuissem","profuisses","profuisset","profuissemus","profuissetis","profuissent"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"person":[1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6],"irrégulier":[]}};
@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g1-futur-anterieur.js"] = {"lemmas":{"lemma":["amare","cogitare","curare","dare","errare","existimare","hortari","imitari","imperare","laudare","mirari","narrare","optare","orare","pugnare","putare","rogare","spectare","uocare"],"group":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur antérieur"],"translation":[["aimer"],["penser"],["soigner"],["donner"],["errer","se tromper"],["estimer","penser"],["exhorter","encourager"],["imiter"],["ordonner"],["louer","approuver"],["s'étonner"],["raconter"],["souhaiter"],["demander"],["combattre"],["regarder"],["appeler"]],"primitive tenses":["o, as, are, aui, atum","o, as, are, dedi, datum","or, aris, ari, atus sum"],"flx":["GP1_PER","GP1_SUP","GP1_DEP_SUP"]},"forms":{"latin":["amauero","amaueris","amauerit","amauerimus","amaueritis","amauerint","amata ero","amatus ero","amata eris","amatus eris","amata erit","amatus erit","amatae erimus","amati erimus","amatae eritis","amati eritis","amatae erunt","amati erunt","cogitauero","cogitaueris","cogitauerit","cogitauerimus","cogitaueritis","cogitauerint","cogitata ero","cogitatus ero","cogitata eris","cogitatus eris","cogitata erit","cogitatus erit","cogitatae erimus","cogitati erimus","cogitatae eritis","cogitati eritis","cogitatae erunt","cogitati erunt","curauero","curaueris","curauerit","curauerimus","curaueritis","curauerint","curata ero","curatus ero","curata eris","curatus eris","curata erit","curatus erit","curatae erimus","curati erimus","curatae eritis","curati eritis","curatae erunt","curati erunt","dedero","dederis","dederit","dederimus","dederitis","dederint","data ero","datus ero","data eris","datus eris","data erit","datus erit","datae erimus","dati erimus","datae eritis","dati eritis","datae erunt","dati erunt","errauero","erraueris","errauerit","errauerimus","erraueritis","errauerint","errata ero","erratus ero","errata eris","erratus eris","errata erit","erratus erit","erratae erimus","errati erimus","erratae eritis","errati eritis","erratae erunt","errati erunt","existimauero","existimaueris","existimauerit","existimauerimus","existimaueritis","existimauerint","existimata ero","existimatus ero","existimata eris","existimatus eris","existimata erit","existimatus erit","existimatae erimus","existimati erimus","existimatae eritis","existimati eritis","existimatae erunt","existimati erunt","hortata ero","hortatus ero","hortata eris","hortatus eris","hortata erit","hortatus erit","hortatae erimus","hortati erimus","hortatae eritis","hortati eritis","hortatae erunt","hortati erunt","imitata ero","imitatus ero","imitata eris","imitatus eris","imitata erit","imitatus erit","imitatae erimus","imitati erimus","imitatae eritis","imitati eritis","imitatae erunt","imitati erunt","imperauero","imperaueris","imperauerit","imperauerimus","imperaueritis","imperauerint","imperata ero","imperatus ero","imperata eris","imperatus eris","imperata erit","imperatus erit","imperatae erimus","imperati erimus","imperatae eritis","imperati eritis","imperatae erunt","imperati erunt","laudauero","laudaueris","laudauerit","laudauerimus","laudaueritis","laudauerint","laudata ero","laudatus ero","laudata eris","laudatus eris","laudata erit","laudatus erit","laudatae erimus","laudati erimus","laudatae eritis","laudati eritis","laudatae erunt","laudati erunt","mirata ero","miratus ero","mirata eris","miratus eris","mirata erit","miratus erit","miratae erimus","mirati erimus","miratae eritis","mirati eritis","miratae erunt","mirati erunt","narrauero","narraueris","narrauerit","narrauerimus","narraueritis","narrauerint","narrata ero","narratus ero","narrata eris","narratus eris","narrata erit","narratus erit","narratae erimus","narrati erimus","narratae eritis","narrati eritis","narratae erunt","narrati erunt","optauero","optaueris","optauerit","optauerimus","optaueritis","optauerint","optata ero","optatus ero","optata eris","optatus eris","optata erit","optatus erit","optatae erimus","optati erimus","optatae eritis","optati eritis","optatae erunt","optati erunt","orauero","oraueris","orauerit","orauerimus","oraueritis","orauerint","orata ero","oratus ero","orata eris","oratus eris","orata erit","oratus erit","oratae erimus","orati erimus","oratae eritis","orati eritis","oratae erunt","orati erunt","pugnauero","pugnaueris","pugnauerit","pugnauerimus","pugnaueritis","pugnauerint","pugnata ero","pugnatus ero","pugnata eris","pugnatus eris","pugnata erit","pugnatus erit","pugnatae erimus","pugnati erimus","pugnatae eritis","pugnati eritis","pugnatae erunt","pugnati erunt","putauero","putaueris","putauerit","putauerimus","putaueritis","putauerint","putata ero","putatus ero","putata eris","putatus eris","putata erit","putatus erit","putatae erimus","putati erimus","putatae eritis","putati eritis","putatae erunt","putati erunt","rogauero","rogaueris","rogauerit","rogauerimus","rogaueritis","rogauerint","rogata ero","rogatus ero","rogata eris","rogatus eris","rogata erit","rogatus erit","rogatae erimus","rogati erimus","rogatae eritis","rogati eritis","rogatae erunt","rogati erunt","spectauero","spectaueris","spectauerit","spectauerimus","spectaueritis","spectauerint","spectata ero","spectatus ero","spectata eris","spectatus eris","spectata erit","spectatus erit","spectatae erimus","spectati erimus","spectatae eritis","spectati eritis","spectatae erunt","spectati erunt","uocauero","uocaueris","uocauerit","uocauerimus","uocaueritis","uocauerint","uocata ero","uocatus ero","uocata eris","uocatus eris","uocata erit","uocatus erit","uocatae erimus","uocati erimus","uocatae eritis","uocati eritis","uocatae erunt","uocati erunt"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["amare","cogitare","curare","dare","errare","existimare","imperare","laudare","narrare","optare","orare","pugnare","putare","rogare","spectare","uocare"],"group":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]},"tables":{"gender":[null],"mood":["subjonctif"],"voice":["actif"],"tense":["parfait"],"translation":[["aimer"],["penser"],["soigner"],["donner"],["errer","se tromper"],["estimer","penser"],["ordonner"],["louer","approuver"],["raconter"],["souhaiter"],["demander"],["combattre"],["regarder"],["appeler"]],"primitive tenses":["o, as, are, aui, atum","o, as, are, dedi, datum"],"flx":["GP1_PER"]},"forms":{"latin":["amaueris","amauerit","amauerimus","amaueritis","amauerint","cogitaueris","cogitauerit","cogitauerimus","cogitaueritis","cogitauerint","curaueris","curauerit","curauerimus","curaueritis","curauerint","dederis","dederit","dederimus","dederitis","dederint","erraueris","errauerit","errauerimus","erraueritis","errauerint","existimaueris","existimauerit","existimauerimus","existimaueritis","existimauerint","imperaueris","imperauerit","imperauerimus","imperaueritis","imperauerint","laudaueris","laudauerit","laudauerimus","laudaueritis","laudauerint","narraueris","narrauerit","narrauerimus","narraueritis","narrauerint","optaueris","optauerit","optauerimus","optaueritis","optauerint","oraueris","orauerit","orauerimus","oraueritis","orauerint","pugnaueris","pugnauerit","pugnauerimus","pugnaueritis","pugnauerint","putaueris","putauerit","putauerimus","putaueritis","putauerint","rogaueris","rogauerit","rogauerimus","rogaueritis","rogauerint","spectaueris","spectauerit","spectauerimus","spectaueritis","spectauerint","uocaueris","uocauerit","uocauerimus","uocaueritis","uocauerint"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,11,11,11,11,11,12,12,12,12,12,13,13,13,13,13,14,14,14,14,14,15,15,15,15,15],"translation":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,11,11,11,11,11,1,1,1,1,1,10,10,10,10,10,12,12,12,12,12,13,13,13,13,13],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"person":[2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6],"irrégulier":[]}}};
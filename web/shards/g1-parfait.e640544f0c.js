@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g1-parfait.js"] = {"lemmas":{"lemma":["amare","cogitare","curare","dare","errare","existimare","hortari","imitari","imperare","laudare","mirari","narrare","optare","orare","pugnare","putare","rogare","spectare","uocare"],"group":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif","subjonctif"],"voice":["actif","passif","déponent"],"tense":["parfait"],"translation":[["aimer"],["penser"],["soigner"],["donner"],["errer","se tromper"],["estimer","penser"],["exhorter","encourager"],["imiter"],["ordonner"],["louer","approuver"],["s'étonner"],["raconter"],["souhaiter"],["demander"],["combattre"],["regarder"],["appeler"]],"primitive tenses":["o, as, are, aui, atum","o, as, are, dedi, datum","or, aris, ari, atus sum"],"flx":["GP1_PER","GP1_SUP","GP1_DEP_SUP"]},"forms":{"latin":["amaui","amauisti","amauit","amauimus","amauistis","amauerunt","amata sum","amatus sum","amata es","amatus es","amata est","amatus est","amatae sumus","amati sumus","amatae estis","amati estis","amatae sunt","amati sunt","amauerim","amaueris","amauerit","amauerimus","amaueritis","amauerint","amata sim","amatus sim","amata sis","amatus sis","amata sit","amatus sit","amatae simus","amati simus","amatae sitis","amati sitis","amatae sint","amati sint","cogitaui","cogitauisti","cogitauit","cogitauimus","cogitauistis","cogitauerunt","cogitata sum","cogitatus sum","cogitata es","cogitatus es","cogitata est","cogitatus est","cogitatae sumus","cogitati sumus","cogitatae estis","cogitati estis","cogitatae sunt","cogitati sunt","cogitauerim","cogitaueris","cogitauerit","cogitauerimus","cogitaueritis","cogitauerint","cogitata sim","cogitatus sim","cogitata sis","cogitatus sis","cogitata sit","cogitatus sit","cogitatae simus","cogitati simus","cogitatae sitis","cogitati sitis","cogitatae sint","cogitati sint","curaui","curauisti","curauit","curauimus","curauistis","curauerunt","curata sum","curatus sum","curata es","curatus es","curata est","curatus est","curatae sumus","curati sumus","curatae estis","curati estis","curatae sunt","curati sunt","curauerim","curaueris","curauerit","curauerimus","curaueritis","curauerint","curata sim","curatus sim","curata sis","curatus sis","curata sit","curatus sit","curatae simus","curati simus","curatae sitis","curati sitis","curatae sint","curati sint","dedi","dedisti","dedit","dedimus","dedistis","dederunt","data sum","datus sum","data es","datus es","data est","datus est","datae sumus","dati sumus","datae estis","dati estis","datae sunt","dati sunt","dederim","dederis","dederit","dederimus","dederitis","dederint","data sim","datus sim","data sis","datus sis","data sit","datus sit","datae simus","dati simus","datae sitis","dati sitis","datae sint","dati sint","erraui","errauisti","errauit","errauimus","errauistis","errauerunt","errata sum","erratus sum","errata es","erratus es","errata est","erratus est","erratae sumus","errati sumus","erratae estis","errati estis","erratae sunt","errati sunt","errauerim","erraueris","errauerit","errauerimus","erraueritis","errauerint","errata sim","erratus sim","errata sis","erratus sis","errata sit","erratus sit","erratae simus","errati simus","erratae sitis","errati sitis","erratae sint","errati sint","existimaui","existimauisti","existimauit","existimauimus","existimauistis","existimauerunt","existimata sum","existimatus sum","existimata es","existimatus es","existimata est","existimatus est","existimatae sumus","existimati sumus","existimatae estis","existimati estis","existimatae sunt","existimati sunt","existimauerim","existimaueris","existimauerit","existimauerimus","existimaueritis","existimauerint","existimata sim","existimatus sim","existimata sis","existimatus sis","existimata sit","existimatus sit","existimatae simus","existimati simus","existimatae sitis","existimati sitis","existimatae sint","existimati sint","hortata sum","hortatus sum","hortata es","hortatus es","hortata est","hortatus est","hortatae sumus","hortati sumus","hortatae estis","hortati estis","hortatae sunt","hortati sunt","hortata sim","hortatus sim","hortata sis","hortatus sis","hortata sit","hortatus sit","hortatae simus","hortati simus","hortatae sitis","hortati sitis","hortatae sint","hortati sint","imitata sum","imitatus sum","imitata es","imitatus es","imitata est","imitatus est","imitatae sumus","imitati sumus","imitatae estis","imitati estis","imitatae sunt","imitati sunt","imitata sim","imitatus sim","imitata sis","imitatus sis","imitata sit","imitatus sit","imitatae simus","imitati simus","imitatae sitis","imitati sitis","imitatae sint","imitati sint","imperaui","imperauisti","imperauit","imperauimus","imperauistis","imperauerunt","imperata sum","imperatus sum","imperata es","imperatus es","imperata est","imperatus est","imperatae sumus","imperati sumus","imperatae estis","imperati estis","imperatae sunt","imperati sunt","imperauerim","imperaueris","imperauerit","imperauerimus","imperaueritis","imperauerint","imperata sim","imperatus sim","imperata sis","imperatus sis","imperata sit","imperatus sit","imperatae simus","imperati simus","imperatae sitis","imperati sitis","imperatae sint","imperati sint","laudaui","laudauisti","laudauit","laudauimus","laudauistis","laudauerunt","laudata sum","laudatus sum","laudata es","laudatus es","laudata est","laudatus est","laudatae sumus","laudati sumus","laudatae estis","laudati estis","laudatae sunt","laudati sunt","laudauerim","laudaueris","laudauerit","laudauerimus","laudaueritis","laudauerint","laudata sim","laudatus sim","laudata sis","laudatus sis","laudata sit","laudatus sit","laudatae simus","laudati simus","laudatae sitis","laudati sitis","laudatae sint","laudati sint","mirata sum","miratus sum","mirata es","miratus es","mirata est","miratus est","miratae sumus","mirati sumus","miratae estis","mirati estis","miratae sunt","mirati sunt","mirata sim","miratus sim","mirata sis","miratus sis","mirata sit","miratus sit","miratae simus","mirati simus","miratae sitis","mirati sitis","miratae sint","mirati sint","narraui","narrauisti","narrauit","narrauimus","narrauistis","narrauerunt","narrata sum","narratus sum","narrata es","narratus es","narrata est","narratus est","narratae sumus","narrati sumus","narratae estis","narrati estis","narratae sunt","narrati sunt","narrauerim","narraueris","narrauerit","narrauerimus","narraueritis","narrauerint","narrata sim","narratus sim","narrata sis","narratus sis","narrata sit","narratus sit","narratae simus","narrati simus","narratae sitis","narrati sitis","narratae sint","narrati sint","optaui","optauisti","optauit","optauimus","optauistis","optauerunt","optata sum","optatus sum","optata es","optatus es","optata est","optatus est","optatae sumus","optati sumus","optatae estis","optati estis","optatae sunt","optati sunt","optauerim","optaueris","optauerit","optauerimus","optaueritis","optauerint","optata sim","optatus sim","optata sis","optatus sis","optata sit","optatus sit","optatae simus","optati simus","optatae sitis","optati sitis","optatae sint","optati sint","oraui","orauisti","orauit","orauimus","orauistis","orauerunt","orata sum","oratus sum","orata es","oratus es","orata est","oratus est","oratae sumus","orati sumus","oratae estis","orati estis","oratae sunt","orati sunt","orauerim","oraueris","orauerit","orauerimus","oraueritis","orauerint","orata sim","oratus sim","orata sis","oratus sis","orata sit","oratus sit","oratae simus","orati simus","oratae sitis","orati sitis","oratae sint","orati sint","pugnaui","pugnauisti","pugnauit","pugnauimus","pugnauistis","pugnauerunt","pugnata sum","pugnatus sum","pugnata es","pugnatus es","pugnata est","pugnatus est","pugnatae sumus","pugnati sumus","pugnatae estis","pugnati estis","pugnatae sunt","pugnati sunt","pugnauerim","pugnaueris","pugnauerit","pugnauerimus","pugnaueritis","pugnauerint","pugnata sim","pugnatus sim","pugnata sis","pugnatus sis","pugnata sit","pugnatus sit","pugnatae simus","pugnati simus","pugnatae sitis","pugnati sitis","pugnatae sint","pugnati sint","putaui","putauisti","putauit","putauimus","putauistis","putauerunt","putata sum","putatus sum","putata es","putatus es","putata est","putatus est","putatae sumus","putati sumus","putatae estis","putati estis","putatae sunt","putati sunt","putauerim","putaueris","putauerit","putauerimus","putaueritis","putauerint","putata sim","putatus sim","putata sis","putatus sis","putata sit","putatus sit","putatae simus","putati simus","putatae sitis","putati sitis","putatae sint","putati sint","rogaui","rogauisti","rogauit","rogauimus","rogauistis","rogauerunt","rogata sum","rogatus sum","rogata es","rogatus es","rogata est","rogatus est","rogatae sumus","rogati sumus","rogatae estis","rogati estis","rogatae sunt","rogati sunt","rogauerim","rogaueris","rogauerit","rogauerimus","rogaueritis","rogauerint","rogata sim","rogatus sim","rogata sis","rogatus sis","rogata sit","rogatus sit","rogatae simus","rogati simus","rogatae sitis","rogati sitis","rogatae sint","rogati sint","spectaui","spectauisti","spectauit","spectauimus","spectauistis","spectauerunt","spectata sum","spectatus sum","spectata es","spectatus es","spectata est","spectatus est","spectatae sumus","spectati sumus","spectatae estis","spectati estis","spectatae sunt","spectati sunt","spectauerim","spectaueris","spectauerit","spectauerimus","spectaueritis","spectauerint","spectata sim","spectatus sim","spectata sis","spectatus sis","spectata sit","spectatus sit","spectatae simus","spectati simus","spectatae sitis","spectati sitis","spectatae sint","spectati sint","uocaui","uocauisti","uocauit","uocauimus","uocauistis","uocauerunt","uocata sum","uocatus sum","uocata es","uocatus es","uocata est","uocatus est","uocatae sumus","uocati sumus","uocatae estis","uocati estis","uocatae sunt","uocati sunt","uocauerim","uocaueris","uocauerit","uocauerimus","uocaueritis","uocauerint","uocata sim","uocatus sim","uocata sis","uocatus sis","uocata sit","uocatus sit","uocatae simus","uocati simus","uocatae sitis","uocati sitis","uocatae sint","uocati sint"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["amare","cogitare","curare","dare","errare","existimare","imperare","laudare","narrare","optare","orare","pugnare","putare","rogare","spectare","uocare"],"group":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]},"tables":{"gender":[null],"mood":["indicatif"],"voice":["actif"],"tense":["futur antérieur"],"translation":[["aimer"],["penser"],["soigner"],["donner"],["errer","se tromper"],["estimer","penser"],["ordonner"],["louer","approuver"],["raconter"],["souhaiter"],["demander"],["combattre"],["regarder"],["appeler"]],"primitive tenses":["o, as, are, aui, atum","o, as, are, dedi, datum"],"flx":["GP1_PER"]},"forms":{"latin":["amaueris","amauerit","amauerimus","amaueritis","amauerint","cogitaueris","cogitauerit","cogitauerimus","cogitaueritis","cogitauerint","curaueris","curauerit","curauerimus","curaueritis","curauerint","dederis","dederit","dederimus","dederitis","dederint","erraueris","errauerit","errauerimus","erraueritis","errauerint","existimaueris","existimauerit","existimauerimus","existimaueritis","existimauerint","imperaueris","imperauerit","imperauerimus","imperaueritis","imperauerint","laudaueris","laudauerit","laudauerimus","laudaueritis","laudauerint","narraueris","narrauerit","narrauerimus","narraueritis","narrauerint","optaueris","optauerit","optauerimus","optaueritis","optauerint","oraueris","orauerit","orauerimus","oraueritis","orauerint","pugnaueris","pugnauerit","pugnauerimus","pugnaueritis","pugnauerint","putaueris","putauerit","putauerimus","putaueritis","putauerint","rogaueris","rogauerit","rogauerimus","rogaueritis","rogauerint","spectaueris","spectauerit","spectauerimus","spectaueritis","spectauerint","uocaueris","uocauerit","uocauerimus","uocaueritis","uocauerint"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,11,11,11,11,11,12,12,12,12,12,13,13,13,13,13,14,14,14,14,14,15,15,15,15,15],"translation":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,11,11,11,11,11,1,1,1,1,1,10,10,10,10,10,12,12,12,12,12,13,13,13,13,13],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"person":[2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6],"irrégulier":[]}}};
@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g2-futur-anterieur.js"] = {"lemmas":{"lemma":["augere","debere","delere","habere","iubere","manere","monere","mouere","praebere","suadere","timere","uereri","uidere","uideri"],"group":[2,2,2,2,2,2,2,2,2,2,2,2,2,2]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur antérieur"],"translation":[["augmenter"],["devoir"],["détruire"],["avoir"],["ordonner"],["rester"],["avertir"],["mouvoir","émouvoir","susciter"],["présenter","offrir"],["conseiller","persuader"],["craindre"],["craindre","redouter"],["voir"],["sembler","paraître"]],"primitive tenses":["eo, es, ere, auxi, auctum","eo, es, ere, bui, bitum","eo, es, ere, eui, etum","habeo, es, ere, ui, itum","eo, es, ere, iussi, iussum","eo, es, ere, mansi, mansum","eo, es, ere, ui, itum","eo, es, ere, moui, motum","eo, es, ere, suasi, suasum","eo, es, ere, ui","eor, eris, eri, itus sum","eo, es, ere, uidi, uisum","eor, eris, eri, uisus sum"],"flx":["GP2_PER","GP2_SUP","GP2_DEP_SUP"]},"forms":{"latin":["auxero","auxeris","auxerit","auxerimus","auxeritis","auxerint","aucta ero","auctus ero","aucta eris","auctus eris","aucta erit","auctus erit","auctae erimus","aucti erimus","auctae eritis","aucti eritis","auctae erunt","aucti erunt","debuero","debueris","debuerit","debuerimus","debueritis","debuerint","debita ero","debitus ero","debita eris","debitus eris","debita erit","debitus erit","debitae erimus","debiti erimus","debitae eritis","debiti eritis","debitae erunt","debiti erunt","deleuero","deleueris","deleuerit","deleuerimus","deleueritis","deleuerint","deleta ero","deletus ero","deleta eris","deletus eris","deleta erit","deletus erit","deletae erimus","deleti erimus","deletae eritis","deleti eritis","deletae erunt","deleti erunt","habuero","habueris","habuerit","habuerimus","habueritis","habuerint","habita ero","habitus ero","habita eris","habitus eris","habita erit","habitus erit","habitae erimus","habiti erimus","habitae eritis","habiti eritis","habitae erunt","habiti erunt","iussero","iusseris","iusserit","iusserimus","iusseritis","iusserint","iussa ero","iussus ero","iussa eris","iussus eris","iussa erit","iussus erit","iussae erimus","iussi erimus","iussae eritis","iussi eritis","iussae erunt","iussi erunt","mansero","manseris","manserit","manserimus","manseritis","manserint","mansa ero","mansus ero","mansa eris","mansus eris","mansa erit","mansus erit","mansae erimus","mansi erimus","mansae eritis","mansi eritis","mansae erunt","mansi erunt","monuero","monueris","monuerit","monuerimus","monueritis","monuerint","monita ero","monitus ero","monita eris","monitus eris","monita erit","monitus erit","monitae erimus","moniti erimus","monitae eritis","moniti eritis","monitae erunt","moniti erunt","mouero","moueris","mouerit","mouerimus","moueritis","mouerint","mota ero","motus ero","mota eris","motus eris","mota erit","motus erit","motae erimus","moti erimus","motae eritis","moti eritis","motae erunt","moti erunt","praebuero","praebueris","praebuerit","praebuerimus","praebueritis","praebuerint","praebita ero","praebitus ero","praebita eris","praebitus eris","praebita erit","praebitus erit","praebitae erimus","praebiti erimus","praebitae eritis","praebiti eritis","praebitae erunt","praebiti erunt","suasero","suaseris","suaserit","suaserimus","suaseritis","suaserint","suasa ero","suasus ero","suasa eris","suasus eris","suasa erit","suasus erit","suasae erimus","suasi erimus","suasae eritis","suasi eritis","suasae erunt","suasi erunt","timuero","timueris","timuerit","timuerimus","timueritis","timuerint","uerita ero","ueritus ero","uerita eris","ueritus eris","uerita erit","ueritus erit","ueritae erimus","ueriti erimus","ueritae eritis","ueriti eritis","ueritae erunt","ueriti erunt","uidero","uideris","uiderit","uiderimus","uideritis","uiderint","uisa ero","uisus ero","uisa eris","uisus eris","uisa erit","uisus erit","uisae erimus","uisi erimus","uisae eritis","uisi eritis","uisae erunt","uisi erunt","uisa ero","uisus ero","uisa eris","uisus eris","uisa erit","uisus erit","uisae erimus","uisi erimus","uisae eritis","uisi eritis","uisae erunt","uisi erunt"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["augere","debere","delere","habere","iubere","manere","monere","mouere","praebere","suadere","timere","uidere","uideri"],"group":[2,2,2,2,2,2,2,2,2,2,2,2,2]},"tables":{"gender":[null],"mood":["indicatif","subjonctif"],"voice":["actif","passif","déponent"],"tense":["parfait","présent"],"translation":[["augmenter"],["devoir"],["détruire"],["avoir"],["ordonner"],["rester"],["avertir"],["mouvoir","émouvoir","susciter"],["présenter","offrir"],["conseiller","persuader"],["craindre"],["voir"],["sembler","paraître"]],"primitive tenses":["eo, es, ere, auxi, auctum","eo, es, ere, bui, bitum","eo, es, ere, eui, etum","habeo, es, ere, ui, itum","eo, es, ere, iussi, iussum","eo, es, ere, mansi, mansum","eo, es, ere, ui, itum","eo, es, ere, moui, motum","eo, es, ere, suasi, suasum","eo, es, ere, ui","eo, es, ere, uidi, uisum","eor, eris, eri, uisus sum"],"flx":["GP2_INF","GP2_PER","GP2_DEP_INF"]},"forms":{"latin":["auxeris","auxerit","auxerimus","auxeritis","auxerint","debueris","debuerit","debuerimus","debueritis","debuerint","deleueris","deleuerit","deleuerimus","deleueritis","deleuerint","habueris","habuerit","habuerimus","habueritis","habuerint","iusseris","iusserit","iusserimus","iusseritis","iusserint","manseris","manserit","manserimus","manseritis","manserint","monueris","monuerit","monuerimus","monueritis","monuerint","moueris","moueris","mouerit","mouerimus","moueritis","mouerint","praebueris","praebuerit","praebuerimus","praebueritis","praebuerint","suaseris","suaserit","suaserimus","suaseritis","suaserint","timueris","timuerit","timuerimus","timueritis","timuerint","uideris","uideris","uiderit","uiderimus","uideritis","uiderint","uideris"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,0],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,2],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1],"lemma":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,7,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,11,11,11,11,11,11,12],"translation":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,7,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,11,11,11,11,11,11,12],"primitive tenses":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,7,6,6,6,6,6,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,10,11],"flx":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,2],"person":[2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,2,3,4,5,6,2],"irrégulier":[]}}};
@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g2-futur.js"] = {"lemmas":{"lemma":["augere","debere","delere","habere","iubere","manere","monere","mouere","praebere","suadere","timere","uereri","uidere","uideri"],"group":[2,2,2,2,2,2,2,2,2,2,2,2,2,2]},"tables":{"gender":[null],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur"],"translation":[["augmenter"],["devoir"],["détruire"],["avoir"],["ordonner"],["rester"],["avertir"],["mouvoir","émouvoir","susciter"],["présenter","offrir"],["conseiller","persuader"],["craindre"],["craindre","redouter"],["voir"],["sembler","paraître"]],"primitive tenses":["eo, es, ere, auxi, auctum","eo, es, ere, bui, bitum","eo, es, ere, eui, etum","habeo, es, ere, ui, itum","eo, es, ere, iussi, iussum","eo, es, ere, mansi, mansum","eo, es, ere, ui, itum","eo, es, ere, moui, motum","eo, es, ere, suasi, suasum","eo, es, ere, ui","eor, eris, eri, itus sum","eo, es, ere, uidi, uisum","eor, eris, eri, uisus sum"],"flx":["GP2_INF","GP2_DEP_INF"]},"forms":{"latin":["augebo","augebis","augebit","augebimus","augebitis","augebunt","augebor","augeberis","augebitur","augebimur","augebimini","augebuntur","debebo","debebis","debebit","debebimus","debebitis","debebunt","debebor","debeberis","debebitur","debebimur","debebimini","debebuntur","delebo","delebis","delebit","delebimus","delebitis","delebunt","delebor","deleberis","delebitur","delebimur","delebimini","delebuntur","habebo","habebis","habebit","habebimus","habebitis","habebunt","habebor","habeberis","habebitur","habebimur","habebimini","habebuntur","iubebo","iubebis","iubebit","iubebimus","iubebitis","iubebunt","iubebor","iubeberis","iubebitur","iubebimur","iubebimini","iubebuntur","manebo","manebis","manebit","manebimus","manebitis","manebunt","manebor","maneberis","manebitur","manebimur","manebimini","manebuntur","monebo","monebis","monebit","monebimus","monebitis","monebunt","monebor","moneberis","monebitur","monebimur","monebimini","monebuntur","mouebo","mouebis","mouebit","mouebimus","mouebitis","mouebunt","mouebor","moueberis","mouebitur","mouebimur","mouebimini","mouebuntur","praebebo","praebebis","praebebit","praebebimus","praebebitis","praebebunt","praebebor","praebeberis","praebebitur","praebebimur","praebebimini","praebebuntur","suadebo","suadebis","suadebit","suadebimus","suadebitis","suadebunt","suadebor","suadeberis","suadebitur","suadebimur","suadebimini","suadebuntur","timebo","timebis","timebit","timebimus","timebitis","timebunt","timebor","timeberis","timebitur","timebimur","timebimini","timebuntur","uerebor","uereberis","uerebitur","uerebimur","uerebimini","uerebuntur","uidebo","uidebis","uidebit","uidebimus","uidebitis","uidebunt","uidebor","uideberis","uidebitur","uidebimur","uidebimini","uidebuntur","uidebor","uideberis","uidebitur","uidebimur","uidebimini","uidebuntur"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,6,6,6,6,6,6,6,6,6,6,6,6,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1],"person":[1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6],"irrégulier":[7,19,31,43,55,67,79,91,103,115,127,133,145,151]}};
@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g2-parfait.js"] = {"lemmas":{"lemma":["augere","debere","delere","habere","iubere","manere","monere","mouere","praebere","suadere","timere","uereri","uidere","uideri"],"group":[2,2,2,2,2,2,2,2,2,2,2,2,2,2]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif","subjonctif"],"voice":["actif","passif","déponent"],"tense":["parfait"],"translation":[["augmenter"],["devoir"],["détruire"],["avoir"],["ordonner"],["rester"],["avertir"],["mouvoir","émouvoir","susciter"],["présenter","offrir"],["conseiller","persuader"],["craindre"],["craindre","redouter"],["voir"],["sembler","paraître"]],"primitive tenses":["eo, es, ere, auxi, auctum","eo, es, ere, bui, bitum","eo, es, ere, eui, etum","habeo, es, ere, ui, itum","eo, es, ere, iussi, iussum","eo, es, ere, mansi, mansum","eo, es, ere, ui, itum","eo, es, ere, moui, motum","eo, es, ere, suasi, suasum","eo, es, ere, ui","eor, eris, eri, itus sum","eo, es, ere, uidi, uisum","eor, eris, eri, uisus sum"],"flx":["GP2_PER","GP2_SUP","GP2_DEP_SUP"]},"forms":{"latin":["auxi","auxisti","auxit","auximus","auxistis","auxerunt","aucta sum","auctus sum","aucta es","auctus es","aucta est","auctus est","auctae sumus","aucti sumus","auctae estis","aucti estis","auctae sunt","aucti sunt","auxerim","auxeris","auxerit","auxerimus","auxeritis","auxerint","aucta sim","auctus sim","aucta sis","auctus sis","aucta sit","auctus sit","auctae simus","aucti simus","auctae sitis","aucti sitis","auctae sint","aucti sint","debui","debuisti","debuit","debuimus","debuistis","debuerunt","debita sum","debitus sum","debita es","debitus es","debita est","debitus est","debitae sumus","debiti sumus","debitae estis","debiti estis","debitae sunt","debiti sunt","debuerim","debueris","debuerit","debuerimus","debueritis","debuerint","debita sim","debitus sim","debita sis","debitus sis","debita sit","debitus sit","debitae simus","debiti simus","debitae sitis","debiti sitis","debitae sint","debiti sint","deleui","deleuisti","deleuit","deleuimus","deleuistis","deleuerunt","deleta sum","deletus sum","deleta es","deletus es","deleta est","deletus est","deletae sumus","deleti sumus","deletae estis","deleti estis","deletae sunt","deleti sunt","deleuerim","deleueris","deleuerit","deleuerimus","deleueritis","deleuerint","deleta sim","deletus sim","deleta sis","deletus sis","deleta sit","deletus sit","deletae simus","deleti simus","deletae sitis","deleti sitis","deletae sint","deleti sint","habui","habuisti","habuit","habuimus","habuistis","habuerunt","habita sum","habitus sum","habita es","habitus es","habita est","habitus est","habitae sumus","habiti sumus","habitae estis","habiti estis","habitae sunt","habiti sunt","habuerim","habueris","habuerit","habuerimus","habueritis","habuerint","habita sim","habitus sim","habita sis","habitus sis","habita sit","habitus sit","habitae simus","habiti simus","habitae sitis","habiti sitis","habitae sint","habiti sint","iussi","iussisti","iussit","iussimus","iussistis","iusserunt","iussa sum","iussus sum","iussa es","iussus es","iussa est","iussus est","iussae sumus","iussi sumus","iussae estis","iussi estis","iussae sunt","iussi sunt","iusserim","iusseris","iusserit","iusserimus","iusseritis","iusserint","iussa sim","iussus sim","iussa sis","iussus sis","iussa sit","iussus sit","iussae simus","iussi simus","iussae sitis","iussi sitis","iussae sint","iussi sint","mansi","mansisti","mansit","mansimus","mansistis","manserunt","mansa sum","mansus sum","mansa es","mansus es","mansa est","mansus est","mansae sumus","mansi sumus","mansae estis","mansi estis","mansae sunt","mansi sunt","manserim","manseris","manserit","manserimus","manseritis","manserint","mansa sim","mansus sim","mansa sis","mansus sis","mansa sit","mansus sit","mansae simus","mansi simus","mansae sitis","mansi sitis","mansae sint","mansi sint","monui","monuisti","monuit","monuimus","monuistis","monuerunt","monita sum","monitus sum","monita es","monitus es","monita est","monitus est","monitae sumus","moniti sumus","monitae estis","moniti estis","monitae sunt","moniti sunt","monuerim","monueris","monuerit","monuerimus","monueritis","monuerint","monita sim","monitus sim","monita sis","monitus sis","monita sit","monitus sit","monitae simus","moniti simus","monitae sitis","moniti sitis","monitae sint","moniti sint","moui","mouisti","mouit","mouimus","mouistis","mouerunt","mota sum","motus sum","mota es","motus es","mota est","motus est","motae sumus","moti sumus","motae estis","moti estis","motae sunt","moti sunt","mouerim","moueris","mouerit","mouerimus","moueritis","mouerint","mota sim","motus sim","mota sis","motus sis","mota sit","motus sit","motae simus","moti simus","motae sitis","moti sitis","motae sint","moti sint","praebui","praebuisti","praebuit","praebuimus","praebuistis","praebuerunt","praebita sum","praebitus sum","praebita es","praebitus es","praebita est","praebitus est","praebitae sumus","praebiti sumus","praebitae estis","praebiti estis","praebitae sunt","praebiti sunt","praebuerim","praebueris","praebuerit","praebuerimus","praebueritis","praebuerint","praebita sim","praebitus sim","praebita sis","praebitus sis","praebita sit","praebitus sit","praebitae simus","praebiti simus","praebitae sitis","praebiti sitis","praebitae sint","praebiti sint","suasi","suasisti","suasit","suasimus","suasistis","suaserunt","suasa sum","suasus sum","suasa es","suasus es","suasa est","suasus est","suasae sumus","suasi sumus","suasae estis","suasi estis","suasae sunt","suasi sunt","suaserim","suaseris","suaserit","suaserimus","suaseritis","suaserint","suasa sim","suasus sim","suasa sis","suasus sis","suasa sit","suasus sit","suasae simus","suasi simus","suasae sitis","suasi sitis","suasae sint","suasi sint","timui","timuisti","timuit","timuimus","timuistis","timuerunt","timuerim","timueris","timuerit","timuerimus","timueritis","timuerint","uerita sum","ueritus sum","uerita es","ueritus es","uerita est","ueritus est","ueritae sumus","ueriti sumus","ueritae estis","ueriti estis","ueritae sunt","ueriti sunt","uerita sim","ueritus sim","uerita sis","ueritus sis","uerita sit","ueritus sit","ueritae simus","ueriti simus","ueritae sitis","ueriti sitis","ueritae sint","ueriti sint","uidi","uidisti","uidit","uidimus","uidistis","uiderunt","uisa sum","uisus sum","uisa es","uisus es","uisa est","uisus est","uisae sumus","uisi sumus","uisae estis","uisi estis","uisae sunt","uisi sunt","uiderim","uideris","uiderit","uiderimus","uideritis","uiderint","uisa sim","uisus sim","uisa sis","uisus sis","uisa sit","uisus sit","uisae simus","uisi simus","uisae sitis","uisi sitis","uisae sint","uisi sint","uisa sum","uisus sum","uisa es","uisus es","uisa est","uisus est","uisae sumus","uisi sumus","uisae estis","uisi estis","uisae sunt","uisi sunt","uisa sim","uisus sim","uisa sis","uisus sis","uisa sit","uisus sit","uisae simus","uisi simus","uisae sitis","uisi sitis","uisae sint","uisi sint"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["augere","debere","delere","habere","iubere","manere","monere","mouere","praebere","suadere","timere","uidere","uideri"],"group":[2,2,2,2,2,2,2,2,2,2,2,2,2]},"tables":{"gender":[null],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur antérieur","présent"],"translation":[["augmenter"],["devoir"],["détruire"],["avoir"],["ordonner"],["rester"],["avertir"],["mouvoir","émouvoir","susciter"],["présenter","offrir"],["conseiller","persuader"],["craindre"],["voir"],["sembler","paraître"]],"primitive tenses":["eo, es, ere, auxi, auctum","eo, es, ere, bui, bitum","eo, es, ere, eui, etum","habeo, es, ere, ui, itum","eo, es, ere, iussi, iussum","eo, es, ere, mansi, mansum","eo, es, ere, ui, itum","eo, es, ere, moui, motum","eo, es, ere, suasi, suasum","eo, es, ere, ui","eo, es, ere, uidi, uisum","eor, eris, eri, uisus sum"],"flx":["GP2_INF","GP2_PER","GP2_DEP_INF"]},"forms":{"latin":["auxeris","auxerit","auxerimus","auxeritis","auxerint","debueris","debuerit","debuerimus","debueritis","debuerint","deleueris","deleuerit","deleuerimus","deleueritis","deleuerint","habueris","habuerit","habuerimus","habueritis","habuerint","iusseris","iusserit","iusserimus","iusseritis","iusserint","manseris","manserit","manserimus","manseritis","manserint","monueris","monuerit","monuerimus","monueritis","monuerint","moueris","mouerit","mouerimus","moueritis","mouerint","moueris","praebueris","praebuerit","praebuerimus","praebueritis","praebuerint","suaseris","suaserit","suaserimus","suaseritis","suaserint","timueris","timuerit","timuerimus","timueritis","timuerint","uideris","uiderit","uiderimus","uideritis","uiderint","uideris","uideris"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,2],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1],"lemma":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,7,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,11,11,11,11,11,11,12],"translation":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,7,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,11,11,11,11,11,11,12],"primitive tenses":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,7,6,6,6,6,6,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,10,11],"flx":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,2],"person":[2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,2],"irrégulier":[]}}};
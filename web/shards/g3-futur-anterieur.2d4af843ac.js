@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g3-futur-anterieur.js"] = {"lemmas":{"lemma":["agere","cognoscere","colere","credere","dicere","ducere","gerere","intellegere","legere","loqui","mittere","nasci","occidere","pellere","petere","proficisci","relinquere","scribere","sequi","statuere","tradere","uincere","uiuere","uti"],"group":[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur antérieur"],"translation":[["faire","accomplir","pousser"],["apprendre à connaître","connaître"],["cultiver","honorer","habiter"],["croire"],["dire"],["conduire","considérer comme"],["faire","accomplir"],["comprendre"],["lire","cueillir","choisir"],["choisir"],["parler"],["envoyer"],["raconter"],["naître"],["tuer","tomber"],["demander"],["pousser","chasser"],["partir","s'en aller"],["laisser","tomber"],["écrire"],["suivre"],["décider","déterminer"],["transmettre","raconter"],["vaincre"],["vivre"],["utiliser"]],"primitive tenses":["o, is, ere, egi, actum","o, is, ere, gnoui, gnitum","o, is, ere, colui, cultum","o, is, ere, didi, ditum","o, is, ere, dixi, dictum","o, is, ere, duxi, ductum","o, is, ere, uidi, uisum","o, is, ere, gessi, gestum","o, is, ere, legi, lectum","or, eris, loqui, locutus sum","o, is, ere, misi, missum","or, eris, nasci, natus sum","o, is, ere, cidi, cisum","o, is, ere, pepuli, pulsum","o, is, ere, iui, itum","o, is, ere, i(u)i, itum","or, eris, i, fectus sum","o, is, ere, liqui, lictum","o, is, ere, scripsi, scriptum","or, eris, sequi, secutus sum","o, is, ere, ui, utum","o, is, ere, uici, uictum","o, is, ere, uixi, uictum","or, eris, uti, usus sum"],"flx":["GP3_PER","GP3_SUP","GP3_DEP_SUP","GP3_PER_SYN"]},"forms":{"latin":["egero","egeris","egerit","egerimus","egeritis","egerint","acta ero","actus ero","acta eris","actus eris","acta erit","actus erit","actae erimus","acti erimus","actae eritis","acti eritis","actae erunt","acti erunt","cognouero","cognoueris","cognouerit","cognouerimus","cognoueritis","cognouerint","cognituma ero","cognitumus ero","cognituma eris","cognitumus eris","cognituma erit","cognitumus erit","cognitumae erimus","cognitumi erimus","cognitumae eritis","cognitumi eritis","cognitumae erunt","cognitumi erunt","coluero","colueris","coluerit","coluerimus","colueritis","coluerint","culta ero","cultus ero","culta eris","cultus eris","culta erit","cultus erit","cultae erimus","culti erimus","cultae eritis","culti eritis","cultae erunt","culti erunt","credidero","credideris","crediderit","crediderimus","credideritis","crediderint","credita ero","creditus ero","credita eris","creditus eris","credita erit","creditus erit","creditae erimus","crediti erimus","creditae eritis","crediti eritis","creditae erunt","crediti erunt","dixero","dixeris","dixerit","dixerimus","dixeritis","dixerint","dicta ero","dictus ero","dicta eris","dictus eris","dicta erit","dictus erit","dictae erimus","dicti erimus","dictae eritis","dicti eritis","dictae erunt","dicti erunt","duxero","duxeris","duxerit","duxerimus","duxeritis","duxerint","ducta ero","ductus ero","ducta eris","ductus eris","ducta erit","ductus erit","ductae erimus","ducti erimus","ductae eritis","ducti eritis","ductae erunt","ducti erunt","gessero","gesseris","gesserit","gesserimus","gesseritis","gesserint","gesta ero","gestus ero","gesta eris","gestus eris","gesta erit","gestus erit","gestae erimus","gesti erimus","gestae eritis","gesti eritis","gestae erunt","gesti erunt","intellexero","intellexeris","intellexerit","intellexerimus","intellexeritis","intellexerint","intellecta ero","intellectus ero","intellecta eris","intellectus eris","intellecta erit","intellectus erit","intellectae erimus","intellecti erimus","intellectae eritis","intellecti eritis","intellectae erunt","intellecti erunt","legero","legeris","legerit","legerimus","legeritis","legerint","lecta ero","lectus ero","lecta eris","lectus eris","lecta erit","lectus erit","lectae erimus","lecti erimus","lectae eritis","lecti eritis","lectae erunt","lecti erunt","locuta ero","locutus ero","locuta eris","locutus eris","locuta erit","locutus erit","locutae erimus","locuti erimus","locutae eritis","locuti eritis","locutae erunt","locuti erunt","misero","miseris","miserit","miserimus","miseritis","miserint","missa ero","missus ero","missa eris","missus eris","missa erit","missus erit","missae erimus","missi erimus","missae eritis","missi eritis","missae erunt","missi erunt","nata ero","natus ero","nata eris","natus eris","nata erit","natus erit","natae erimus","nati erimus","natae eritis","nati eritis","natae erunt","nati erunt","occidero","occideris","occiderit","occiderimus","occideritis","occiderint","occisa ero","occisus ero","occisa eris","occisus eris","occisa erit","occisus erit","occisae erimus","occisi erimus","occisae eritis","occisi eritis","occisae erunt","occisi erunt","pepulero","pepuleris","pepulerit","pepulerimus","pepuleritis","pepulerint","pulsa ero","pulsus ero","pulsa eris","pulsus eris","pulsa erit","pulsus erit","pulsae erimus","pulsi erimus","pulsae eritis","pulsi eritis","pulsae erunt","pulsi erunt","petiuero","petiero","petiueris","petieris","petiuerit","petierit","petiuerimus","petierimus","petiueritis","petieritis","petiuerint","petierint","petita ero","petitus ero","petita eris","petitus eris","petita erit","petitus erit","petitae erimus","petiti erimus","petitae eritis","petiti eritis","petitae erunt","petiti erunt","profecta ero","profectus ero","profecta eris","profectus eris","profecta erit","profectus erit","profectae erimus","profecti erimus","profectae eritis","profecti eritis","profectae erunt","profecti erunt","reliquero","reliqueris","reliquerit","reliquerimus","reliqueritis","reliquerint","relicta ero","relictus ero","relicta eris","relictus eris","relicta erit","relictus erit","relictae erimus","relicti erimus","relictae eritis","relicti eritis","relictae erunt","relicti erunt","scripsero","scripseris","scripserit","scripserimus","scripseritis","scripserint","scripta ero","scriptus ero","scripta eris","scriptus eris","scripta erit","scriptus erit","scriptae erimus","scripti erimus","scriptae eritis","scripti eritis","scriptae erunt","scripti erunt","secuta ero","secutus ero","secuta eris","secutus eris","secuta erit","secutus erit","secutae erimus","secuti erimus","secutae eritis","secuti eritis","secutae erunt","secuti erunt","statuero","statueris","statuerit","statuerimus","statueritis","statuerint","statuta ero","statutus ero","statuta eris","statutus eris","statuta erit","statutus erit","statutae erimus","statuti erimus","statutae eritis","statuti eritis","statutae erunt","statuti erunt","tradidero","tradideris","tradiderit","tradiderimus","tradideritis","tradiderint","tradita ero","traditus ero","tradita eris","traditus eris","tradita erit","traditus erit","traditae erimus","traditi erimus","traditae eritis","traditi eritis","traditae erunt","traditi erunt","uicero","uiceris","uicerit","uicerimus","uiceritis","uicerint","uicta ero","uictus ero","uicta eris","uictus eris","uicta erit","uictus erit","uictae erimus","uicti erimus","uictae eritis","uicti eritis","uictae erunt","uicti erunt","uixero","uixeris","uixerit","uixerimus","uixeritis","uixerint","uicta ero","uictus ero","uicta eris","uictus eris","uicta erit","uictus erit","uictae erimus","uicti erimus","uictae eritis","uicti eritis","uictae erunt","uicti erunt","usa ero","usus ero","usa eris","usus eris","usa erit","usus erit","usae erimus","usi erimus","usae eritis","usi eritis","usae erunt","usi erunt"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,23,23,23,23,23],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,12,12,12,12,12,12,12,12,12,12,12,12,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,25,25,25,25,25,25,25,25,25,25,25,25],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,15,15,15,15,15,15,15,15,15,15,15,15,14,14,14,14,14,14,14,14,14,14,14,14,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,23,23,23,23,23],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,3,0,3,0,3,0,3,0,3,0,3,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["agere","cognoscere","colere","credere","dicere","ducere","gerere","intellegere","legere","mittere","occidere","pellere","petere","relinquere","scribere","statuere","tradere","uincere","uiuere"],"group":[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3]},"tables":{"gender":[null],"mood":["indicatif","subjonctif"],"voice":["actif","passif"],"tense":["futur","parfait","présent"],"translation":[["faire","accomplir","pousser"],["apprendre à connaître","connaître"],["cultiver","honorer","habiter"],["croire"],["dire"],["conduire","considérer comme"],["faire","accomplir"],["comprendre"],["lire","cueillir","choisir"],["envoyer"],["tuer","tomber"],["demander"],["pousser","chasser"],["laisser","tomber"],["écrire"],["décider","déterminer"],["transmettre","raconter"],["vaincre"],["vivre"]],"primitive tenses":["o, is, ere, egi, actum","o, is, ere, gnoui, gnitum","o, is, ere, colui, cultum","o, is, ere, didi, ditum","o, is, ere, dixi, dictum","o, is, ere, duxi, ductum","o, is, ere, uidi, uisum","o, is, ere, gessi, gestum","o, is, ere, legi, lectum","o, is, ere, misi, missum","o, is, ere, cidi, cisum","o, is, ere, pepuli, pulsum","o, is, ere, i(u)i, itum","o, is, ere, liqui, lictum","o, is, ere, scripsi, scriptum","o, is, ere, ui, utum","o, is, ere, uici, uictum","o, is, ere, uixi, uictum"],"flx":["GP3_INF","GP3_PER","GP3_PER_SYN"]},"forms":{"latin":["egeris","egerit","egerimus","egeritis","egerint","cognoueris","cognouerit","cognouerimus","cognoueritis","cognouerint","colueris","coluerit","coluerimus","colueritis","coluerint","credideris","crediderit","crediderimus","credideritis","crediderint","dixeris","dixerit","dixerimus","dixeritis","dixerint","duxeris","duxerit","duxerimus","duxeritis","duxerint","gesseris","gesserit","gesserimus","gesseritis","gesserint","intellexeris","intellexerit","intellexerimus","intellexeritis","intellexerint","legeris","legeris","legeris","legerit","legerimus","legeritis","legerint","miseris","miserit","miserimus","miseritis","miserint","occideris","occideris","occideris","occiderit","occiderimus","occideritis","occiderint","pepuleris","pepulerit","pepulerimus","pepuleritis","pepulerint","petiueris","petieris","petiuerit","petierit","petiuerimus","petierimus","petiueritis","petieritis","petiuerint","petierint","reliqueris","reliquerit","reliquerimus","reliqueritis","reliquerint","scripseris","scripserit","scripserimus","scripseritis","scripserint","statueris","statueris","statueris","statuerit","statuerimus","statueritis","statuerint","tradideris","tradiderit","tradiderimus","tradideritis","tradiderint","uiceris","uicerit","uicerimus","uiceritis","uicerint","uixeris","uixerit","uixerimus","uixeritis","uixerint"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,2,1,1,1,1,1,1,1,1,1,1,0,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"lemma":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,10,10,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,14,14,14,14,14,15,15,15,15,15,15,15,16,16,16,16,16,17,17,17,17,17,18,18,18,18,18],"translation":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,10,10,12,12,12,12,12,11,11,11,11,11,11,11,11,11,11,13,13,13,13,13,14,14,14,14,14,15,15,15,15,15,15,15,16,16,16,16,16,17,17,17,17,17,18,18,18,18,18],"primitive tenses":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,10,10,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,14,14,14,14,14,15,15,15,15,15,15,15,3,3,3,3,3,16,16,16,16,16,17,17,17,17,17],"flx":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"person":[2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,2,2,3,4,5,6,2,3,4,5,6,2,2,2,3,4,5,6,2,3,4,5,6,2,2,3,3,4,4,5,5,6,6,2,3,4,5,6,2,3,4,5,6,2,2,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6],"irrégulier":[41,53,85]}}};
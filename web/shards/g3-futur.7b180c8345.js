@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g3-futur.js"] = {"lemmas":{"lemma":["agere","cognoscere","colere","credere","dicere","ducere","gerere","intellegere","legere","loqui","mittere","nasci","occidere","pellere","petere","proficisci","relinquere","scribere","sequi","statuere","tradere","uincere","uiuere","uti"],"group":[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3]},"tables":{"gender":[null],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur"],"translation":[["faire","accomplir","pousser"],["apprendre à connaître","connaître"],["cultiver","honorer","habiter"],["croire"],["dire"],["conduire","considérer comme"],["faire","accomplir"],["comprendre"],["lire","cueillir","choisir"],["parler"],["envoyer"],["naître"],["tuer","tomber"],["demander"],["pousser","chasser"],["partir","s'en aller"],["laisser","tomber"],["écrire"],["suivre"],["décider","déterminer"],["transmettre","raconter"],["vaincre"],["vivre"],["utiliser"]],"primitive tenses":["o, is, ere, egi, actum","o, is, ere, gnoui, gnitum","o, is, ere, colui, cultum","o, is, ere, didi, ditum","o, is, ere, dixi, dictum","o, is, ere, duxi, ductum","o, is, ere, uidi, uisum","o, is, ere, gessi, gestum","o, is, ere, legi, lectum","or, eris, loqui, locutus sum","o, is, ere, misi, missum","or, eris, nasci, natus sum","o, is, ere, cidi, cisum","o, is, ere, pepuli, pulsum","o, is, ere, iui, itum","or, eris, i, fectus sum","o, is, ere, liqui, lictum","o, is, ere, scripsi, scriptum","or, eris, sequi, secutus sum","o, is, ere, ui, utum","o, is, ere, uici, uictum","o, is, ere, uixi, uictum","or, eris, uti, usus sum"],"flx":["GP3_INF","GP3_DEP_INF"]},"forms":{"latin":["agam","ages","aget","agemus","agetis","agent","agar","ageris","agetur","agemur","agemini","agentur","cognoscam","cognosces","cognoscet","cognoscemus","cognoscetis","cognoscent","cognoscar","cognosceris","cognoscetur","cognoscemur","cognoscemini","cognoscentur","colam","coles","colet","colemus","coletis","colent","colar","coleris","coletur","colemur","colemini","colentur","credam","credes","credet","credemus","credetis","credent","credar","crederis","credetur","credemur","credemini","credentur","dicam","dices","dicet","dicemus","dicetis","dicent","dicar","diceris","dicetur","dicemur","dicemini","dicentur","ducam","duces","ducet","ducemus","ducetis","ducent","ducar","duceris","ducetur","ducemur","ducemini","ducentur","geram","geres","geret","geremus","geretis","gerent","gerar","gereris","geretur","geremur","geremini","gerentur","intellegam","intelleges","intelleget","intellegemus","intellegetis","intellegent","intellegar","intellegeris","intellegetur","intellegemur","intellegemini","intellegentur","legam","leges","leget","legemus","legetis","legent","legar","legeris","legetur","legemur","legemini","legentur","loquar","loqueris","loquetur","loquemur","loquemini","loquentur","mittam","mittes","mittet","mittemus","mittetis","mittent","mittar","mitteris","mittetur","mittemur","mittemini","mittentur","nascar","nasceris","nascetur","nascemur","nascemini","nascentur","occidam","occides","occidet","occidemus","occidetis","occident","occidar","occideris","occidetur","occidemur","occidemini","occidentur","pellam","pelles","pellet","pellemus","pelletis","pellent","pellar","pelleris","pelletur","pellemur","pellemini","pellentur","petam","petes","petet","petemus","petetis","petent","petar","peteris","petetur","petemur","petemini","petentur","proficiscar","proficisceris","proficiscetur","proficiscemur","proficiscemini","proficiscentur","relinquam","relinques","relinquet","relinquemus","relinquetis","relinquent","relinquar","relinqueris","relinquetur","relinquemur","relinquemini","relinquentur","scribam","scribes","scribet","scribemus","scribetis","scribent","scribar","scriberis","scribetur","scribemur","scribemini","scribentur","sequar","sequeris","sequetur","sequemur","sequemini","sequentur","statuam","statues","statuet","statuemus","statuetis","statuent","statuar","statueris","statuetur","statuemur","statuemini","statuentur","tradam","trades","tradet","trademus","tradetis","tradent","tradar","traderis","tradetur","trademur","trademini","tradentur","uincam","uinces","uincet","uincemus","uincetis","uincent","uincar","uinceris","uincetur","uincemur","uincemini","uincentur","uiuam","uiues","uiuet","uiuemus","uiuetis","uiuent","uiuar","uiueris","uiuetur","uiuemur","uiuemini","uiuentur","utar","uteris","utetur","utemur","utemini","utentur"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,14,14,14,14,14,14,14,14,14,14,14,14,13,13,13,13,13,13,13,13,13,13,13,13,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,3,3,3,3,3,3,3,3,3,3,3,3,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1],"person":[1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["agere","cognoscere","colere","credere","dicere","ducere","gerere","intellegere","legere","loqui","mittere","nasci","occidere","pellere","petere","proficisci","relinquere","scribere","sequi","statuere","tradere","uincere","uiuere","uti"],"group":[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3]},"tables":{"gender":[null],"mood":["indicatif","subjonctif"],"voice":["actif","passif","déponent"],"tense":["futur antérieur","parfait","présent"],"translation":[["faire","accomplir","pousser"],["apprendre à connaître","connaître"],["cultiver","honorer","habiter"],["croire"],["dire"],["conduire","considérer comme"],["faire","accomplir"],["comprendre"],["lire","cueillir","choisir"],["parler"],["envoyer"],["naître"],["tuer","tomber"],["demander"],["pousser","chasser"],["partir","s'en aller"],["laisser","tomber"],["écrire"],["suivre"],["décider","déterminer"],["transmettre","raconter"],["vaincre"],["vivre"],["utiliser"]],"primitive tenses":["o, is, ere, egi, actum","o, is, ere, gnoui, gnitum","o, is, ere, colui, cultum","o, is, ere, didi, ditum","o, is, ere, dixi, dictum","o, is, ere, duxi, ductum","o, is, ere, uidi, uisum","o, is, ere, gessi, gestum","o, is, ere, legi, lectum","or, eris, loqui, locutus sum","o, is, ere, misi, missum","or, eris, nasci, natus sum","o, is, ere, cidi, cisum","o, is, ere, pepuli, pulsum","o, is, ere, iui, itum","or, eris, i, fectus sum","o, is, ere, liqui, lictum","o, is, ere, scripsi, scriptum","or, eris, sequi, secutus sum","o, is, ere, ui, utum","o, is, ere, uici, uictum","o, is, ere, uixi, uictum","or, eris, uti, usus sum"],"flx":["GP3_INF","GP3_PER","GP3_DEP_INF"]},"forms":{"latin":["ageris","agam","agar","cognosceris","cognoscam","cognoscar","coleris","colam","colar","crederis","credam","credar","diceris","dicam","dicar","duceris","ducam","ducar","gereris","geram","gerar","intellegeris","intellegam","intellegar","legeris","legeris","legeris","legam","legar","loqueris","loquar","mitteris","mittam","mittar","nasceris","nascar","occideris","occideris","occideris","occidam","occidar","pelleris","pellam","pellar","peteris","petam","petar","proficisceris","proficiscar","relinqueris","relinquam","relinquar","scriberis","scribam","scribar","sequeris","sequar","statueris","statueris","statueris","statuam","statuar","traderis","tradam","tradar","uinceris","uincam","uincar","uiueris","uiuam","uiuar","uteris","utar"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,1,1,0,1,1,0,1,1,0,1,1,0,1,1,0,1,1,0,1,1,0,1,1,0,0,1,1,1,0,1,0,1,1,0,1,0,0,1,1,1,0,1,1,0,1,1,0,1,0,1,1,0,1,1,0,1,0,0,1,1,1,0,1,1,0,1,1,0,1,1,0,1],"voice":[1,0,1,1,0,1,1,0,1,1,0,1,1,0,1,1,0,1,1,0,1,1,0,1,0,1,0,0,1,2,2,1,0,1,2,2,0,1,0,0,1,1,0,1,1,0,1,2,2,1,0,1,1,0,1,2,2,0,1,0,0,1,1,0,1,1,0,1,1,0,1,2,2],"tense":[2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,2,1,2,2,2,2,2,2,2,2,2,0,2,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,2,1,2,2,2,2,2,2,2,2,2,2,2,2,2],"lemma":[0,0,0,1,1,1,2,2,2,3,3,3,4,4,4,5,5,5,6,6,6,7,7,7,8,8,8,8,8,9,9,10,10,10,11,11,12,12,12,12,12,13,13,13,14,14,14,15,15,16,16,16,17,17,17,18,18,19,19,19,19,19,20,20,20,21,21,21,22,22,22,23,23],"translation":[0,0,0,1,1,1,2,2,2,3,3,3,4,4,4,5,5,5,6,6,6,7,7,7,8,8,8,8,8,9,9,10,10,10,11,11,12,12,12,12,12,14,14,14,13,13,13,15,15,16,16,16,17,17,17,18,18,19,19,19,19,19,20,20,20,21,21,21,22,22,22,23,23],"primitive tenses":[0,0,0,1,1,1,2,2,2,3,3,3,4,4,4,5,5,5,6,6,6,7,7,7,8,8,8,8,8,9,9,10,10,10,11,11,12,12,12,12,12,13,13,13,14,14,14,15,15,16,16,16,17,17,17,18,18,19,19,19,19,19,3,3,3,20,20,20,21,21,21,22,22],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,2,2,0,0,0,2,2,1,0,1,0,0,0,0,0,0,0,0,2,2,0,0,0,0,0,0,2,2,1,0,1,0,0,0,0,0,0,0,0,0,0,0,2,2],"person":[2,1,1,2,1,1,2,1,1,2,1,1,2,1,1,2,1,1,2,1,1,2,1,1,2,2,2,1,1,2,1,2,1,1,2,1,2,2,2,1,1,2,1,1,2,1,1,2,1,2,1,1,2,1,1,2,1,2,2,2,1,1,2,1,1,2,1,1,2,1,1,2,1],"irrégulier":[0,3,6,9,12,15,18,21,25,29,31,34,37,41,44,47,49,52,55,58,62,65,68,71]}}};
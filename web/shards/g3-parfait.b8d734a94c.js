@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g3-parfait.js"] = {"lemmas":{"lemma":["agere","cognoscere","colere","credere","dicere","ducere","gerere","intellegere","legere","loqui","mittere","nasci","occidere","pellere","petere","proficisci","relinquere","scribere","sequi","statuere","tradere","uincere","uiuere","uti"],"group":[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif","subjonctif"],"voice":["actif","passif","déponent"],"tense":["parfait"],"translation":[["faire","accomplir","pousser"],["apprendre à connaître","connaître"],["cultiver","honorer","habiter"],["croire"],["dire"],["conduire","considérer comme"],["faire","accomplir"],["comprendre"],["lire","cueillir","choisir"],["choisir"],["parler"],["envoyer"],["raconter"],["naître"],["tuer","tomber"],["demander"],["pousser","chasser"],["partir","s'en aller"],["laisser","tomber"],["écrire"],["suivre"],["décider","déterminer"],["transmettre","raconter"],["vaincre"],["vivre"],["utiliser"]],"primitive tenses":["o, is, ere, egi, actum","o, is, ere, gnoui, gnitum","o, is, ere, colui, cultum","o, is, ere, didi, ditum","o, is, ere, dixi, dictum","o, is, ere, duxi, ductum","o, is, ere, uidi, uisum","o, is, ere, gessi, gestum","o, is, ere, legi, lectum","or, eris, loqui, locutus sum","o, is, ere, misi, missum","or, eris, nasci, natus sum","o, is, ere, cidi, cisum","o, is, ere, pepuli, pulsum","o, is, ere, iui, itum","o, is, ere, i(u)i, itum","or, eris, i, fectus sum","o, is, ere, liqui, lictum","o, is, ere, scripsi, scriptum","or, eris, sequi, secutus sum","o, is, ere, ui, utum","o, is, ere, uici, uictum","o, is, ere, uixi, uictum","or, eris, uti, usus sum"],"flx":["GP3_PER","GP3_SUP","GP3_DEP_SUP","GP3_PER_SYN"]},"forms":{"latin":["egi","egisti","egit","egimus","egistis","egerunt","acta sum","actus sum","acta es","actus es","acta est","actus est","actae sumus","acti sumus","actae estis","acti estis","actae sunt","acti sunt","egerim","egeris","egerit","egerimus","egeritis","egerint","acta sim","actus sim","acta sis","actus sis","acta sit","actus sit","actae simus","acti simus","actae sitis","acti sitis","actae sint","acti sint","cognoui","cognouisti","cognouit","cognouimus","cognouistis","cognouerunt","cognituma sum","cognitumus sum","cognituma es","cognitumus es","cognituma est","cognitumus est","cognitumae sumus","cognitumi sumus","cognitumae estis","cognitumi estis","cognitumae sunt","cognitumi sunt","cognouerim","cognoueris","cognouerit","cognouerimus","cognoueritis","cognouerint","cognituma sim","cognitumus sim","cognituma sis","cognitumus sis","cognituma sit","cognitumus sit","cognitumae simus","cognitumi simus","cognitumae sitis","cognitumi sitis","cognitumae sint","cognitumi sint","colui","coluisti","coluit","coluimus","coluistis","coluerunt","culta sum","cultus sum","culta es","cultus es","culta est","cultus est","cultae sumus","culti sumus","cultae estis","culti estis","cultae sunt","culti sunt","coluerim","colueris","coluerit","coluerimus","colueritis","coluerint","culta sim","cultus sim","culta sis","cultus sis","culta sit","cultus sit","cultae simus","culti simus","cultae sitis","culti sitis","cultae sint","culti sint","credidi","credidisti","credidit","credidimus","credidistis","crediderunt","credita sum","creditus sum","credita es","creditus es","credita est","creditus est","creditae sumus","crediti sumus","creditae estis","crediti estis","creditae sunt","crediti sunt","crediderim","credideris","crediderit","crediderimus","credideritis","crediderint","credita sim","creditus sim","credita sis","creditus sis","credita sit","creditus sit","creditae simus","crediti simus","creditae sitis","crediti sitis","creditae sint","crediti sint","dixi","dixisti","dixit","diximus","dixistis","dixerunt","dicta sum","dictus sum","dicta es","dictus es","dicta est","dictus est","dictae sumus","dicti sumus","dictae estis","dicti estis","dictae sunt","dicti sunt","dixerim","dixeris","dixerit","dixerimus","dixeritis","dixerint","dicta sim","dictus sim","dicta sis","dictus sis","dicta sit","dictus sit","dictae simus","dicti simus","dictae sitis","dicti sitis","dictae sint","dicti sint","duxi","duxisti","duxit","duximus","duxistis","duxerunt","ducta sum","ductus sum","ducta es","ductus es","ducta est","ductus est","ductae sumus","ducti sumus","ductae estis","ducti estis","ductae sunt","ducti sunt","duxerim","duxeris","duxerit","duxerimus","duxeritis","duxerint","ducta sim","ductus sim","ducta sis","ductus sis","ducta sit","ductus sit","ductae simus","ducti simus","ductae sitis","ducti sitis","ductae sint","ducti sint","gessi","gessisti","gessit","gessimus","gessistis","gesserunt","gesta sum","gestus sum","gesta es","gestus es","gesta est","gestus est","gestae sumus","gesti sumus","gestae estis","gesti estis","gestae sunt","gesti sunt","gesserim","gesseris","gesserit","gesserimus","gesseritis","gesserint","gesta sim","gestus sim","gesta sis","gestus sis","gesta sit","gestus sit","gestae simus","gesti simus","gestae sitis","gesti sitis","gestae sint","gesti sint","intellexi","intellexisti","intellexit","intelleximus","intellexistis","intellexerunt","intellecta sum","intellectus sum","intellecta es","intellectus es","intellecta est","intellectus est","intellectae sumus","intellecti sumus","intellectae estis","intellecti estis","intellectae sunt","intellecti sunt","intellexerim","intellexeris","intellexerit","intellexerimus","intellexeritis","intellexerint","intellecta sim","intellectus sim","intellecta sis","intellectus sis","intellecta sit","intellectus sit","intellectae simus","intellecti simus","intellectae sitis","intellecti sitis","intellectae sint","intellecti sint","legi","legisti","legit","legimus","legistis","legerunt","lecta sum","lectus sum","lecta es","lectus es","lecta est","lectus est","lectae sumus","lecti sumus","lectae estis","lecti estis","lectae sunt","lecti sunt","legerim","legeris","legerit","legerimus","legeritis","legerint","lecta sim","lectus sim","lecta sis","lectus sis","lecta sit","lectus sit","lectae simus","lecti simus","lectae sitis","lecti sitis","lectae sint","lecti sint","locuta sum","locutus sum","locuta es","locutus es","locuta est","locutus est","locutae sumus","locuti sumus","locutae estis","locuti estis","locutae sunt","locuti sunt","locuta sim","locutus sim","locuta sis","locutus sis","locuta sit","locutus sit","locutae simus","locuti simus","locutae sitis","locuti sitis","locutae sint","locuti sint","misi","misisti","misit","misimus","misistis","miserunt","missa sum","missus sum","missa es","missus es","missa est","missus est","missae sumus","missi sumus","missae estis","missi estis","missae sunt","missi sunt","miserim","miseris","miserit","miserimus","miseritis","miserint","missa sim","missus sim","missa sis","missus sis","missa sit","missus sit","missae simus","missi simus","missae sitis","missi sitis","missae sint","missi sint","nata sum","natus sum","nata es","natus es","nata est","natus est","natae sumus","nati sumus","natae estis","nati estis","natae sunt","nati sunt","nata sim","natus sim","nata sis","natus sis","nata sit","natus sit","natae simus","nati simus","natae sitis","nati sitis","natae sint","nati sint","occidi","occidisti","occidit","occidimus","occidistis","occiderunt","occisa sum","occisus sum","occisa es","occisus es","occisa est","occisus est","occisae sumus","occisi sumus","occisae estis","occisi estis","occisae sunt","occisi sunt","occiderim","occideris","occiderit","occiderimus","occideritis","occiderint","occisa sim","occisus sim","occisa sis","occisus sis","occisa sit","occisus sit","occisae simus","occisi simus","occisae sitis","occisi sitis","occisae sint","occisi sint","pepuli","pepulisti","pepulit","pepulimus","pepulistis","pepulerunt","pulsa sum","pulsus sum","pulsa es","pulsus es","pulsa est","pulsus est","pulsae sumus","pulsi sumus","pulsae estis","pulsi estis","pulsae sunt","pulsi sunt","pepulerim","pepuleris","pepulerit","pepulerimus","pepuleritis","pepulerint","pulsa sim","pulsus sim","pulsa sis","pulsus sis","pulsa sit","pulsus sit","pulsae simus","pulsi simus","pulsae sitis","pulsi sitis","pulsae sint","pulsi sint","petiui","petii","petiuisti","petiisti","petiuit","petiit","petiuimus","petiimus","petiuistis","petiistis","petiuerunt","petierunt","petita sum","petitus sum","petita es","petitus es","petita est","petitus est","petitae sumus","petiti sumus","petitae estis","petiti estis","petitae sunt","petiti sunt","petiuerim","petierim","petiueris","petieris","petiuerit","petierit","petiuerimus","petierimus","petiueritis","petieritis","petiuerint","petierint","petita sim","petitus sim","petita sis","petitus sis","petita sit","petitus sit","petitae simus","petiti simus","petitae sitis","petiti sitis","petitae sint","petiti sint","profecta sum","profectus sum","profecta es","profectus es","profecta est","profectus est","profectae sumus","profecti sumus","profectae estis","profecti estis","profectae sunt","profecti sunt","profecta sim","profectus sim","profecta sis","profectus sis","profecta sit","profectus sit","profectae simus","profecti simus","profectae sitis","profecti sitis","profectae sint","profecti sint","reliqui","reliquisti","reliquit","reliquimus","reliquistis","reliquerunt","relicta sum","relictus sum","relicta es","relictus es","relicta est","relictus est","relictae sumus","relicti sumus","relictae estis","relicti estis","relictae sunt","relicti sunt","reliquerim","reliqueris","reliquerit","reliquerimus","reliqueritis","reliquerint","relicta sim","relictus sim","relicta sis","relictus sis","relicta sit","relictus sit","relictae simus","relicti simus","relictae sitis","relicti sitis","relictae sint","relicti sint","scripsi","scripsisti","scripsit","scripsimus","scripsistis","scripserunt","scripta sum","scriptus sum","scripta es","scriptus es","scripta est","scriptus est","scriptae sumus","scripti sumus","scriptae estis","scripti estis","scriptae sunt","scripti sunt","scripserim","scripseris","scripserit","scripserimus","scripseritis","scripserint","scripta sim","scriptus sim","scripta sis","scriptus sis","scripta sit","scriptus sit","scriptae simus","scripti simus","scriptae sitis","scripti sitis","scriptae sint","scripti sint","secuta sum","secutus sum","secuta es","secutus es","secuta est","secutus est","secutae sumus","secuti sumus","secutae estis","secuti estis","secutae sunt","secuti sunt","secuta sim","secutus sim","secuta sis","secutus sis","secuta sit","secutus sit","secutae simus","secuti simus","secutae sitis","secuti sitis","secutae sint","secuti sint","statui","statuisti","statuit","statuimus","statuistis","statuerunt","statuta sum","statutus sum","statuta es","statutus es","statuta est","statutus est","statutae sumus","statuti sumus","statutae estis","statuti estis","statutae sunt","statuti sunt","statuerim","statueris","statuerit","statuerimus","statueritis","statuerint","statuta sim","statutus sim","statuta sis","statutus sis","statuta sit","statutus sit","statutae simus","statuti simus","statutae sitis","statuti sitis","statutae sint","statuti sint","tradidi","tradidisti","tradidit","tradidimus","tradidistis","tradiderunt","tradita sum","traditus sum","tradita es","traditus es","tradita est","traditus est","traditae sumus","traditi sumus","traditae estis","traditi estis","traditae sunt","traditi sunt","tradiderim","tradideris","tradiderit","tradiderimus","tradideritis","tradiderint","tradita sim","traditus sim","tradita sis","traditus sis","tradita sit","traditus sit","traditae simus","traditi simus","traditae sitis","traditi sitis","traditae sint","traditi sint","uici","uicisti","uicit","uicimus","uicistis","uicerunt","uicta sum","uictus sum","uicta es","uictus es","uicta est","uictus est","uictae sumus","uicti sumus","uictae estis","uicti estis","uictae sunt","uicti sunt","uicerim","uiceris","uicerit","uicerimus","uiceritis","uicerint","uicta sim","uictus sim","uicta sis","uictus sis","uicta sit","uictus sit","uictae simus","uicti simus","uictae sitis","uicti sitis","uictae sint","uicti sint","uixi","uixisti","uixit","uiximus","uixistis","uixerunt","uicta sum","uictus sum","uicta es","uictus es","uicta est","uictus est","uictae sumus","uicti sumus","uictae estis","uicti estis","uictae sunt","uicti sunt","uixerim","uixeris","uixerit","uixerimus","uixeritis","uixerint","uicta sim","uictus sim","uicta sis","uictus sis","uicta sit","uictus sit","uictae simus","uicti simus","uictae sitis","uicti sitis","uictae sint","uicti sint","usa sum","usus sum","usa es","usus es","usa est","usus est","usae sumus","usi sumus","usae estis","usi estis","usae sunt","usi sunt","usa sim","usus sim","usa sis","usus sis","usa sit","usus sit","usae simus","usi simus","usae sitis","usi sitis","usae sint","usi sint"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,12,12,12,12,12,12,12,12,12,12,12,12,22,22,22,22,22,22,12,12,12,12,12,12,12,12,12,12,12,12,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,15,15,15,15,15,15,15,15,15,15,15,15,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,14,14,14,14,14,14,14,14,14,14,14,14,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,3,0,3,0,3,0,3,0,3,0,3,1,1,1,1,1,1,1,1,1,1,1,1,0,3,0,3,0,3,0,3,0,3,0,3,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["agere","cognoscere","colere","credere","dicere","ducere","gerere","intellegere","legere","mittere","occidere","pellere","petere","relinquere","scribere","statuere","tradere","uincere","uiuere"],"group":[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3]},"tables":{"gender":[null],"mood":["indicatif"],"voice":["actif","passif"],"tense":["futur","futur antérieur","présent"],"translation":[["faire","accomplir","pousser"],["apprendre à connaître","connaître"],["cultiver","honorer","habiter"],["croire"],["dire"],["conduire","considérer comme"],["faire","accomplir"],["comprendre"],["lire","cueillir","choisir"],["envoyer"],["tuer","tomber"],["demander"],["pousser","chasser"],["laisser","tomber"],["écrire"],["décider","déterminer"],["transmettre","raconter"],["vaincre"],["vivre"]],"primitive tenses":["o, is, ere, egi, actum","o, is, ere, gnoui, gnitum","o, is, ere, colui, cultum","o, is, ere, didi, ditum","o, is, ere, dixi, dictum","o, is, ere, duxi, ductum","o, is, ere, uidi, uisum","o, is, ere, gessi, gestum","o, is, ere, legi, lectum","o, is, ere, misi, missum","o, is, ere, cidi, cisum","o, is, ere, pepuli, pulsum","o, is, ere, i(u)i, itum","o, is, ere, liqui, lictum","o, is, ere, scripsi, scriptum","o, is, ere, ui, utum","o, is, ere, uici, uictum","o, is, ere, uixi, uictum"],"flx":["GP3_INF","GP3_PER","GP3_PER_SYN"]},"forms":{"latin":["egeris","egerit","egerimus","egeritis","egerint","cognoueris","cognouerit","cognouerimus","cognoueritis","cognouerint","colueris","coluerit","coluerimus","colueritis","coluerint","credideris","crediderit","crediderimus","credideritis","crediderint","dixeris","dixerit","dixerimus","dixeritis","dixerint","duxeris","duxerit","duxerimus","duxeritis","duxerint","gesseris","gesserit","gesserimus","gesseritis","gesserint","intellexeris","intellexerit","intellexerimus","intellexeritis","intellexerint","legeris","legerit","legerimus","legeritis","legerint","legit","legimus","legeris","legeris","miseris","miserit","miserimus","miseritis","miserint","occideris","occiderit","occiderimus","occideritis","occiderint","occidit","occidimus","occideris","occideris","pepuleris","pepulerit","pepulerimus","pepuleritis","pepulerint","petiueris","petieris","petiuerit","petierit","petiuerimus","petierimus","petiueritis","petieritis","petiuerint","petierint","reliqueris","reliquerit","reliquerimus","reliqueritis","reliquerint","scripseris","scripserit","scripserimus","scripseritis","scripserint","statueris","statuerit","statuerimus","statueritis","statuerint","statuit","statuimus","statueris","statueris","tradideris","tradiderit","tradiderimus","tradideritis","tradiderint","uiceris","uicerit","uicerimus","uiceritis","uicerint","uixeris","uixerit","uixerimus","uixeritis","uixerint"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,0,2,1,1,1,1,1,1,1,1,1,1,2,2,0,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,0,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"lemma":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,10,10,10,10,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,14,14,14,14,14,15,15,15,15,15,15,15,15,15,16,16,16,16,16,17,17,17,17,17,18,18,18,18,18],"translation":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,10,10,10,10,12,12,12,12,12,11,11,11,11,11,11,11,11,11,11,13,13,13,13,13,14,14,14,14,14,15,15,15,15,15,15,15,15,15,16,16,16,16,16,17,17,17,17,17,18,18,18,18,18],"primitive tenses":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7,8,8,8,8,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,10,10,10,10,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,14,14,14,14,14,15,15,15,15,15,15,15,15,15,3,3,3,3,3,16,16,16,16,16,17,17,17,17,17],"flx":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,1,1,1,1,1,1,1,1,1,1,0,0,0,0,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"person":[2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,3,4,2,2,2,3,4,5,6,2,3,4,5,6,3,4,2,2,2,3,4,5,6,2,2,3,3,4,4,5,5,6,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,3,4,2,2,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6],"irrégulier":[48,62,96]}}};
@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g4-futur-anterieur.js"] = {"lemmas":{"lemma":["accipere","capere","cupere","efficere","facere","incipere","interficere","mori","pati","rapere"],"group":[4,4,4,4,4,4,4,4,4,4]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur antérieur"],"translation":[["recevoir","accueillir"],["prendre"],["désirer"],["faire en sorte"],["faire"],["commencer"],["tuer"],["mourir"],["souffrir","supporter"],["arracher","ravir"]],"primitive tenses":["io, is, ere, cepi, ceptum","io, is, ere, cepi, captum","io, is, ere, i(u)i, itum","io, is, ere, iui, itum","io, is, ere, faci, fectum","io, is, ere, feci, factum","io, is, ere, feci, fectum","ior, eris, mori, mortuus sum","ior, eris, pati, passus sum","io, is, ere, rapui, raptum"],"flx":["GP4_PER","GP4_SUP","GP4_PER_SYN","GP4_DEP_SUP"]},"forms":{"latin":["accepero","acceperis","acceperit","acceperimus","acceperitis","acceperint","accepta ero","acceptus ero","accepta eris","acceptus eris","accepta erit","acceptus erit","acceptae erimus","accepti erimus","acceptae eritis","accepti eritis","acceptae erunt","accepti erunt","cepero","ceperis","ceperit","ceperimus","ceperitis","ceperint","capta ero","captus ero","capta eris","captus eris","capta erit","captus erit","captae erimus","capti erimus","captae eritis","capti eritis","captae erunt","capti erunt","cupiuero","cupiero","cupiueris","cupieris","cupiuerit","cupierit","cupiuerimus","cupierimus","cupiueritis","cupieritis","cupiuerint","cupierint","cupita ero","cupitus ero","cupita eris","cupitus eris","cupita erit","cupitus erit","cupitae erimus","cupiti erimus","cupitae eritis","cupiti eritis","cupitae erunt","cupiti erunt","effecero","effeceris","effecerit","effecerimus","effeceritis","effecerint","effecta ero","effectus ero","effecta eris","effectus eris","effecta erit","effectus erit","effectae erimus","effecti erimus","effectae eritis","effecti eritis","effectae erunt","effecti erunt","fecero","feceris","fecerit","fecerimus","feceritis","fecerint","facta ero","factus ero","facta eris","factus eris","facta erit","factus erit","factae erimus","facti erimus","factae eritis","facti eritis","factae erunt","facti erunt","incepero","inceperis","inceperit","inceperimus","inceperitis","inceperint","incepta ero","inceptus ero","incepta eris","inceptus eris","incepta erit","inceptus erit","inceptae erimus","incepti erimus","inceptae eritis","incepti eritis","inceptae erunt","incepti erunt","interfecero","interfeceris","interfecerit","interfecerimus","interfeceritis","interfecerint","interfecta ero","interfectus ero","interfecta eris","interfectus eris","interfecta erit","interfectus erit","interfectae erimus","interfecti erimus","interfectae eritis","interfecti eritis","interfectae erunt","interfecti erunt","mortua ero","mortuus ero","mortua eris","mortuus eris","mortua erit","mortuus erit","mortuae erimus","mortui erimus","mortuae eritis","mortui eritis","mortuae erunt","mortui erunt","passa ero","passus ero","passa eris","passus eris","passa erit","passus erit","passae erimus","passi erimus","passae eritis","passi eritis","passae erunt","passi erunt","rapuero","rapueris","rapuerit","rapuerimus","rapueritis","rapuerint","rapta ero","raptus ero","rapta eris","raptus eris","rapta erit","raptus erit","raptae erimus","rapti erimus","raptae eritis","rapti eritis","raptae erunt","rapti erunt"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,2,0,2,0,2,0,2,0,2,0,2,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["accipere","capere","cupere","efficere","facere","incipere","interficere","rapere"],"group":[4,4,4,4,4,4,4,4]},"tables":{"gender":[null],"mood":["indicatif","subjonctif"],"voice":["actif","passif"],"tense":["futur","parfait"],"translation":[["recevoir","accueillir"],["prendre"],["désirer"],["faire en sorte"],["faire"],["commencer"],["tuer"],["arracher","ravir"]],"primitive tenses":["io, is, ere, cepi, ceptum","io, is, ere, cepi, captum","io, is, ere, i, itum","io, is, ere, i(u)i, itum","io, is, ere, faci, fectum","io, is, ere, feci, factum","io, is, ere, feci, fectum","io, is, ere, rapui, raptum"],"flx":["GP4_INF","GP4_PER","GP4_PER_SYN"]},"forms":{"latin":["acceperis","acceperit","acceperimus","acceperitis","acceperint","ceperis","ceperit","ceperimus","ceperitis","ceperint","cupieris","cupiueris","cupieris","cupiuerit","cupierit","cupiuerimus","cupierimus","cupiueritis","cupieritis","cupiuerint","cupierint","effeceris","effecerit","effecerimus","effeceritis","effecerint","feceris","fecerit","fecerimus","feceritis","fecerint","inceperis","inceperit","inceperimus","inceperitis","inceperint","interfeceris","interfecerit","interfecerimus","interfeceritis","interfecerint","rapueris","rapuerit","rapuerimus","rapueritis","rapuerint"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"voice":[0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"lemma":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7],"translation":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7],"primitive tenses":[0,0,0,0,0,1,1,1,1,1,2,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,0,0,0,0,0,6,6,6,6,6,7,7,7,7,7],"flx":[1,1,1,1,1,1,1,1,1,1,0,1,2,1,2,1,2,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"person":[2,3,4,5,6,2,3,4,5,6,2,2,2,3,3,4,4,5,5,6,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6],"irrégulier":[]}}};
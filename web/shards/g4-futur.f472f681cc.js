@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g4-futur.js"] = {"lemmas":{"lemma":["accipere","capere","cupere","efficere","facere","incipere","interficere","mori","pati","rapere"],"group":[4,4,4,4,4,4,4,4,4,4]},"tables":{"gender":[null],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur"],"translation":[["recevoir","accueillir"],["prendre"],["désirer"],["faire en sorte"],["faire"],["commencer"],["tuer"],["mourir"],["souffrir","supporter"],["arracher","ravir"]],"primitive tenses":["io, is, ere, cepi, ceptum","io, is, ere, cepi, captum","io, is, ere, i, itum","io, is, ere, faci, fectum","io, is, ere, feci, factum","io, is, ere, feci, fectum","ior, eris, mori, mortuus sum","ior, eris, pati, passus sum","io, is, ere, rapui, raptum"],"flx":["GP4_INF","GP4_DEP_INF"]},"forms":{"latin":["accipiam","accipies","accipiet","accipiemus","accipietis","accipient","accipiar","accipieris","accipietur","accipiemur","accipiemini","accipientur","capiam","capies","capiet","capiemus","capietis","capient","capiar","capieris","capietur","capiemur","capiemini","capientur","cupiam","cupies","cupiet","cupiemus","cupietis","cupient","cupiar","cupieris","cupietur","cupiemur","cupiemini","cupientur","efficiam","efficies","efficiet","efficiemus","efficietis","efficient","efficiar","efficieris","efficietur","efficiemur","efficiemini","efficientur","faciam","facies","faciet","faciemus","facietis","facient","faciar","facieris","facietur","faciemur","faciemini","facientur","incipiam","incipies","incipiet","incipiemus","incipietis","incipient","incipiar","incipieris","incipietur","incipiemur","incipiemini","incipientur","interficiam","interficies","interficiet","interficiemus","interficietis","interficient","interficiar","interficieris","interficietur","interficiemur","interficiemini","interficientur","moriar","morieris","morietur","moriemur","moriemini","morientur","patiar","patieris","patietur","patiemur","patiemini","patientur","rapiam","rapies","rapiet","rapiemus","rapietis","rapient","rapiar","rapieris","rapietur","rapiemur","rapiemini","rapientur"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,0,0,0,0,0,0,0,0,0,0,0,0,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0],"person":[1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["accipere","capere","cupere","efficere","facere","incipere","interficere","mori","pati","rapere"],"group":[4,4,4,4,4,4,4,4,4,4]},"tables":{"gender":[null],"mood":["indicatif","subjonctif"],"voice":["actif","passif","déponent"],"tense":["futur antérieur","parfait","présent"],"translation":[["recevoir","accueillir"],["prendre"],["désirer"],["faire en sorte"],["faire"],["commencer"],["tuer"],["mourir"],["souffrir","supporter"],["arracher","ravir"]],"primitive tenses":["io, is, ere, cepi, ceptum","io, is, ere, cepi, captum","io, is, ere, i, itum","io, is, ere, i(u)i, itum","io, is, ere, faci, fectum","io, is, ere, feci, factum","io, is, ere, feci, fectum","ior, eris, mori, mortuus sum","ior, eris, pati, passus sum","io, is, ere, rapui, raptum"],"flx":["GP4_INF","GP4_PER_SYN","GP4_DEP_INF"]},"forms":{"latin":["accipiam","accipiar","capiam","capiar","cupieris","cupieris","cupiam","cupiar","efficiam","efficiar","faciam","faciar","incipiam","incipiar","interficiam","interficiar","moriar","patiar","rapiam","rapiar"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"voice":[0,1,0,1,0,0,0,1,0,1,0,1,0,1,0,1,2,2,0,1],"tense":[2,2,2,2,0,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2],"lemma":[0,0,1,1,2,2,2,2,3,3,4,4,5,5,6,6,7,8,9,9],"translation":[0,0,1,1,2,2,2,2,3,3,4,4,5,5,6,6,7,8,9,9],"primitive tenses":[0,0,1,1,3,3,2,2,4,4,5,5,0,0,6,6,7,8,9,9],"flx":[0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,2,2,0,0],"person":[1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"irrégulier":[]}}};
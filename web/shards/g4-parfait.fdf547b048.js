@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g4-parfait.js"] = {"lemmas":{"lemma":["accipere","capere","cupere","efficere","facere","incipere","interficere","mori","pati","rapere"],"group":[4,4,4,4,4,4,4,4,4,4]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif","subjonctif"],"voice":["actif","passif","déponent"],"tense":["parfait"],"translation":[["recevoir","accueillir"],["prendre"],["désirer"],["faire en sorte"],["faire"],["commencer"],["tuer"],["mourir"],["souffrir","supporter"],["arracher","ravir"]],"primitive tenses":["io, is, ere, cepi, ceptum","io, is, ere, cepi, captum","io, is, ere, i(u)i, itum","io, is, ere, iui, itum","io, is, ere, faci, fectum","io, is, ere, feci, factum","io, is, ere, feci, fectum","ior, eris, mori, mortuus sum","ior, eris, pati, passus sum","io, is, ere, rapui, raptum"],"flx":["GP4_PER","GP4_SUP","GP4_PER_SYN","GP4_DEP_SUP"]},"forms":{"latin":["accepi","accepisti","accepit","accepimus","accepistis","acceperunt","accepta sum","acceptus sum","accepta es","acceptus es","accepta est","acceptus est","acceptae sumus","accepti sumus","acceptae estis","accepti estis","acceptae sunt","accepti sunt","acceperim","acceperis","acceperit","acceperimus","acceperitis","acceperint","accepta sim","acceptus sim","accepta sis","acceptus sis","accepta sit","acceptus sit","acceptae simus","accepti simus","acceptae sitis","accepti sitis","acceptae sint","accepti sint","cepi","cepisti","cepit","cepimus","cepistis","ceperunt","capta sum","captus sum","capta es","captus es","capta est","captus est","captae sumus","capti sumus","captae estis","capti estis","captae sunt","capti sunt","ceperim","ceperis","ceperit","ceperimus","ceperitis","ceperint","capta sim","captus sim","capta sis","captus sis","capta sit","captus sit","captae simus","capti simus","captae sitis","capti sitis","captae sint","capti sint","cupiui","cupii","cupiuisti","cupiisti","cupiuit","cupiit","cupiuimus","cupiimus","cupiuistis","cupiistis","cupiuerunt","cupierunt","cupita sum","cupitus sum","cupita es","cupitus es","cupita est","cupitus est","cupitae sumus","cupiti sumus","cupitae estis","cupiti estis","cupitae sunt","cupiti sunt","cupiuerim","cupierim","cupiueris","cupieris","cupiuerit","cupierit","cupiuerimus","cupierimus","cupiueritis","cupieritis","cupiuerint","cupierint","cupita sim","cupitus sim","cupita sis","cupitus sis","cupita sit","cupitus sit","cupitae simus","cupiti simus","cupitae sitis","cupiti sitis","cupitae sint","cupiti sint","effeci","effecisti","effecit","effecimus","effecistis","effecerunt","effecta sum","effectus sum","effecta es","effectus es","effecta est","effectus est","effectae sumus","effecti sumus","effectae estis","effecti estis","effectae sunt","effecti sunt","effecerim","effeceris","effecerit","effecerimus","effeceritis","effecerint","effecta sim","effectus sim","effecta sis","effectus sis","effecta sit","effectus sit","effectae simus","effecti simus","effectae sitis","effecti sitis","effectae sint","effecti sint","feci","fecisti","fecit","fecimus","fecistis","fecerunt","facta sum","factus sum","facta es","factus es","facta est","factus est","factae sumus","facti sumus","factae estis","facti estis","factae sunt","facti sunt","fecerim","feceris","fecerit","fecerimus","feceritis","fecerint","facta sim","factus sim","facta sis","factus sis","facta sit","factus sit","factae simus","facti simus","factae sitis","facti sitis","factae sint","facti sint","incepi","incepisti","incepit","incepimus","incepistis","inceperunt","incepta sum","inceptus sum","incepta es","inceptus es","incepta est","inceptus est","inceptae sumus","incepti sumus","inceptae estis","incepti estis","inceptae sunt","incepti sunt","inceperim","inceperis","inceperit","inceperimus","inceperitis","inceperint","incepta sim","inceptus sim","incepta sis","inceptus sis","incepta sit","inceptus sit","inceptae simus","incepti simus","inceptae sitis","incepti sitis","inceptae sint","incepti sint","interfeci","interfecisti","interfecit","interfecimus","interfecistis","interfecerunt","interfecta sum","interfectus sum","interfecta es","interfectus es","interfecta est","interfectus est","interfectae sumus","interfecti sumus","interfectae estis","interfecti estis","interfectae sunt","interfecti sunt","interfecerim","interfeceris","interfecerit","interfecerimus","interfeceritis","interfecerint","interfecta sim","interfectus sim","interfecta sis","interfectus sis","interfecta sit","interfectus sit","interfectae simus","interfecti simus","interfectae sitis","interfecti sitis","interfectae sint","interfecti sint","mortua sum","mortuus sum","mortua es","mortuus es","mortua est","mortuus est","mortuae sumus","mortui sumus","mortuae estis","mortui estis","mortuae sunt","mortui sunt","mortua sim","mortuus sim","mortua sis","mortuus sis","mortua sit","mortuus sit","mortuae simus","mortui simus","mortuae sitis","mortui sitis","mortuae sint","mortui sint","passa sum","passus sum","passa es","passus es","passa est","passus est","passae sumus","passi sumus","passae estis","passi estis","passae sunt","passi sunt","passa sim","passus sim","passa sis","passus sis","passa sit","passus sit","passae simus","passi simus","passae sitis","passi sitis","passae sint","passi sint","rapui","rapuisti","rapuit","rapuimus","rapuistis","rapuerunt","rapta sum","raptus sum","rapta es","raptus es","rapta est","raptus est","raptae sumus","rapti sumus","raptae estis","rapti estis","raptae sunt","rapti sunt","rapuerim","rapueris","rapuerit","rapuerimus","rapueritis","rapuerint","rapta sim","raptus sim","rapta sis","raptus sis","rapta sit","raptus sit","raptae simus","rapti simus","raptae sitis","rapti sitis","raptae sint","rapti sint"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,2,0,2,0,2,0,2,0,2,0,2,1,1,1,1,1,1,1,1,1,1,1,1,0,2,0,2,0,2,0,2,0,2,0,2,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["accipere","capere","cupere","efficere","facere","incipere","interficere","rapere"],"group":[4,4,4,4,4,4,4,4]},"tables":{"gender":[null],"mood":["indicatif"],"voice":["actif","passif"],"tense":["futur","futur antérieur"],"translation":[["recevoir","accueillir"],["prendre"],["désirer"],["faire en sorte"],["faire"],["commencer"],["tuer"],["arracher","ravir"]],"primitive tenses":["io, is, ere, cepi, ceptum","io, is, ere, cepi, captum","io, is, ere, i, itum","io, is, ere, i(u)i, itum","io, is, ere, faci, fectum","io, is, ere, feci, factum","io, is, ere, feci, fectum","io, is, ere, rapui, raptum"],"flx":["GP4_INF","GP4_PER","GP4_PER_SYN"]},"forms":{"latin":["acceperis","acceperit","acceperimus","acceperitis","acceperint","ceperis","ceperit","ceperimus","ceperitis","ceperint","cupiueris","cupieris","cupiuerit","cupierit","cupiuerimus","cupierimus","cupiueritis","cupieritis","cupiuerint","cupierint","cupieris","effeceris","effecerit","effecerimus","effeceritis","effecerint","feceris","fecerit","fecerimus","feceritis","fecerint","inceperis","inceperit","inceperimus","inceperitis","inceperint","interfeceris","interfecerit","interfecerimus","interfeceritis","interfecerint","rapueris","rapuerit","rapuerimus","rapueritis","rapuerint"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"lemma":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7],"translation":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,5,5,5,5,5,6,6,6,6,6,7,7,7,7,7],"primitive tenses":[0,0,0,0,0,1,1,1,1,1,3,3,3,3,3,3,3,3,3,3,2,4,4,4,4,4,5,5,5,5,5,0,0,0,0,0,6,6,6,6,6,7,7,7,7,7],"flx":[1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"person":[2,3,4,5,6,2,3,4,5,6,2,2,3,3,4,4,5,5,6,6,2,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6],"irrégulier":[]}}};
@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g5-futur-anterieur.js"] = {"lemmas":{"lemma":["audire","experiri","inuenire","oriri","scire","sentire","uenire"],"group":[5,5,5,5,5,5,5]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur antérieur"],"translation":[["écouter","entendre"],["faire l'expérience de"],["trouver"],["naître","se lever"],["savoir"],["percevoir","se rendre compte","juger"],["venir"]],"primitive tenses":["io, is, ire, iui, itum","ior, iris, iri, pertus sum","io, is, ire, ueni, uentum","ior, iris, iri, ortus sum","io, is, ire, sensi, sensum"],"flx":["GP5_PER","GP5_SUP","GP5_DEP_SUP"]},"forms":{"latin":["audiuero","audiueris","audiuerit","audiuerimus","audiueritis","audiuerint","audita ero","auditus ero","audita eris","auditus eris","audita erit","auditus erit","auditae erimus","auditi erimus","auditae eritis","auditi eritis","auditae erunt","auditi erunt","experta ero","expertus ero","experta eris","expertus eris","experta erit","expertus erit","expertae erimus","experti erimus","expertae eritis","experti eritis","expertae erunt","experti erunt","inuenero","inueneris","inuenerit","inuenerimus","inueneritis","inuenerint","inuenta ero","inuentus ero","inuenta eris","inuentus eris","inuenta erit","inuentus erit","inuentae erimus","inuenti erimus","inuentae eritis","inuenti eritis","inuentae erunt","inuenti erunt","orta ero","ortus ero","orta eris","ortus eris","orta erit","ortus erit","ortae erimus","orti erimus","ortae eritis","orti eritis","ortae erunt","orti erunt","sciuero","sciueris","sciuerit","sciuerimus","sciueritis","sciuerint","scita ero","scitus ero","scita eris","scitus eris","scita erit","scitus erit","scitae erimus","sciti erimus","scitae eritis","sciti eritis","scitae erunt","sciti erunt","sensero","senseris","senserit","senserimus","senseritis","senserint","sensa ero","sensus ero","sensa eris","sensus eris","sensa erit","sensus erit","sensae erimus","sensi erimus","sensae eritis","sensi eritis","sensae erunt","sensi erunt","uenero","ueneris","uenerit","uenerimus","ueneritis","uenerint","uenta ero","uentus ero","uenta eris","uentus eris","uenta erit","uentus erit","uentae erimus","uenti erimus","uentae eritis","uenti eritis","uentae erunt","uenti erunt"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["audire","inuenire","scire","sentire","uenire"],"group":[5,5,5,5,5]},"tables":{"gender":[null],"mood":["subjonctif"],"voice":["actif"],"tense":["parfait"],"translation":[["écouter","entendre"],["trouver"],["savoir"],["percevoir","se rendre compte","juger"],["venir"]],"primitive tenses":["io, is, ire, iui, itum","io, is, ire, ueni, uentum","io, is, ire, sensi, sensum"],"flx":["GP5_PER"]},"forms":{"latin":["audiueris","audiuerit","audiuerimus","audiueritis","audiuerint","inueneris","inuenerit","inuenerimus","inueneritis","inuenerint","sciueris","sciuerit","sciuerimus","sciueritis","sciuerint","senseris","senserit","senserimus","senseritis","senserint","ueneris","uenerit","uenerimus","ueneritis","uenerint"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4],"translation":[0,0,0,0,0,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4],"primitive tenses":[0,0,0,0,0,1,1,1,1,1,0,0,0,0,0,2,2,2,2,2,1,1,1,1,1],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"person":[2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6,2,3,4,5,6],"irrégulier":[]}}};
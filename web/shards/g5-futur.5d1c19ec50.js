@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g5-futur.js"] = {"lemmas":{"lemma":["audire","experiri","inuenire","oriri","scire","sentire","uenire"],"group":[5,5,5,5,5,5,5]},"tables":{"gender":[null],"mood":["indicatif"],"voice":["actif","passif","déponent"],"tense":["futur"],"translation":[["écouter","entendre"],["faire l'expérience de"],["trouver"],["naître","se lever"],["savoir"],["percevoir","se rendre compte","juger"],["venir"]],"primitive tenses":["io, is, ire, iui, itum","ior, iris, iri, pertus sum","io, is, ire, ueni, uentum","ior, iris, iri, ortus sum","io, is, ire, sensi, sensum"],"flx":["GP5_INF","GP5_DEP_INF"]},"forms":{"latin":["audiam","audies","audiet","audiemus","audietis","audient","audiar","audieris","audietur","audiemur","audiemini","audientur","experiar","experieris","experietur","experiemur","experiemini","experientur","inueniam","inuenies","inueniet","inueniemus","inuenietis","inuenient","inueniar","inuenieris","inuenietur","inueniemur","inueniemini","inuenientur","oriar","orieris","orietur","oriemur","oriemini","orientur","sciam","scies","sciet","sciemus","scietis","scient","sciar","scieris","scietur","sciemur","sciemini","scientur","sentiam","senties","sentiet","sentiemus","sentietis","sentient","sentiar","sentieris","sentietur","sentiemur","sentiemini","sentientur","ueniam","uenies","ueniet","ueniemus","uenietis","uenient","ueniar","uenieris","uenietur","ueniemur","ueniemini","uenientur"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,0,0,0,0,0,0,0,0,0,0,0,0,4,4,4,4,4,4,4,4,4,4,4,4,2,2,2,2,2,2,2,2,2,2,2,2],"flx":[0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"person":[1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6,1,2,3,4,5,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["audire","experiri","inuenire","oriri","scire","sentire","uenire"],"group":[5,5,5,5,5,5,5]},"tables":{"gender":[null],"mood":["subjonctif"],"voice":["actif","passif","déponent"],"tense":["présent"],"translation":[["écouter","entendre"],["faire l'expérience de"],["trouver"],["naître","se lever"],["savoir"],["percevoir","se rendre compte","juger"],["venir"]],"primitive tenses":["io, is, ire, iui, itum","ior, iris, iri, pertus sum","io, is, ire, ueni, uentum","ior, iris, iri, ortus sum","io, is, ire, sensi, sensum"],"flx":["GP5_INF","GP5_DEP_INF"]},"forms":{"latin":["audiam","audiar","experiar","inueniam","inueniar","oriar","sciam","sciar","sentiam","sentiar","ueniam","ueniar"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,0,0,0,0,0,0,0],"voice":[0,1,2,0,1,2,0,1,0,1,0,1],"tense":[0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,1,2,2,3,4,4,5,5,6,6],"translation":[0,0,1,2,2,3,4,4,5,5,6,6],"primitive tenses":[0,0,1,2,2,3,0,0,4,4,2,2],"flx":[0,0,1,0,0,1,0,0,0,0,0,0],"person":[1,1,1,1,1,1,1,1,1,1,1,1],"irrégulier":[]}}};
@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS.loaded["g5-parfait.js"] = {"lemmas":{"lemma":["audire","experiri","inuenire","oriri","scire","sentire","uenire"],"group":[5,5,5,5,5,5,5]},"tables":{"gender":[null,"féminin","masculin"],"mood":["indicatif","subjonctif"],"voice":["actif","passif","déponent"],"tense":["parfait"],"translation":[["écouter","entendre"],["faire l'expérience de"],["trouver"],["naître","se lever"],["savoir"],["percevoir","se rendre compte","juger"],["venir"]],"primitive tenses":["io, is, ire, iui, itum","ior, iris, iri, pertus sum","io, is, ire, ueni, uentum","ior, iris, iri, ortus sum","io, is, ire, sensi, sensum"],"flx":["GP5_PER","GP5_SUP","GP5_DEP_SUP"]},"forms":{"latin":["audiui","audiuisti","audiuit","audiuimus","audiuistis","audiuerunt","audita sum","auditus sum","audita es","auditus es","audita est","auditus est","auditae sumus","auditi sumus","auditae estis","auditi estis","auditae sunt","auditi sunt","audiuerim","audiueris","audiuerit","audiuerimus","audiueritis","audiuerint","audita sim","auditus sim","audita sis","auditus sis","audita sit","auditus sit","auditae simus","auditi simus","auditae sitis","auditi sitis","auditae sint","auditi sint","experta sum","expertus sum","experta es","expertus es","experta est","expertus est","expertae sumus","experti sumus","expertae estis","experti estis","expertae sunt","experti sunt","experta sim","expertus sim","experta sis","expertus sis","experta sit","expertus sit","expertae simus","experti simus","expertae sitis","experti sitis","expertae sint","experti sint","inueni","inuenisti","inuenit","inuenimus","inuenistis","inuenerunt","inuenta sum","inuentus sum","inuenta es","inuentus es","inuenta est","inuentus est","inuentae sumus","inuenti sumus","inuentae estis","inuenti estis","inuentae sunt","inuenti sunt","inuenerim","inueneris","inuenerit","inuenerimus","inueneritis","inuenerint","inuenta sim","inuentus sim","inuenta sis","inuentus sis","inuenta sit","inuentus sit","inuentae simus","inuenti simus","inuentae sitis","inuenti sitis","inuentae sint","inuenti sint","orta sum","ortus sum","orta es","ortus es","orta est","ortus est","ortae sumus","orti sumus","ortae estis","orti estis","ortae sunt","orti sunt","orta sim","ortus sim","orta sis","ortus sis","orta sit","ortus sit","ortae simus","orti simus","ortae sitis","orti sitis","ortae sint","orti sint","sciui","sciuisti","sciuit","sciuimus","sciuistis","sciuerunt","scita sum","scitus sum","scita es","scitus es","scita est","scitus est","scitae sumus","sciti sumus","scitae estis","sciti estis","scitae sunt","sciti sunt","sciuerim","sciueris","sciuerit","sciuerimus","sciueritis","sciuerint","scita sim","scitus sim","scita sis","scitus sis","scita sit","scitus sit","scitae simus","sciti simus","scitae sitis","sciti sitis","scitae sint","sciti sint","sensi","sensisti","sensit","sensimus","sensistis","senserunt","sensa sum","sensus sum","sensa es","sensus es","sensa est","sensus est","sensae sumus","sensi sumus","sensae estis","sensi estis","sensae sunt","sensi sunt","senserim","senseris","senserit","senserimus","senseritis","senserint","sensa sim","sensus sim","sensa sis","sensus sis","sensa sit","sensus sit","sensae simus","sensi simus","sensae sitis","sensi sitis","sensae sint","sensi sint","ueni","uenisti","uenit","uenimus","uenistis","uenerunt","uenta sum","uentus sum","uenta es","uentus es","uenta est","uentus est","uentae sumus","uenti sumus","uentae estis","uenti estis","uentae sunt","uenti sunt","uenerim","ueneris","uenerit","uenerimus","ueneritis","uenerint","uenta sim","uentus sim","uenta sis","uentus sis","uenta sit","uentus sit","uentae simus","uenti simus","uentae sitis","uenti sitis","uentae sint","uenti sint"],"gender":[0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2,0,0,0,0,0,0,1,2,1,2,1,2,1,2,1,2,1,2],"mood":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"voice":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"tense":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"lemma":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6],"translation":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6],"primitive tenses":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2],"flx":[0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1],"person":[1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6,1,2,3,4,5,6,1,1,2,2,3,3,4,4,5,5,6,6],"irrégulier":[]},"syncretic":{"lemmas":{"lemma":["audire","inuenire","scire","sentire","uenire"],"group":[5,5,5,5,5]},"tables":{"gender":[null],"mood":["indicatif","impératif"],"voice":["actif"],"tense":["futur antérieur","présent"],"translation":[["écouter","entendre"],["trouver"],["savoir"],["percevoir","se rendre compte","juger"],["venir"]],"primitive tenses":["io, is, ire, iui, itum","io, is, ire, ueni, uentum","io, is, ire, sensi, sensum"],"flx":["GP5_INF","GP5_PER"]},"forms":{"latin":["audiueris","audiuerit","audiuerimus","audiueritis","audiuerint","inueni","inueneris","inuenerit","inuenerimus","inueneritis","inuenerint","inuenit","inuenimus","sciueris","sciuerit","sciuerimus","sciueritis","sciuerint","senseris","senserit","senserimus","senseritis","senserint","ueni","ueneris","uenerit","uenerimus","ueneritis","uenerint","uenit","uenimus"],"gender":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"mood":[0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0],"voice":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"tense":[0,0,0,0,0,1,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,1],"lemma":[0,0,0,0,0,1,1,1,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,4,4,4],"translation":[0,0,0,0,0,1,1,1,1,1,1,1,1,2,2,2,2,2,3,3,3,3,3,4,4,4,4,4,4,4,4],"primitive tenses":[0,0,0,0,0,1,1,1,1,1,1,1,1,0,0,0,0,0,2,2,2,2,2,1,1,1,1,1,1,1,1],"flx":[1,1,1,1,1,0,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,0,0],"person":[2,3,4,5,6,2,2,3,4,5,6,3,4,2,3,4,5,6,2,3,4,5,6,2,2,3,4,5,6,3,4],"irrégulier":[]}}};
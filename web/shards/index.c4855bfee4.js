@@ -0,0 +1 @@
+window.VERBS_LATIN_SHARDS = {"count": 10798, "tenses": ["futur", "futur antérieur", "imparfait", "parfait", "plus-que-parfait", "présent"], "groups": [0, 1, 2, 3, 4, 5], "shards": [{"file": "g0-futur.js", "group": 0, "tense": "futur", "count": 30, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5}}, {"file": "g0-futur-anterieur.js", "group": 0, "tense": "futur antérieur", "count": 30, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5}}, {"file": "g0-imparfait.js", "group": 0, "tense": "imparfait", "count": 60, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5, "subjonctif|actif|1": 5, "subjonctif|actif|2": 5, "subjonctif|actif|3": 5, "subjonctif|actif|4": 5, "subjonctif|actif|5": 5, "subjonctif|actif|6": 5}}, {"file": "g0-parfait.js", "group": 0, "tense": "parfait", "count": 30, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5}}, {"file": "g0-plus-que-parfait.js", "group": 0, "tense": "plus-que-parfait", "count": 60, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5, "subjonctif|actif|1": 5, "subjonctif|actif|2": 5, "subjonctif|actif|3": 5, "subjonctif|actif|4": 5, "subjonctif|actif|5": 5, "subjonctif|actif|6": 5}}, {"file": "g0-present.js", "group": 0, "tense": "présent", "count": 60, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5, "subjonctif|actif|1": 5, "subjonctif|actif|2": 5, "subjonctif|actif|3": 5, "subjonctif|actif|4": 5, "subjonctif|actif|5": 5, "subjonctif|actif|6": 5}}, {"file": "g1-futur.js", "group": 1, "tense": "futur", "count": 210, "counts": {"indicatif|actif|1": 16, "indicatif|actif|2": 16, "indicatif|actif|3": 16, "indicatif|actif|4": 16, "indicatif|actif|5": 16, "indicatif|actif|6": 16, "indicatif|passif|1": 16, "indicatif|passif|2": 16, "indicatif|passif|3": 16, "indicatif|passif|4": 16, "indicatif|passif|5": 16, "indicatif|passif|6": 16, "indicatif|déponent|1": 3, "indicatif|déponent|2": 3, "indicatif|déponent|3": 3, "indicatif|déponent|4": 3, "indicatif|déponent|5": 3, "indicatif|déponent|6": 3}}, {"file": "g1-futur-anterieur.js", "group": 1, "tense": "futur antérieur", "count": 324, "counts": {"indicatif|actif|1": 16, "indicatif|actif|2": 16, "indicatif|actif|3": 16, "indicatif|actif|4": 16, "indicatif|actif|5": 16, "indicatif|actif|6": 16, "indicatif|passif|1": 32, "indicatif|passif|2": 32, "indicatif|passif|3": 32, "indicatif|passif|4": 32, "indicatif|passif|5": 32, "indicatif|passif|6": 32, "indicatif|déponent|1": 6, "indicatif|déponent|2": 6, "indicatif|déponent|3": 6, "indicatif|déponent|4": 6, "indicatif|déponent|5": 6, "indicatif|déponent|6": 6}}, {"file": "g1-imparfait.js", "group": 1, "tense": "imparfait", "count": 420, "counts": {"indicatif|actif|1": 16, "indicatif|actif|2": 16, "indicatif|actif|3": 16, "indicatif|actif|4": 16, "indicatif|actif|5": 16, "indicatif|actif|6": 16, "indicatif|passif|1": 16, "indicatif|passif|2": 16, "indicatif|passif|3": 16, "indicatif|passif|4": 16, "indicatif|passif|5": 16, "indicatif|passif|6": 16, "subjonctif|actif|1": 16, "subjonctif|actif|2": 16, "subjonctif|actif|3": 16, "subjonctif|actif|4": 16, "subjonctif|actif|5": 16, "subjonctif|actif|6": 16, "subjonctif|passif|1": 16, "subjonctif|passif|2": 16, "subjonctif|passif|3": 16, "subjonctif|passif|4": 16, "subjonctif|passif|5": 16, "subjonctif|passif|6": 16, "indicatif|déponent|1": 3, "indicatif|déponent|2": 3, "indicatif|déponent|3": 3, "indicatif|déponent|4": 3, "indicatif|déponent|5": 3, "indicatif|déponent|6": 3, "subjonctif|déponent|1": 3, "subjonctif|déponent|2": 3, "subjonctif|déponent|3": 3, "subjonctif|déponent|4": 3, "subjonctif|déponent|5": 3, "subjonctif|déponent|6": 3}}, {"file": "g1-parfait.js", "group": 1, "tense": "parfait", "count": 648, "counts": {"indicatif|actif|1": 16, "indicatif|actif|2": 16, "indicatif|actif|3": 16, "indicatif|actif|4": 16, "indicatif|actif|5": 16, "indicatif|actif|6": 16, "indicatif|passif|1": 32, "indicatif|passif|2": 32, "indicatif|passif|3": 32, "indicatif|passif|4": 32, "indicatif|passif|5": 32, "indicatif|passif|6": 32, "subjonctif|actif|1": 16, "subjonctif|actif|2": 16, "subjonctif|actif|3": 16, "subjonctif|actif|4": 16, "subjonctif|actif|5": 16, "subjonctif|actif|6": 16, "subjonctif|passif|1": 32, "subjonctif|passif|2": 32, "subjonctif|passif|3": 32, "subjonctif|passif|4": 32, "subjonctif|passif|5": 32, "subjonctif|passif|6": 32, "indicatif|déponent|1": 6, "indicatif|déponent|2": 6, "indicatif|déponent|3": 6, "indicatif|déponent|4": 6, "indicatif|déponent|5": 6, "indicatif|déponent|6": 6, "subjonctif|déponent|1": 6, "subjonctif|déponent|2": 6, "subjonctif|déponent|3": 6, "subjonctif|déponent|4": 6, "subjonctif|déponent|5": 6, "subjonctif|déponent|6": 6}}, {"file": "g1-plus-que-parfait.js", "group": 1, "tense": "plus-que-parfait", "count": 648, "counts": {"indicatif|actif|1": 16, "indicatif|actif|2": 16, "indicatif|actif|3": 16, "indicatif|actif|4": 16, "indicatif|actif|5": 16, "indicatif|actif|6": 16, "indicatif|passif|1": 32, "indicatif|passif|2": 32, "indicatif|passif|3": 32, "indicatif|passif|4": 32, "indicatif|passif|5": 32, "indicatif|passif|6": 32, "subjonctif|actif|1": 16, "subjonctif|actif|2": 16, "subjonctif|actif|3": 16, "subjonctif|actif|4": 16, "subjonctif|actif|5": 16, "subjonctif|actif|6": 16, "subjonctif|passif|1": 32, "subjonctif|passif|2": 32, "subjonctif|passif|3": 32, "subjonctif|passif|4": 32, "subjonctif|passif|5": 32, "subjonctif|passif|6": 32, "indicatif|déponent|1": 6, "indicatif|déponent|2": 6, "indicatif|déponent|3": 6, "indicatif|déponent|4": 6, "indicatif|déponent|5": 6, "indicatif|déponent|6": 6, "subjonctif|déponent|1": 6, "subjonctif|déponent|2": 6, "subjonctif|déponent|3": 6, "subjonctif|déponent|4": 6, "subjonctif|déponent|5": 6, "subjonctif|déponent|6": 6}}, {"file": "g1-present.js", "group": 1, "tense": "présent", "count": 490, "counts": {"impératif|actif|2": 16, "impératif|actif|5": 16, "impératif|passif|2": 16, "impératif|passif|5": 16, "indicatif|actif|1": 16, "indicatif|actif|2": 16, "indicatif|actif|3": 16, "indicatif|actif|4": 16, "indicatif|actif|5": 16, "indicatif|actif|6": 16, "indicatif|passif|1": 16, "indicatif|passif|2": 16, "indicatif|passif|3": 16, "indicatif|passif|4": 16, "indicatif|passif|5": 16, "indicatif|passif|6": 16, "subjonctif|actif|1": 16, "subjonctif|actif|2": 16, "subjonctif|actif|3": 16, "subjonctif|actif|4": 16, "subjonctif|actif|5": 16, "subjonctif|actif|6": 16, "subjonctif|passif|1": 16, "subjonctif|passif|2": 16, "subjonctif|passif|3": 16, "subjonctif|passif|4": 16, "subjonctif|passif|5": 16, "subjonctif|passif|6": 16, "impératif|déponent|2": 3, "impératif|déponent|5": 3, "indicatif|déponent|1": 3, "indicatif|déponent|2": 3, "indicatif|déponent|3": 3, "indicatif|déponent|4": 3, "indicatif|déponent|5": 3, "indicatif|déponent|6": 3, "subjonctif|déponent|1": 3, "subjonctif|déponent|2": 3, "subjonctif|déponent|3": 3, "subjonctif|déponent|4": 3, "subjonctif|déponent|5": 3, "subjonctif|déponent|6": 3}}, {"file": "g2-futur.js", "group": 2, "tense": "futur", "count": 156, "counts": {"indicatif|actif|1": 12, "indicatif|actif|2": 12, "indicatif|actif|3": 12, "indicatif|actif|4": 12, "indicatif|actif|5": 12, "indicatif|actif|6": 12, "indicatif|passif|1": 12, "indicatif|passif|2": 12, "indicatif|passif|3": 12, "indicatif|passif|4": 12, "indicatif|passif|5": 12, "indicatif|passif|6": 12, "indicatif|déponent|1": 2, "indicatif|déponent|2": 2, "indicatif|déponent|3": 2, "indicatif|déponent|4": 2, "indicatif|déponent|5": 2, "indicatif|déponent|6": 2}}, {"file": "g2-futur-anterieur.js", "group": 2, "tense": "futur antérieur", "count": 228, "counts": {"indicatif|actif|1": 12, "indicatif|actif|2": 12, "indicatif|actif|3": 12, "indicatif|actif|4": 12, "indicatif|actif|5": 12, "indicatif|actif|6": 12, "indicatif|passif|1": 22, "indicatif|passif|2": 22, "indicatif|passif|3": 22, "indicatif|passif|4": 22, "indicatif|passif|5": 22, "indicatif|passif|6": 22, "indicatif|déponent|1": 4, "indicatif|déponent|2": 4, "indicatif|déponent|3": 4, "indicatif|déponent|4": 4, "indicatif|déponent|5": 4, "indicatif|déponent|6": 4}}, {"file": "g2-imparfait.js", "group": 2, "tense": "imparfait", "count": 312, "counts": {"indicatif|actif|1": 12, "indicatif|actif|2": 12, "indicatif|actif|3": 12, "indicatif|actif|4": 12, "indicatif|actif|5": 12, "indicatif|actif|6": 12, "indicatif|passif|1": 12, "indicatif|passif|2": 12, "indicatif|passif|3": 12, "indicatif|passif|4": 12, "indicatif|passif|5": 12, "indicatif|passif|6": 12, "subjonctif|actif|1": 12, "subjonctif|actif|2": 12, "subjonctif|actif|3": 12, "subjonctif|actif|4": 12, "subjonctif|actif|5": 12, "subjonctif|actif|6": 12, "subjonctif|passif|1": 12, "subjonctif|passif|2": 12, "subjonctif|passif|3": 12, "subjonctif|passif|4": 12, "subjonctif|passif|5": 12, "subjonctif|passif|6": 12, "indicatif|déponent|1": 2, "indicatif|déponent|2": 2, "indicatif|déponent|3": 2, "indicatif|déponent|4": 2, "indicatif|déponent|5": 2, "indicatif|déponent|6": 2, "subjonctif|déponent|1": 2, "subjonctif|déponent|2": 2, "subjonctif|déponent|3": 2, "subjonctif|déponent|4": 2, "subjonctif|déponent|5": 2, "subjonctif|déponent|6": 2}}, {"file": "g2-parfait.js", "group": 2, "tense": "parfait", "count": 456, "counts": {"indicatif|actif|1": 12, "indicatif|actif|2": 12, "indicatif|actif|3": 12, "indicatif|actif|4": 12, "indicatif|actif|5": 12, "indicatif|actif|6": 12, "indicatif|passif|1": 22, "indicatif|passif|2": 22, "indicatif|passif|3": 22, "indicatif|passif|4": 22, "indicatif|passif|5": 22, "indicatif|passif|6": 22, "subjonctif|actif|1": 12, "subjonctif|actif|2": 12, "subjonctif|actif|3": 12, "subjonctif|actif|4": 12, "subjonctif|actif|5": 12, "subjonctif|actif|6": 12, "subjonctif|passif|1": 22, "subjonctif|passif|2": 22, "subjonctif|passif|3": 22, "subjonctif|passif|4": 22, "subjonctif|passif|5": 22, "subjonctif|passif|6": 22, "indicatif|déponent|1": 4, "indicatif|déponent|2": 4, "indicatif|déponent|3": 4, "indicatif|déponent|4": 4, "indicatif|déponent|5": 4, "indicatif|déponent|6": 4, "subjonctif|déponent|1": 4, "subjonctif|déponent|2": 4, "subjonctif|déponent|3": 4, "subjonctif|déponent|4": 4, "subjonctif|déponent|5": 4, "subjonctif|déponent|6": 4}}, {"file": "g2-plus-que-parfait.js", "group": 2, "tense": "plus-que-parfait", "count": 456, "counts": {"indicatif|actif|1": 12, "indicatif|actif|2": 12, "indicatif|actif|3": 12, "indicatif|actif|4": 12, "indicatif|actif|5": 12, "indicatif|actif|6": 12, "indicatif|passif|1": 22, "indicatif|passif|2": 22, "indicatif|passif|3": 22, "indicatif|passif|4": 22, "indicatif|passif|5": 22, "indicatif|passif|6": 22, "subjonctif|actif|1": 12, "subjonctif|actif|2": 12, "subjonctif|actif|3": 12, "subjonctif|actif|4": 12, "subjonctif|actif|5": 12, "subjonctif|actif|6": 12, "subjonctif|passif|1": 22, "subjonctif|passif|2": 22, "subjonctif|passif|3": 22, "subjonctif|passif|4": 22, "subjonctif|passif|5": 22, "subjonctif|passif|6": 22, "indicatif|déponent|1": 4, "indicatif|déponent|2": 4, "indicatif|déponent|3": 4, "indicatif|déponent|4": 4, "indicatif|déponent|5": 4, "indicatif|déponent|6": 4, "subjonctif|déponent|1": 4, "subjonctif|déponent|2": 4, "subjonctif|déponent|3": 4, "subjonctif|déponent|4": 4, "subjonctif|déponent|5": 4, "subjonctif|déponent|6": 4}}, {"file": "g2-present.js", "group": 2, "tense": "présent", "count": 364, "counts": {"impératif|actif|2": 12, "impératif|actif|5": 12, "impératif|passif|2": 12, "impératif|passif|5": 12, "indicatif|actif|1": 12, "indicatif|actif|2": 12, "indicatif|actif|3": 12, "indicatif|actif|4": 12, "indicatif|actif|5": 12, "indicatif|actif|6": 12, "indicatif|passif|1": 12, "indicatif|passif|2": 12, "indicatif|passif|3": 12, "indicatif|passif|4": 12, "indicatif|passif|5": 12, "indicatif|passif|6": 12, "subjonctif|actif|1": 12, "subjonctif|actif|2": 12, "subjonctif|actif|3": 12, "subjonctif|actif|4": 12, "subjonctif|actif|5": 12, "subjonctif|actif|6": 12, "subjonctif|passif|1": 12, "subjonctif|passif|2": 12, "subjonctif|passif|3": 12, "subjonctif|passif|4": 12, "subjonctif|passif|5": 12, "subjonctif|passif|6": 12, "impératif|déponent|2": 2, "impératif|déponent|5": 2, "indicatif|déponent|1": 2, "indicatif|déponent|2": 2, "indicatif|déponent|3": 2, "indicatif|déponent|4": 2, "indicatif|déponent|5": 2, "indicatif|déponent|6": 2, "subjonctif|déponent|1": 2, "subjonctif|déponent|2": 2, "subjonctif|déponent|3": 2, "subjonctif|déponent|4": 2, "subjonctif|déponent|5": 2, "subjonctif|déponent|6": 2}}, {"file": "g3-futur.js", "group": 3, "tense": "futur", "count": 258, "counts": {"indicatif|actif|1": 19, "indicatif|actif|2": 19, "indicatif|actif|3": 19, "indicatif|actif|4": 19, "indicatif|actif|5": 19, "indicatif|actif|6": 19, "indicatif|passif|1": 19, "indicatif|passif|2": 19, "indicatif|passif|3": 19, "indicatif|passif|4": 19, "indicatif|passif|5": 19, "indicatif|passif|6": 19, "indicatif|déponent|1": 5, "indicatif|déponent|2": 5, "indicatif|déponent|3": 5, "indicatif|déponent|4": 5, "indicatif|déponent|5": 5, "indicatif|déponent|6": 5}}, {"file": "g3-futur-anterieur.js", "group": 3, "tense": "futur antérieur", "count": 408, "counts": {"indicatif|actif|1": 20, "indicatif|actif|2": 20, "indicatif|actif|3": 20, "indicatif|actif|4": 20, "indicatif|actif|5": 20, "indicatif|actif|6": 20, "indicatif|passif|1": 38, "indicatif|passif|2": 38, "indicatif|passif|3": 38, "indicatif|passif|4": 38, "indicatif|passif|5": 38, "indicatif|passif|6": 38, "indicatif|déponent|1": 10, "indicatif|déponent|2": 10, "indicatif|déponent|3": 10, "indicatif|déponent|4": 10, "indicatif|déponent|5": 10, "indicatif|déponent|6": 10}}, {"file": "g3-imparfait.js", "group": 3, "tense": "imparfait", "count": 516, "counts": {"indicatif|actif|1": 19, "indicatif|actif|2": 19, "indicatif|actif|3": 19, "indicatif|actif|4": 19, "indicatif|actif|5": 19, "indicatif|actif|6": 19, "indicatif|passif|1": 19, "indicatif|passif|2": 19, "indicatif|passif|3": 19, "indicatif|passif|4": 19, "indicatif|passif|5": 19, "indicatif|passif|6": 19, "subjonctif|actif|1": 19, "subjonctif|actif|2": 19, "subjonctif|actif|3": 19, "subjonctif|actif|4": 19, "subjonctif|actif|5": 19, "subjonctif|actif|6": 19, "subjonctif|passif|1": 19, "subjonctif|passif|2": 19, "subjonctif|passif|3": 19, "subjonctif|passif|4": 19, "subjonctif|passif|5": 19, "subjonctif|passif|6": 19, "indicatif|déponent|1": 5, "indicatif|déponent|2": 5, "indicatif|déponent|3": 5, "indicatif|déponent|4": 5, "indicatif|déponent|5": 5, "indicatif|déponent|6": 5, "subjonctif|déponent|1": 5, "subjonctif|déponent|2": 5, "subjonctif|déponent|3": 5, "subjonctif|déponent|4": 5, "subjonctif|déponent|5": 5, "subjonctif|déponent|6": 5}}, {"file": "g3-parfait.js", "group": 3, "tense": "parfait", "count": 816, "counts": {"indicatif|actif|1": 20, "indicatif|actif|2": 20, "indicatif|actif|3": 20, "indicatif|actif|4": 20, "indicatif|actif|5": 20, "indicatif|actif|6": 20, "indicatif|passif|1": 38, "indicatif|passif|2": 38, "indicatif|passif|3": 38, "indicatif|passif|4": 38, "indicatif|passif|5": 38, "indicatif|passif|6": 38, "subjonctif|actif|1": 20, "subjonctif|actif|2": 20, "subjonctif|actif|3": 20, "subjonctif|actif|4": 20, "subjonctif|actif|5": 20, "subjonctif|actif|6": 20, "subjonctif|passif|1": 38, "subjonctif|passif|2": 38, "subjonctif|passif|3": 38, "subjonctif|passif|4": 38, "subjonctif|passif|5": 38, "subjonctif|passif|6": 38, "indicatif|déponent|1": 10, "indicatif|déponent|2": 10, "indicatif|déponent|3": 10, "indicatif|déponent|4": 10, "indicatif|déponent|5": 10, "indicatif|déponent|6": 10, "subjonctif|déponent|1": 10, "subjonctif|déponent|2": 10, "subjonctif|déponent|3": 10, "subjonctif|déponent|4": 10, "subjonctif|déponent|5": 10, "subjonctif|déponent|6": 10}}, {"file": "g3-plus-que-parfait.js", "group": 3, "tense": "plus-que-parfait", "count": 816, "counts": {"indicatif|actif|1": 20, "indicatif|actif|2": 20, "indicatif|actif|3": 20, "indicatif|actif|4": 20, "indicatif|actif|5": 20, "indicatif|actif|6": 20, "indicatif|passif|1": 38, "indicatif|passif|2": 38, "indicatif|passif|3": 38, "indicatif|passif|4": 38, "indicatif|passif|5": 38, "indicatif|passif|6": 38, "subjonctif|actif|1": 20, "subjonctif|actif|2": 20, "subjonctif|actif|3": 20, "subjonctif|actif|4": 20, "subjonctif|actif|5": 20, "subjonctif|actif|6": 20, "subjonctif|passif|1": 38, "subjonctif|passif|2": 38, "subjonctif|passif|3": 38, "subjonctif|passif|4": 38, "subjonctif|passif|5": 38, "subjonctif|passif|6": 38, "indicatif|déponent|1": 10, "indicatif|déponent|2": 10, "indicatif|déponent|3": 10, "indicatif|déponent|4": 10, "indicatif|déponent|5": 10, "indicatif|déponent|6": 10, "subjonctif|déponent|1": 10, "subjonctif|déponent|2": 10, "subjonctif|déponent|3": 10, "subjonctif|déponent|4": 10, "subjonctif|déponent|5": 10, "subjonctif|déponent|6": 10}}, {"file": "g3-present.js", "group": 3, "tense": "présent", "count": 602, "counts": {"impératif|actif|2": 19, "impératif|actif|5": 19, "impératif|passif|2": 19, "impératif|passif|5": 19, "indicatif|actif|1": 19, "indicatif|actif|2": 19, "indicatif|actif|3": 19, "indicatif|actif|4": 19, "indicatif|actif|5": 19, "indicatif|actif|6": 19, "indicatif|passif|1": 19, "indicatif|passif|2": 19, "indicatif|passif|3": 19, "indicatif|passif|4": 19, "indicatif|passif|5": 19, "indicatif|passif|6": 19, "subjonctif|actif|1": 19, "subjonctif|actif|2": 19, "subjonctif|actif|3": 19, "subjonctif|actif|4": 19, "subjonctif|actif|5": 19, "subjonctif|actif|6": 19, "subjonctif|passif|1": 19, "subjonctif|passif|2": 19, "subjonctif|passif|3": 19, "subjonctif|passif|4": 19, "subjonctif|passif|5": 19, "subjonctif|passif|6": 19, "impératif|déponent|2": 5, "impératif|déponent|5": 5, "indicatif|déponent|1": 5, "indicatif|déponent|2": 5, "indicatif|déponent|3": 5, "indicatif|déponent|4": 5, "indicatif|déponent|5": 5, "indicatif|déponent|6": 5, "subjonctif|déponent|1": 5, "subjonctif|déponent|2": 5, "subjonctif|déponent|3": 5, "subjonctif|déponent|4": 5, "subjonctif|déponent|5": 5, "subjonctif|déponent|6": 5}}, {"file": "g4-futur.js", "group": 4, "tense": "futur", "count": 108, "counts": {"indicatif|actif|1": 8, "indicatif|actif|2": 8, "indicatif|actif|3": 8, "indicatif|actif|4": 8, "indicatif|actif|5": 8, "indicatif|actif|6": 8, "indicatif|passif|1": 8, "indicatif|passif|2": 8, "indicatif|passif|3": 8, "indicatif|passif|4": 8, "indicatif|passif|5": 8, "indicatif|passif|6": 8, "indicatif|déponent|1": 2, "indicatif|déponent|2": 2, "indicatif|déponent|3": 2, "indicatif|déponent|4": 2, "indicatif|déponent|5": 2, "indicatif|déponent|6": 2}}, {"file": "g4-futur-anterieur.js", "group": 4, "tense": "futur antérieur", "count": 174, "counts": {"indicatif|actif|1": 9, "indicatif|actif|2": 9, "indicatif|actif|3": 9, "indicatif|actif|4": 9, "indicatif|actif|5": 9, "indicatif|actif|6": 9, "indicatif|passif|1": 16, "indicatif|passif|2": 16, "indicatif|passif|3": 16, "indicatif|passif|4": 16, "indicatif|passif|5": 16, "indicatif|passif|6": 16, "indicatif|déponent|1": 4, "indicatif|déponent|2": 4, "indicatif|déponent|3": 4, "indicatif|déponent|4": 4, "indicatif|déponent|5": 4, "indicatif|déponent|6": 4}}, {"file": "g4-imparfait.js", "group": 4, "tense": "imparfait", "count": 216, "counts": {"indicatif|actif|1": 8, "indicatif|actif|2": 8, "indicatif|actif|3": 8, "indicatif|actif|4": 8, "indicatif|actif|5": 8, "indicatif|actif|6": 8, "indicatif|passif|1": 8, "indicatif|passif|2": 8, "indicatif|passif|3": 8, "indicatif|passif|4": 8, "indicatif|passif|5": 8, "indicatif|passif|6": 8, "subjonctif|actif|1": 8, "subjonctif|actif|2": 8, "subjonctif|actif|3": 8, "subjonctif|actif|4": 8, "subjonctif|actif|5": 8, "subjonctif|actif|6": 8, "subjonctif|passif|1": 8, "subjonctif|passif|2": 8, "subjonctif|passif|3": 8, "subjonctif|passif|4": 8, "subjonctif|passif|5": 8, "subjonctif|passif|6": 8, "indicatif|déponent|1": 2, "indicatif|déponent|2": 2, "indicatif|déponent|3": 2, "indicatif|déponent|4": 2, "indicatif|déponent|5": 2, "indicatif|déponent|6": 2, "subjonctif|déponent|1": 2, "subjonctif|déponent|2": 2, "subjonctif|déponent|3": 2, "subjonctif|déponent|4": 2, "subjonctif|déponent|5": 2, "subjonctif|déponent|6": 2}}, {"file": "g4-parfait.js", "group": 4, "tense": "parfait", "count": 348, "counts": {"indicatif|actif|1": 9, "indicatif|actif|2": 9, "indicatif|actif|3": 9, "indicatif|actif|4": 9, "indicatif|actif|5": 9, "indicatif|actif|6": 9, "indicatif|passif|1": 16, "indicatif|passif|2": 16, "indicatif|passif|3": 16, "indicatif|passif|4": 16, "indicatif|passif|5": 16, "indicatif|passif|6": 16, "subjonctif|actif|1": 9, "subjonctif|actif|2": 9, "subjonctif|actif|3": 9, "subjonctif|actif|4": 9, "subjonctif|actif|5": 9, "subjonctif|actif|6": 9, "subjonctif|passif|1": 16, "subjonctif|passif|2": 16, "subjonctif|passif|3": 16, "subjonctif|passif|4": 16, "subjonctif|passif|5": 16, "subjonctif|passif|6": 16, "indicatif|déponent|1": 4, "indicatif|déponent|2": 4, "indicatif|déponent|3": 4, "indicatif|déponent|4": 4, "indicatif|déponent|5": 4, "indicatif|déponent|6": 4, "subjonctif|déponent|1": 4, "subjonctif|déponent|2": 4, "subjonctif|déponent|3": 4, "subjonctif|déponent|4": 4, "subjonctif|déponent|5": 4, "subjonctif|déponent|6": 4}}, {"file": "g4-plus-que-parfait.js", "group": 4, "tense": "plus-que-parfait", "count": 348, "counts": {"indicatif|actif|1": 9, "indicatif|actif|2": 9, "indicatif|actif|3": 9, "indicatif|actif|4": 9, "indicatif|actif|5": 9, "indicatif|actif|6": 9, "indicatif|passif|1": 16, "indicatif|passif|2": 16, "indicatif|passif|3": 16, "indicatif|passif|4": 16, "indicatif|passif|5": 16, "indicatif|passif|6": 16, "subjonctif|actif|1": 9, "subjonctif|actif|2": 9, "subjonctif|actif|3": 9, "subjonctif|actif|4": 9, "subjonctif|actif|5": 9, "subjonctif|actif|6": 9, "subjonctif|passif|1": 16, "subjonctif|passif|2": 16, "subjonctif|passif|3": 16, "subjonctif|passif|4": 16, "subjonctif|passif|5": 16, "subjonctif|passif|6": 16, "indicatif|déponent|1": 4, "indicatif|déponent|2": 4, "indicatif|déponent|3": 4, "indicatif|déponent|4": 4, "indicatif|déponent|5": 4, "indicatif|déponent|6": 4, "subjonctif|déponent|1": 4, "subjonctif|déponent|2": 4, "subjonctif|déponent|3": 4, "subjonctif|déponent|4": 4, "subjonctif|déponent|5": 4, "subjonctif|déponent|6": 4}}, {"file": "g4-present.js", "group": 4, "tense": "présent", "count": 252, "counts": {"impératif|actif|2": 8, "impératif|actif|5": 8, "impératif|passif|2": 8, "impératif|passif|5": 8, "indicatif|actif|1": 8, "indicatif|actif|2": 8, "indicatif|actif|3": 8, "indicatif|actif|4": 8, "indicatif|actif|5": 8, "indicatif|actif|6": 8, "indicatif|passif|1": 8, "indicatif|passif|2": 8, "indicatif|passif|3": 8, "indicatif|passif|4": 8, "indicatif|passif|5": 8, "indicatif|passif|6": 8, "subjonctif|actif|1": 8, "subjonctif|actif|2": 8, "subjonctif|actif|3": 8, "subjonctif|actif|4": 8, "subjonctif|actif|5": 8, "subjonctif|actif|6": 8, "subjonctif|passif|1": 8, "subjonctif|passif|2": 8, "subjonctif|passif|3": 8, "subjonctif|passif|4": 8, "subjonctif|passif|5": 8, "subjonctif|passif|6": 8, "impératif|déponent|2": 2, "impératif|déponent|5": 2, "indicatif|déponent|1": 2, "indicatif|déponent|2": 2, "indicatif|déponent|3": 2, "indicatif|déponent|4": 2, "indicatif|déponent|5": 2, "indicatif|déponent|6": 2, "subjonctif|déponent|1": 2, "subjonctif|déponent|2": 2, "subjonctif|déponent|3": 2, "subjonctif|déponent|4": 2, "subjonctif|déponent|5": 2, "subjonctif|déponent|6": 2}}, {"file": "g5-futur.js", "group": 5, "tense": "futur", "count": 72, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5, "indicatif|passif|1": 5, "indicatif|passif|2": 5, "indicatif|passif|3": 5, "indicatif|passif|4": 5, "indicatif|passif|5": 5, "indicatif|passif|6": 5, "indicatif|déponent|1": 2, "indicatif|déponent|2": 2, "indicatif|déponent|3": 2, "indicatif|déponent|4": 2, "indicatif|déponent|5": 2, "indicatif|déponent|6": 2}}, {"file": "g5-futur-anterieur.js", "group": 5, "tense": "futur antérieur", "count": 114, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5, "indicatif|passif|1": 10, "indicatif|passif|2": 10, "indicatif|passif|3": 10, "indicatif|passif|4": 10, "indicatif|passif|5": 10, "indicatif|passif|6": 10, "indicatif|déponent|1": 4, "indicatif|déponent|2": 4, "indicatif|déponent|3": 4, "indicatif|déponent|4": 4, "indicatif|déponent|5": 4, "indicatif|déponent|6": 4}}, {"file": "g5-imparfait.js", "group": 5, "tense": "imparfait", "count": 144, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5, "indicatif|passif|1": 5, "indicatif|passif|2": 5, "indicatif|passif|3": 5, "indicatif|passif|4": 5, "indicatif|passif|5": 5, "indicatif|passif|6": 5, "subjonctif|actif|1": 5, "subjonctif|actif|2": 5, "subjonctif|actif|3": 5, "subjonctif|actif|4": 5, "subjonctif|actif|5": 5, "subjonctif|actif|6": 5, "subjonctif|passif|1": 5, "subjonctif|passif|2": 5, "subjonctif|passif|3": 5, "subjonctif|passif|4": 5, "subjonctif|passif|5": 5, "subjonctif|passif|6": 5, "indicatif|déponent|1": 2, "indicatif|déponent|2": 2, "indicatif|déponent|3": 2, "indicatif|déponent|4": 2, "indicatif|déponent|5": 2, "indicatif|déponent|6": 2, "subjonctif|déponent|1": 2, "subjonctif|déponent|2": 2, "subjonctif|déponent|3": 2, "subjonctif|déponent|4": 2, "subjonctif|déponent|5": 2, "subjonctif|déponent|6": 2}}, {"file": "g5-parfait.js", "group": 5, "tense": "parfait", "count": 228, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5, "indicatif|passif|1": 10, "indicatif|passif|2": 10, "indicatif|passif|3": 10, "indicatif|passif|4": 10, "indicatif|passif|5": 10, "indicatif|passif|6": 10, "subjonctif|actif|1": 5, "subjonctif|actif|2": 5, "subjonctif|actif|3": 5, "subjonctif|actif|4": 5, "subjonctif|actif|5": 5, "subjonctif|actif|6": 5, "subjonctif|passif|1": 10, "subjonctif|passif|2": 10, "subjonctif|passif|3": 10, "subjonctif|passif|4": 10, "subjonctif|passif|5": 10, "subjonctif|passif|6": 10, "indicatif|déponent|1": 4, "indicatif|déponent|2": 4, "indicatif|déponent|3": 4, "indicatif|déponent|4": 4, "indicatif|déponent|5": 4, "indicatif|déponent|6": 4, "subjonctif|déponent|1": 4, "subjonctif|déponent|2": 4, "subjonctif|déponent|3": 4, "subjonctif|déponent|4": 4, "subjonctif|déponent|5": 4, "subjonctif|déponent|6": 4}}, {"file": "g5-plus-que-parfait.js", "group": 5, "tense": "plus-que-parfait", "count": 228, "counts": {"indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5, "indicatif|passif|1": 10, "indicatif|passif|2": 10, "indicatif|passif|3": 10, "indicatif|passif|4": 10, "indicatif|passif|5": 10, "indicatif|passif|6": 10, "subjonctif|actif|1": 5, "subjonctif|actif|2": 5, "subjonctif|actif|3": 5, "subjonctif|actif|4": 5, "subjonctif|actif|5": 5, "subjonctif|actif|6": 5, "subjonctif|passif|1": 10, "subjonctif|passif|2": 10, "subjonctif|passif|3": 10, "subjonctif|passif|4": 10, "subjonctif|passif|5": 10, "subjonctif|passif|6": 10, "indicatif|déponent|1": 4, "indicatif|déponent|2": 4, "indicatif|déponent|3": 4, "indicatif|déponent|4": 4, "indicatif|déponent|5": 4, "indicatif|déponent|6": 4, "subjonctif|déponent|1": 4, "subjonctif|déponent|2": 4, "subjonctif|déponent|3": 4, "subjonctif|déponent|4": 4, "subjonctif|déponent|5": 4, "subjonctif|déponent|6": 4}}, {"file": "g5-present.js", "group": 5, "tense": "présent", "count": 168, "counts": {"impératif|actif|2": 5, "impératif|actif|5": 5, "impératif|passif|2": 5, "impératif|passif|5": 5, "indicatif|actif|1": 5, "indicatif|actif|2": 5, "indicatif|actif|3": 5, "indicatif|actif|4": 5, "indicatif|actif|5": 5, "indicatif|actif|6": 5, "indicatif|passif|1": 5, "indicatif|passif|2": 5, "indicatif|passif|3": 5, "indicatif|passif|4": 5, "indicatif|passif|5": 5, "indicatif|passif|6": 5, "subjonctif|actif|1": 5, "subjonctif|actif|2": 5, "subjonctif|actif|3": 5, "subjonctif|actif|4": 5, "subjonctif|actif|5": 5, "subjonctif|actif|6": 5, "subjonctif|passif|1": 5, "subjonctif|passif|2": 5, "subjonctif|passif|3": 5, "subjonctif|passif|4": 5, "subjonctif|passif|5": 5, "subjonctif|passif|6": 5, "impératif|déponent|2": 2, "impératif|déponent|5": 2, "indicatif|déponent|1": 2, "indicatif|déponent|2": 2, "indicatif|déponent|3": 2, "indicatif|déponent|4": 2, "indicatif|déponent|5": 2, "indicatif|déponent|6": 2, "subjonctif|déponent|1": 2, "subjonctif|déponent|2": 2, "subjonctif|déponent|3": 2, "subjonctif|déponent|4": 2, "subjonctif|déponent|5": 2, "subjonctif|déponent|6": 2}}], "loaded": {}};